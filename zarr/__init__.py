@@ -1,8 +1,8 @@
 # flake8: noqa
 from zarr.codecs import *
 from zarr.convenience import (consolidate_metadata, copy, copy_all, copy_store,
-                              load, open, open_consolidated, save, save_array,
-                              save_group, tree)
+                              load, map_blocks, open, open_consolidated, save,
+                              save_array, save_group, tree)
 from zarr.core import Array
 from zarr.creation import (array, create, empty, empty_like, full, full_like,
                            ones, ones_like, open_array, open_like, zeros,
@@ -11,9 +11,9 @@ from zarr.errors import CopyError, MetadataError
 from zarr.hierarchy import Group, group, open_group
 from zarr.n5 import N5Store
 from zarr.storage import (ABSStore, DBMStore, DictStore, DirectoryStore,
-                          LMDBStore, LRUStoreCache, MemoryStore, MongoDBStore,
-                          NestedDirectoryStore, RedisStore, SQLiteStore,
-                          TempStore, ZipStore)
+                          LMDBStore, LRUChunkCache, LRUStoreCache, MemoryStore,
+                          MongoDBStore, NestedDirectoryStore, RedisStore,
+                          ShardedLRUStoreCache, SQLiteStore, TempStore, ZipStore)
 from zarr.sync import ProcessSynchronizer, ThreadSynchronizer
 from zarr.version import version as __version__
 
@@ -1,13 +1,17 @@
 """Convenience functions for storing and loading data."""
 import io
 import itertools
+import os
 import re
 from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
 
 from zarr.core import Array
 from zarr.creation import array as _create_array
 from zarr.creation import normalize_store_arg, open_array
-from zarr.errors import CopyError, PathNotFoundError
+from zarr.errors import CopyError, PathNotFoundError, ReadOnlyError
 from zarr.hierarchy import Group
 from zarr.hierarchy import group as _create_group
 from zarr.hierarchy import open_group
@@ -1180,3 +1184,135 @@ def open_consolidated(store, metadata_key='.zmetadata', mode='r+', **kwargs):
     # pass through
     chunk_store = kwargs.pop('chunk_store', None) or store
     return open(store=meta_store, chunk_store=chunk_store, mode=mode, **kwargs)
+
+
+def _map_block(func, arrays, out, chunk_coords, write):
+    # N.B., this is a module-level function so that blocks can be mapped via any kind
+    # of executor, including those which run calls in other processes
+
+    # obtain the input blocks
+    region = tuple(slice(co * c, (co + 1) * c)
+                   for co, c in zip(chunk_coords, out.chunks))
+    blocks = [next(a.iter_chunks(region))[2] for a in arrays]
+    block_shape = tuple(s.indices(n)[1] - s.start for s, n in zip(region, out.shape))
+
+    # apply the function
+    result = func(*blocks)
+
+    # ensure the result covers the whole chunk, so the chunk can be replaced without
+    # reading it back from the store
+    if not (isinstance(result, np.ndarray) and result.shape == block_shape == out.chunks):
+        if out.fill_value is not None:
+            chunk = np.full(out.chunks, out.fill_value, dtype=out.dtype, order=out.order)
+        elif out.dtype == object:
+            chunk = np.empty(out.chunks, dtype=out.dtype, order=out.order)
+        else:
+            chunk = np.zeros(out.chunks, dtype=out.dtype, order=out.order)
+        try:
+            chunk[tuple(slice(0, n) for n in block_shape)] = result
+        except ValueError:
+            raise ValueError('function returned a block of shape {!r}; expected {!r}'
+                             .format(np.shape(result), block_shape))
+        result = chunk
+
+    if not write:
+        return result
+    out._chunk_setitem(chunk_coords, tuple(slice(0, c) for c in out.chunks), result)
+
+
+def map_blocks(func, *arrays, out, executor=None, max_chunks=None):
+    """Apply a function to each block of one or more arrays, storing the results in
+    an output array with the same chunk grid.
+
+    Parameters
+    ----------
+    func : callable
+        Function which is called with the corresponding block of each input array
+        as a numpy array, and returns an array of the same shape, or any value
+        which can be broadcast to that shape. For chunks at the edge of the
+        arrays, blocks exclude any region beyond the bounds of the arrays. Input
+        blocks may be read-only, so should not be modified in place.
+    *arrays : zarr.core.Array
+        Input arrays, each with the same shape and chunks as `out`.
+    out : zarr.core.Array
+        Output array, into which results are stored.
+    executor : concurrent.futures.Executor, optional
+        Executor used to process blocks concurrently. Defaults to the executor of
+        `out`, if any, otherwise blocks are processed sequentially. If a
+        :class:`concurrent.futures.ProcessPoolExecutor` is provided, `func` and the
+        input arrays must be picklable, and results are stored by the calling
+        process.
+    max_chunks : int, optional
+        Maximum number of blocks being processed at once, which bounds the memory
+        required. Defaults to twice the number of CPUs.
+
+    Examples
+    --------
+    >>> import zarr
+    >>> import numpy as np
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> x = zarr.array(np.arange(10), chunks=3)
+    >>> y = zarr.array(np.ones(10), chunks=3)
+    >>> z = zarr.zeros(10, chunks=3)
+    >>> with ThreadPoolExecutor(max_workers=2) as pool:
+    ...     zarr.map_blocks(lambda a, b: a * 2 + b, x, y, out=z, executor=pool)
+    >>> z[:]
+    array([ 1.,  3.,  5.,  7.,  9., 11., 13., 15., 17., 19.])
+
+    Notes
+    -----
+    Each chunk of `out` is replaced entirely, via a single write per chunk, and
+    without retrieving the existing chunk from the store.
+
+    """
+
+    # check arguments
+    if not isinstance(out, Array):
+        raise TypeError('out must be a zarr array; found {!r}'.format(out))
+    if out.read_only:
+        raise ReadOnlyError()
+    for a in arrays:
+        if a.shape != out.shape or a.chunks != out.chunks:
+            raise ValueError('inconsistent chunk grid; expected shape {!r} and chunks '
+                             '{!r}, found shape {!r} and chunks {!r}'
+                             .format(out.shape, out.chunks, a.shape, a.chunks))
+    if executor is None:
+        executor = out.executor
+    if max_chunks is None:
+        max_chunks = 2 * (os.cpu_count() or 1)
+    if not isinstance(max_chunks, int) or max_chunks < 1:
+        raise ValueError('max_chunks must be a positive integer')
+
+    chunk_coords = itertools.product(*[range(n) for n in out.cdata_shape])
+
+    if executor is None:
+        for coords in chunk_coords:
+            _map_block(func, arrays, out, coords, write=True)
+        return
+
+    # N.B., blocks mapped in other processes cannot be stored into in-memory stores,
+    # so are stored here
+    write = not isinstance(executor, ProcessPoolExecutor)
+    pending = dict()
+
+    def complete(done):
+        for future in done:
+            coords = pending.pop(future)
+            result = future.result()
+            if not write:
+                out._chunk_setitem(coords, tuple(slice(0, c) for c in out.chunks),
+                                   result)
+
+    try:
+        for coords in chunk_coords:
+            if len(pending) >= max_chunks:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                complete(done)
+            future = executor.submit(_map_block, func, arrays, out, coords, write)
+            pending[future] = coords
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            complete(done)
+    finally:
+        for future in pending:
+            future.cancel()
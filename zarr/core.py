@@ -1,9 +1,16 @@
+import asyncio
 import binascii
+import collections
+import contextlib
+import functools
 import hashlib
 import itertools
 import math
 import operator
+import os
 import re
+from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor,
+                                ThreadPoolExecutor, wait)
 from functools import reduce
 
 import numpy as np
@@ -20,30 +27,105 @@ from zarr.indexing import (
     OrthogonalIndexer,
     VIndex,
     PartialChunkIterator,
+    SelectionPlan,
     check_fields,
     check_no_multi_fields,
     ensure_tuple,
     err_too_many_indices,
     is_contiguous_selection,
+    is_integer,
+    is_item_selection,
     is_scalar,
+    normalize_integer_selection,
     pop_fields,
+    replace_ellipsis,
 )
 from zarr.meta import decode_array_metadata, encode_array_metadata
-from zarr.storage import array_meta_key, attrs_key, getsize, listdir
+from zarr.storage import (
+    AsyncStoreAdapter,
+    array_meta_key,
+    attrs_key,
+    getsize,
+    is_async_store,
+    listdir,
+)
 from zarr.util import (
     InfoReporter,
+    all_equal,
     check_array_shape,
     human_readable_size,
     is_total_slice,
     nolock,
+    normalize_axis,
     normalize_chunks,
     normalize_resize_args,
     normalize_shape,
     normalize_storage_path,
     PartialReadBuffer,
+    run_concurrently,
 )
 
 
+# executor used by arrays which have not been given one explicitly
+_default_executor = None
+
+
+def set_executor(executor):
+    """Set the executor used by default to process chunks concurrently.
+
+    Parameters
+    ----------
+    executor : concurrent.futures.Executor or None
+        Executor to use for arrays which were not given an executor when they
+        were instantiated. Provide `None` to process chunks sequentially (the
+        default).
+
+    Returns
+    -------
+    previous : concurrent.futures.Executor or None
+        The executor that was previously set.
+
+    Examples
+    --------
+    >>> import zarr
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> pool = ThreadPoolExecutor(max_workers=4)
+    >>> previous = zarr.core.set_executor(pool)
+    >>> z = zarr.zeros((1000, 1000), chunks=(100, 100))
+    >>> z.executor is pool
+    True
+    >>> _ = zarr.core.set_executor(previous)
+    >>> pool.shutdown()
+
+    """
+    global _default_executor
+    previous = _default_executor
+    _default_executor = executor
+    return previous
+
+
+def _encode_chunk_data(chunk, filters, compressor):
+    # N.B., this is a module-level function so that chunks can be encoded via any kind
+    # of executor, including those which run calls in other processes
+
+    # apply filters
+    if filters:
+        for f in filters:
+            chunk = f.encode(chunk)
+
+    # check object encoding
+    if ensure_ndarray(chunk).dtype == object:
+        raise RuntimeError('cannot write object array without object codec')
+
+    # compress
+    if compressor:
+        cdata = compressor.encode(chunk)
+    else:
+        cdata = chunk
+
+    return cdata
+
+
 # noinspection PyUnresolvedReferences
 class Array:
     """Instantiate an array from an initialized store.
@@ -71,12 +153,40 @@ class Array:
         operations. If False, user attributes are reloaded from the store prior
         to all attribute read operations.
     partial_decompress : bool, optional
-        If True and while the chunk_store is a FSStore and the compresion used
-        is Blosc, when getting data from the array chunks will be partially
-        read and decompressed when possible.
+        If True and the compresion used is Blosc, when getting data from the
+        array chunks will be partially read and decompressed when possible.
+        Partial reads use the ``getrange`` method of the chunk store if
+        available, see :func:`zarr.storage.getrange`.
 
         .. versionadded:: 2.7
 
+    executor : concurrent.futures.Executor, optional
+        If provided, chunks overlapping a selection will be retrieved and
+        decoded concurrently using this executor, e.g., a
+        :class:`concurrent.futures.ThreadPoolExecutor`. If not provided, the
+        executor set via :func:`zarr.core.set_executor` is used, if any.
+        Where the chunk store does not implement ``getitems``, chunks are also
+        retrieved from the store concurrently, so the store must support
+        concurrent reads. When data are modified, chunks are encoded and
+        compressed using this executor, which may also be a
+        :class:`concurrent.futures.ProcessPoolExecutor`, while encoded chunks
+        are written to the store as soon as they are ready.
+
+    chunk_cache : zarr.storage.LRUChunkCache, optional
+        If provided, decoded chunks will be cached, so that repeated reads of the
+        same chunk do not need to retrieve and decode the chunk again. A chunk cache
+        may be shared by several arrays.
+
+    prefetch : int, optional
+        Number of chunk-rows to retrieve and decode in a background thread ahead of
+        the one being consumed when iterating over the array. Defaults to 0, i.e., no
+        read-ahead. See also :func:`Array.islice`.
+    write_empty_chunks : bool, optional
+        If True (default), all chunks will be stored regardless of their contents.
+        If False, chunks which only contain the fill value are not stored, and are
+        removed from the store if they exist, as uninitialized chunks are read as
+        the fill value.
+
     Attributes
     ----------
     store
@@ -84,6 +194,10 @@ class Array:
     name
     read_only
     chunk_store
+    chunk_cache
+    executor
+    prefetch
+    write_empty_chunks
     shape
     chunks
     dtype
@@ -119,10 +233,19 @@ class Array:
     set_mask_selection
     get_coordinate_selection
     set_coordinate_selection
+    iter_chunks
+    sum
+    mean
+    var
+    std
+    min
+    max
     digest
     hexdigest
     resize
     append
+    write_back
+    flush
     view
     astype
 
@@ -138,6 +261,10 @@ class Array:
         cache_metadata=True,
         cache_attrs=True,
         partial_decompress=False,
+        executor=None,
+        chunk_cache=None,
+        prefetch=0,
+        write_empty_chunks=True,
     ):
         # N.B., expect at this point store is fully initialized with all
         # configuration metadata fully specified and normalized
@@ -154,6 +281,13 @@ class Array:
         self._cache_metadata = cache_metadata
         self._is_view = False
         self._partial_decompress = partial_decompress
+        self._executor = executor
+        self._chunk_cache = chunk_cache
+        self._prefetch = prefetch
+        self._write_empty_chunks = write_empty_chunks
+        self._write_buffer = None
+        self._write_buffer_size = 0
+        self._write_buffer_max_size = 0
 
         # initialize metadata
         self._load_metadata()
@@ -281,6 +415,39 @@ class Array:
         else:
             return self._chunk_store
 
+    @property
+    def chunk_cache(self):
+        """Cache of decoded chunks, or None if decoded chunks are not cached."""
+        return self._chunk_cache
+
+    @property
+    def prefetch(self):
+        """Number of chunk-rows read ahead in the background when iterating over the
+        array."""
+        return self._prefetch
+
+    @property
+    def write_empty_chunks(self):
+        """If False, chunks which only contain the fill value are not stored."""
+        return self._write_empty_chunks
+
+    @property
+    def executor(self):
+        """Executor used to process chunks concurrently, or None if chunks are
+        processed sequentially."""
+        if self._executor is None:
+            return _default_executor
+        return self._executor
+
+    @property
+    def _read_executor(self):
+        # chunks are decoded directly into the output array, which is only possible
+        # if the executor runs calls in this process
+        executor = self.executor
+        if isinstance(executor, ProcessPoolExecutor):
+            return None
+        return executor
+
     @property
     def shape(self):
         """A tuple of integers describing the length of each dimension of
@@ -460,7 +627,7 @@ class Array:
             a = a.astype(args[0])
         return a
 
-    def islice(self, start=None, end=None):
+    def islice(self, start=None, end=None, prefetch=None):
         """
         Yield a generator for iterating over the entire or parts of the
         array. Uses a cache so chunks only have to be decompressed once.
@@ -471,6 +638,13 @@ class Array:
             Start index for the generator to start at. Defaults to 0.
         end : int, optional
             End index for the generator to stop at. Defaults to self.shape[0].
+        prefetch : int, optional
+            Number of chunk-rows to retrieve and decode in a background thread
+            ahead of the one currently being iterated over, so that I/O overlaps
+            with processing by the caller. At most `prefetch` chunk-rows are held
+            in memory in addition to the current one. Chunks within a chunk-row
+            are processed concurrently if the array has an executor. Defaults to
+            the `prefetch` setting of the array.
 
         Yields
         ------
@@ -493,6 +667,11 @@ class Array:
             27
             28
             29
+
+        Read ahead the next two chunk-rows while iterating:
+            >>> z = zarr.array(np.arange(100), chunks=10)
+            >>> sum(z.islice(prefetch=2))
+            4950
         """
 
         if len(self.shape) == 0:
@@ -502,6 +681,8 @@ class Array:
             start = 0
         if end is None or end > self.shape[0]:
             end = self.shape[0]
+        if prefetch is None:
+            prefetch = self._prefetch
 
         if not isinstance(start, int) or start < 0:
             raise ValueError('start must be a nonnegative integer')
@@ -509,6 +690,14 @@ class Array:
         if not isinstance(end, int) or end < 0:
             raise ValueError('end must be a nonnegative integer')
 
+        if not isinstance(prefetch, int) or prefetch < 0:
+            raise ValueError('prefetch must be a nonnegative integer')
+
+        if prefetch:
+            return self._islice_prefetch(start, end, prefetch)
+        return self._islice(start, end)
+
+    def _islice(self, start, end):
         # Avoid repeatedly decompressing chunks by iterating over the chunks
         # in the first dimension.
         chunk_size = self.chunks[0]
@@ -523,9 +712,391 @@ class Array:
                 chunk = self[chunk_start:chunk_end]
             yield chunk[j % chunk_size]
 
+    def _islice_prefetch(self, start, end, prefetch):
+        # retrieve chunk-rows in a background thread, keeping at most `prefetch`
+        # chunk-rows queued ahead of the one being consumed; a single thread is
+        # used as not all stores support concurrent reads
+        chunk_size = self.chunks[0]
+        chunk_starts = iter(range(start - start % chunk_size, end, chunk_size))
+        pending = collections.deque()
+        pool = ThreadPoolExecutor(max_workers=1)
+
+        def submit():
+            for chunk_start in chunk_starts:
+                pending.append(pool.submit(self.__getitem__,
+                                           slice(chunk_start, chunk_start + chunk_size)))
+                return
+
+        try:
+            for _ in range(prefetch + 1):
+                submit()
+            j = start
+            while pending:
+                chunk = pending.popleft().result()
+                submit()
+                chunk_end = min(end, j - j % chunk_size + chunk_size)
+                for k in range(j % chunk_size, j % chunk_size + chunk_end - j):
+                    yield chunk[k]
+                j = chunk_end
+        finally:
+            # N.B., reached also when the generator is closed before being exhausted
+            for future in pending:
+                future.cancel()
+            pool.shutdown()
+
     def __iter__(self):
         return self.islice()
 
+    def iter_chunks(self, region=None, skip_uninitialized=False, storage_order=False,
+                    prefetch=0):
+        """Yield the data of each chunk overlapping a region of the array.
+
+        Parameters
+        ----------
+        region : tuple of slices, optional
+            Region of the array to visit, where each slice must have a step of 1.
+            Defaults to the entire array.
+        skip_uninitialized : bool, optional
+            If True, chunks which have not been initialized are not visited.
+            Otherwise, data for uninitialized chunks are filled with the fill value.
+        storage_order : bool, optional
+            If True, chunks are visited in the lexical order of their keys, i.e., the
+            order in which chunks are laid out by stores which keep their keys
+            sorted, such as :class:`zarr.storage.LMDBStore` or object stores.
+            Otherwise, chunks are visited in C order of their grid coordinates.
+        prefetch : int, optional
+            Number of chunks to retrieve and decode in the background ahead of the
+            one currently being visited. Chunks are processed using the executor of
+            the array if there is one, otherwise in a background thread.
+
+        Yields
+        ------
+        chunk_coords : tuple of ints
+            Coordinates of the chunk within the chunk grid.
+        selection : tuple of slices
+            Region of the array covered by `data`, i.e., the intersection of the
+            chunk with the region and the bounds of the array.
+        data : ndarray
+            The data for `selection`. This may be a view of a decoded chunk shared
+            with a chunk cache, so should not be modified.
+
+        Examples
+        --------
+        >>> import zarr
+        >>> import numpy as np
+        >>> z = zarr.array(np.arange(25).reshape(5, 5), chunks=(3, 3))
+        >>> for chunk_coords, selection, data in z.iter_chunks(np.s_[1:, 2:]):
+        ...     print(chunk_coords, data.tolist())
+        (0, 0) [[7], [12]]
+        (0, 1) [[8, 9], [13, 14]]
+        (1, 0) [[17], [22]]
+        (1, 1) [[18, 19], [23, 24]]
+
+        Notes
+        -----
+        Chunks are decoded directly, without the indexing machinery used by
+        :func:`Array.get_basic_selection`, so no output array needs to be allocated
+        for each chunk.
+
+        """
+
+        # refresh metadata
+        self._refresh_metadata()
+
+        if self._shape == ():
+            # Same error as numpy
+            raise TypeError("iteration over a 0-d array")
+        if not isinstance(prefetch, int) or prefetch < 0:
+            raise ValueError('prefetch must be a nonnegative integer')
+
+        # normalize region
+        if region is None:
+            region = Ellipsis
+        region = replace_ellipsis(ensure_tuple(region), self._shape)
+        bounds = []
+        for dim_sel, dim_len in zip(region, self._shape):
+            if not isinstance(dim_sel, slice):
+                raise IndexError('region must be a tuple of slices; found {!r}'
+                                 .format(dim_sel))
+            start, stop, step = dim_sel.indices(dim_len)
+            if step != 1:
+                raise IndexError('region slices must have a step of 1; found {!r}'
+                                 .format(dim_sel))
+            bounds.append((start, max(start, stop)))
+
+        # determine chunks overlapping the region
+        chunk_coords = itertools.product(*[
+            range(start // c, math.ceil(stop / c))
+            for (start, stop), c in zip(bounds, self._chunks)
+        ])
+        if storage_order:
+            chunk_coords = sorted(chunk_coords, key=self._chunk_key)
+
+        for coords, chunk in self._iter_chunks(chunk_coords, prefetch=prefetch):
+            if chunk is None and skip_uninitialized:
+                continue
+            selection = tuple(
+                slice(max(start, co * c), min(stop, (co + 1) * c))
+                for co, c, (start, stop) in zip(coords, self._chunks, bounds)
+            )
+            if chunk is None:
+                data = np.empty(tuple(s.stop - s.start for s in selection),
+                                dtype=self._dtype, order=self._order)
+                if self._fill_value is not None:
+                    data[...] = self._fill_value
+            else:
+                data = chunk[tuple(slice(s.start - co * c, s.stop - co * c)
+                                   for s, co, c in zip(selection, coords, self._chunks))]
+            yield coords, selection, data
+
+    def _iter_chunks(self, chunk_coords, prefetch=0, transform=None):
+        """Yield `(chunk_coords, chunk)` for each of `chunk_coords`, where `chunk` is
+        the decoded chunk, or None if the chunk has not been initialized. If
+        `prefetch` is positive, up to that many chunks are retrieved and decoded
+        ahead of the chunk being consumed. If `transform` is given, `chunk` is
+        replaced by the result of calling `transform(chunk_coords, chunk)`, which
+        runs alongside retrieval of the chunk."""
+
+        def load(coords):
+            chunk = load_chunk(coords)
+            if transform is not None:
+                return transform(coords, chunk)
+            return chunk
+
+        def load_chunk(coords):
+            ckey = self._chunk_key(coords)
+            chunk = self._cached_chunk(ckey)
+            if chunk is not None:
+                return chunk
+            try:
+                cdata = self.chunk_store[ckey]
+            except KeyError:
+                return None
+            if self._chunk_cache is not None:
+                return self._cache_chunk(ckey, cdata)
+            return self._decode_chunk(cdata)
+
+        if not prefetch:
+            for coords in chunk_coords:
+                yield coords, load(coords)
+            return
+
+        executor = self._read_executor
+        pool = None
+        if executor is None:
+            # N.B., a single thread as not all stores support concurrent reads
+            pool = executor = ThreadPoolExecutor(max_workers=1)
+        chunk_coords = iter(chunk_coords)
+        pending = collections.deque()
+
+        def submit():
+            for coords in chunk_coords:
+                pending.append((coords, executor.submit(load, coords)))
+                return
+
+        try:
+            for _ in range(prefetch + 1):
+                submit()
+            while pending:
+                coords, future = pending.popleft()
+                chunk = future.result()
+                submit()
+                yield coords, chunk
+        finally:
+            # N.B., reached also when the generator is closed before being exhausted;
+            # wait for any chunk which is already being retrieved
+            futures = [future for _, future in pending]
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            if pool is not None:
+                pool.shutdown()
+
+    def sum(self, axis=None, dtype=None, out=None, keepdims=False):
+        """Compute the sum of array items over the given axis or axes.
+
+        Parameters
+        ----------
+        axis : int or tuple of ints, optional
+            Axis or axes along which to reduce. Defaults to all axes.
+        dtype : dtype, optional
+            Type used for accumulation and of the result, as for :func:`numpy.sum`.
+        out : ndarray, optional
+            Array to store the result in.
+        keepdims : bool, optional
+            If True, reduced axes are kept with size one.
+
+        Returns
+        -------
+        out : scalar or ndarray
+
+        Notes
+        -----
+        Chunks are processed one at a time, so the array need not fit in memory. If
+        the array has an executor, chunks are processed concurrently. Uninitialized
+        chunks are not retrieved, but accounted for as if they were filled with the
+        fill value, or zeros if the array has no fill value.
+
+        Examples
+        --------
+        >>> import zarr
+        >>> import numpy as np
+        >>> z = zarr.zeros((1000, 1000), chunks=(100, 100), dtype='i4')
+        >>> z[:10] = 1
+        >>> z.sum()
+        10000
+        >>> z.sum(axis=1)[8:12]
+        array([1000, 1000,    0,    0])
+
+        """
+        return self._reduce('sum', axis, dtype=dtype, out=out, keepdims=keepdims)
+
+    def mean(self, axis=None, dtype=None, out=None, keepdims=False):
+        """Compute the arithmetic mean of array items over the given axis or axes.
+
+        See :func:`Array.sum` for a description of parameters and how chunks are
+        processed.
+
+        """
+        return self._reduce('mean', axis, dtype=dtype, out=out, keepdims=keepdims)
+
+    def var(self, axis=None, dtype=None, out=None, ddof=0, keepdims=False):
+        """Compute the variance of array items over the given axis or axes. Partial
+        results for each chunk are combined pairwise, which is numerically stable.
+
+        Parameters
+        ----------
+        axis : int or tuple of ints, optional
+            Axis or axes along which to reduce. Defaults to all axes.
+        dtype : dtype, optional
+            Type used for accumulation and of the result, as for :func:`numpy.var`.
+        out : ndarray, optional
+            Array to store the result in.
+        ddof : int, optional
+            Delta degrees of freedom, as for :func:`numpy.var`.
+        keepdims : bool, optional
+            If True, reduced axes are kept with size one.
+
+        See :func:`Array.sum` for a description of how chunks are processed.
+
+        """
+        return self._reduce('var', axis, dtype=dtype, out=out, keepdims=keepdims,
+                            ddof=ddof)
+
+    def std(self, axis=None, dtype=None, out=None, ddof=0, keepdims=False):
+        """Compute the standard deviation of array items over the given axis or axes.
+
+        See :func:`Array.var` for a description of parameters.
+
+        """
+        return self._reduce('std', axis, dtype=dtype, out=out, keepdims=keepdims,
+                            ddof=ddof)
+
+    def min(self, axis=None, out=None, keepdims=False):
+        """Compute the minimum of array items over the given axis or axes.
+
+        See :func:`Array.sum` for a description of parameters and how chunks are
+        processed.
+
+        """
+        return self._reduce('min', axis, out=out, keepdims=keepdims)
+
+    def max(self, axis=None, out=None, keepdims=False):
+        """Compute the maximum of array items over the given axis or axes.
+
+        See :func:`Array.sum` for a description of parameters and how chunks are
+        processed.
+
+        """
+        return self._reduce('max', axis, out=out, keepdims=keepdims)
+
+    def _reduce(self, kind, axis, dtype=None, out=None, keepdims=False, ddof=0):
+
+        # refresh metadata
+        self._refresh_metadata()
+
+        axis = normalize_axis(axis, len(self._shape))
+        kwargs = dict(keepdims=keepdims)
+        if dtype is not None:
+            kwargs['dtype'] = dtype
+        if kind in ('var', 'std'):
+            kwargs['ddof'] = ddof
+        if self._size == 0 or self._shape == ():
+            # nothing to stream, defer to numpy for consistent results
+            return getattr(np, kind)(self[...], axis=axis, out=out, **kwargs)
+
+        # partial results are held with the reduced axes kept
+        reduced_shape = tuple(1 if i in axis else s for i, s in enumerate(self._shape))
+        fill_value = 0 if self._fill_value is None else self._fill_value
+        probe = np.zeros(2, dtype=self._dtype)
+        if dtype is None:
+            dtype = getattr(np, kind)(probe).dtype
+        else:
+            dtype = getattr(np, kind)(probe, dtype=dtype).dtype
+
+        def partial(chunk_coords, chunk):
+            # compute count and partial results for a single chunk
+            block_shape = tuple(min(c, s - co * c) for co, c, s
+                                in zip(chunk_coords, self._chunks, self._shape))
+            part_shape = tuple(1 if i in axis else s for i, s in enumerate(block_shape))
+            count = reduce(operator.mul, [block_shape[i] for i in axis], 1)
+            if chunk is None:
+                # uninitialized, no need to materialize the chunk
+                if kind in ('sum', 'mean'):
+                    return count, np.full(part_shape, fill_value, dtype=dtype) * count
+                value = np.full(part_shape, fill_value, dtype=dtype)
+                if kind in ('min', 'max'):
+                    return count, value
+                return count, value, np.zeros(part_shape, dtype=dtype)
+            block = chunk[tuple(slice(0, n) for n in block_shape)]
+            if kind in ('sum', 'mean'):
+                return count, np.sum(block, axis=axis, keepdims=True, dtype=dtype)
+            if kind in ('min', 'max'):
+                return count, getattr(np, kind)(block, axis=axis, keepdims=True)
+            mean = np.mean(block, axis=axis, keepdims=True, dtype=dtype)
+            m2 = np.var(block, axis=axis, keepdims=True, dtype=dtype) * count
+            return count, mean, m2
+
+        # accumulate partial results
+        counts = np.zeros(reduced_shape, dtype='i8')
+        acc = np.zeros(reduced_shape, dtype=dtype)
+        acc_m2 = np.zeros(reduced_shape, dtype=dtype)
+        chunk_coords = itertools.product(*[range(n) for n in self._cdata_shape])
+        prefetch = 0 if self._read_executor is None else 2 * (os.cpu_count() or 1)
+        for coords, result in self._iter_chunks(chunk_coords, prefetch=prefetch,
+                                                transform=partial):
+            selection = tuple(slice(0, 1) if i in axis else slice(co * c, (co + 1) * c)
+                              for i, (co, c) in enumerate(zip(coords, self._chunks)))
+            n_b = result[0]
+            n_a = counts[selection]
+            if kind in ('sum', 'mean'):
+                acc[selection] += result[1]
+            elif kind in ('min', 'max'):
+                f = np.minimum if kind == 'min' else np.maximum
+                acc[selection] = np.where(n_a == 0, result[1], f(acc[selection], result[1]))
+            else:
+                # combine means and sums of squared deviations pairwise, after Chan
+                # et al., "Algorithms for computing the sample variance"
+                n = n_a + n_b
+                delta = result[1] - acc[selection]
+                acc[selection] += delta * (n_b / n)
+                acc_m2[selection] += result[2] + delta ** 2 * (n_a * (n_b / n))
+            counts[selection] += n_b
+
+        if kind == 'mean':
+            acc = (acc / counts).astype(dtype, copy=False)
+        elif kind in ('var', 'std'):
+            acc = acc_m2 / np.maximum(counts - ddof, 0)
+            if kind == 'std':
+                acc = np.sqrt(acc)
+
+        if not keepdims:
+            acc = acc.reshape([s for i, s in enumerate(self._shape) if i not in axis])
+        if out is not None:
+            np.copyto(out, acc)
+            return out
+        return acc[()]
+
     def __len__(self):
         if self.shape:
             return self.shape[0]
@@ -783,6 +1354,9 @@ class Array:
         if self._shape == ():
             return self._get_basic_selection_zd(selection=selection, out=out,
                                                 fields=fields)
+        elif out is None and not fields and is_item_selection(selection, self._shape):
+            # fast path for a single item, avoids setting up an indexer
+            return self._get_item(ensure_tuple(selection))
         else:
             return self._get_basic_selection_nd(selection=selection, out=out,
                                                 fields=fields)
@@ -821,6 +1395,56 @@ class Array:
 
         return out
 
+    def _get_item(self, selection):
+        # retrieve a single item, selected via an integer for each dimension
+
+        # locate item within its chunk
+        chunk_coords = []
+        item_coords = []
+        for dim_sel, dim_len, dim_chunk_len in zip(selection, self._shape, self._chunks):
+            dim_sel = normalize_integer_selection(dim_sel, dim_len)
+            chunk_coords.append(dim_sel // dim_chunk_len)
+            item_coords.append(dim_sel % dim_chunk_len)
+        item_coords = tuple(item_coords)
+        ckey = self._chunk_key(chunk_coords)
+
+        # use a decoded chunk if available
+        chunk = self._cached_chunk(ckey)
+        if chunk is not None:
+            return chunk[item_coords]
+
+        if self._use_partial_read():
+            # only decode the requested item
+            if ckey not in self.chunk_store:
+                return self._fill_item()
+            cdata = PartialReadBuffer(ckey, self.chunk_store)
+            cdata.prepare_chunk()
+            start = int(np.ravel_multi_index(item_coords, self._chunks))
+            cdata.read_part(start, 1)
+            item = np.empty((), dtype=self._dtype)
+            self._compressor.decode_partial(cdata.buff, start, 1,
+                                            out=item.reshape(-1).view('u1'))
+            return item[()]
+
+        try:
+            # obtain encoded data for chunk
+            cdata = self.chunk_store[ckey]
+        except KeyError:
+            # chunk not initialized
+            return self._fill_item()
+        if self._chunk_cache is None:
+            chunk = self._decode_chunk(cdata)
+        else:
+            chunk = self._cache_chunk(ckey, cdata)
+        return chunk[item_coords]
+
+    def _fill_item(self):
+        # item of an uninitialized chunk
+        item = np.empty((), dtype=self._dtype)
+        if self._fill_value is not None:
+            item[()] = self._fill_value
+        return item[()]
+
     def _get_basic_selection_nd(self, selection, out=None, fields=None):
         # implementation of basic selection for array with at least one dimension
 
@@ -1089,6 +1713,213 @@ class Array:
 
         return self._get_selection(indexer=indexer, out=out, fields=fields)
 
+    def plan(self, selection):
+        """Compile a basic selection into a :class:`zarr.indexing.SelectionPlan`, which
+        can be executed repeatedly without recomputing chunk keys and chunk
+        projections on each call.
+
+        Parameters
+        ----------
+        selection : tuple
+            A selection as accepted by :func:`__getitem__`, i.e., integers, slices and
+            optionally field names.
+
+        Returns
+        -------
+        plan : zarr.indexing.SelectionPlan
+
+        Examples
+        --------
+        Setup a 2-dimensional array::
+
+            >>> import zarr
+            >>> import numpy as np
+            >>> z = zarr.array(np.arange(100).reshape(10, 10), chunks=(2, 5))
+
+        Compile a selection and execute it, optionally reusing an output buffer::
+
+            >>> p = z.plan((slice(0, 2), 5))
+            >>> p.out_shape
+            (2,)
+            >>> p.chunk_keys
+            ('0.1',)
+            >>> out = np.empty(p.out_shape, dtype=p.dtype)
+            >>> p.get(out=out)
+            array([ 5, 15])
+
+        Shift the plan by a multiple of the chunk shape to read a sliding window::
+
+            >>> p.translate((4, 0)).get()
+            array([45, 55])
+
+        Plans for orthogonal and vectorized selections are available via the `oindex`
+        and `vindex` properties::
+
+            >>> z.oindex.plan(([0, 9], [1, 8])).get()
+            array([[ 1,  8],
+                   [91, 98]])
+            >>> z.vindex.plan(([0, 9], [1, 8])).get()
+            array([ 1, 98])
+
+        Notes
+        -----
+        A plan captures the shape and chunks of the array at the time it was compiled.
+        If the array is subsequently resized, executing or translating the plan raises
+        :class:`zarr.errors.StalePlanError`.
+
+        See Also
+        --------
+        get_basic_selection, get_orthogonal_selection, get_coordinate_selection,
+        get_mask_selection, vindex, oindex
+
+        """
+
+        # refresh metadata
+        if not self._cache_metadata:
+            self._load_metadata()
+
+        fields, selection = pop_fields(selection)
+        selection = ensure_tuple(selection)
+        return SelectionPlan(self, BasicIndexer(selection, self), fields=fields)
+
+    def get_many(self, selections):
+        """Retrieve several selections at once, fetching and decoding each chunk only
+        once however many of the selections overlap it.
+
+        Parameters
+        ----------
+        selections : sequence
+            Basic selections as accepted by :func:`__getitem__`, optionally including
+            field names, and/or plans compiled via :func:`plan`, ``oindex.plan`` or
+            ``vindex.plan``.
+
+        Returns
+        -------
+        outs : list of ndarray
+            One NumPy array per selection, in the order of `selections`.
+
+        Examples
+        --------
+        Setup a 2-dimensional array::
+
+            >>> import zarr
+            >>> import numpy as np
+            >>> z = zarr.array(np.arange(100).reshape(10, 10), chunks=(5, 5))
+
+        Retrieve overlapping regions, reading the chunks they share only once::
+
+            >>> a, b, c = z.get_many([(slice(0, 2), slice(0, 2)),
+            ...                       (slice(1, 3), slice(1, 3)),
+            ...                       z.vindex.plan(([0, 9], [0, 9]))])
+            >>> a
+            array([[ 0,  1],
+                   [10, 11]])
+            >>> b
+            array([[11, 12],
+                   [21, 22]])
+            >>> c
+            array([ 0, 99])
+
+        Notes
+        -----
+        The chunks required by all selections are retrieved via a single call to the
+        ``getitems`` method of the chunk store, where the store provides one.
+
+        See Also
+        --------
+        __getitem__, get_basic_selection, plan
+
+        """
+
+        # refresh metadata
+        if not self._cache_metadata:
+            self._load_metadata()
+
+        # setup indexers and output arrays
+        indexers, lfields, outs = [], [], []
+        for selection in selections:
+            if isinstance(selection, SelectionPlan):
+                if selection.array is not self:
+                    raise ValueError('plan was compiled for a different array')
+                selection._check_valid()
+                indexer, fields = selection, selection._fields
+            else:
+                fields, selection = pop_fields(selection)
+                indexer = BasicIndexer(ensure_tuple(selection), self)
+            out_dtype = check_fields(fields, self._dtype)
+            indexers.append(indexer)
+            lfields.append(fields)
+            outs.append(np.empty(indexer.shape, dtype=out_dtype, order=self._order))
+
+        # group the chunk projections of all selections by chunk
+        projections = dict()
+        for i, indexer in enumerate(indexers):
+            for chunk_coords, chunk_selection, out_selection in indexer:
+                ckey = self._chunk_key(chunk_coords)
+                projections.setdefault(ckey, []).append((i, chunk_selection, out_selection))
+        ckeys = list(projections)
+
+        # retrieve encoded data for all chunks not already held decoded
+        chunks = self._cached_chunks(ckeys)
+        fetch_ckeys = [ckey for ckey in ckeys if ckey not in chunks]
+        if not fetch_ckeys:
+            cdatas = dict()
+        elif hasattr(self.chunk_store, 'getitems'):
+            cdatas = self.chunk_store.getitems(fetch_ckeys, on_error='omit')
+        else:
+            cdatas = dict()
+            for ckey in fetch_ckeys:
+                try:
+                    cdatas[ckey] = self.chunk_store[ckey]
+                except KeyError:
+                    pass
+
+        def load(ckey):
+            chunk_projections = projections[ckey]
+            if ckey in chunks:
+                chunk = chunks[ckey]
+            elif ckey in cdatas and self._chunk_cache is not None:
+                chunk = self._cache_chunk(ckey, cdatas[ckey])
+            elif ckey in cdatas and len(chunk_projections) == 1:
+                # chunk needed by a single selection, allow decoding into the output
+                i, chunk_selection, out_selection = chunk_projections[0]
+                self._process_chunk(outs[i], cdatas[ckey], chunk_selection,
+                                    indexers[i].drop_axes, True, lfields[i],
+                                    out_selection)
+                return
+            elif ckey in cdatas:
+                chunk = self._decode_chunk(cdatas[ckey])
+            else:
+                # chunk not initialized
+                if self._fill_value is not None:
+                    for i, _, out_selection in chunk_projections:
+                        fields = lfields[i]
+                        fill_value = self._fill_value[fields] if fields else self._fill_value
+                        outs[i][out_selection] = fill_value
+                return
+            for i, chunk_selection, out_selection in chunk_projections:
+                self._process_decoded_chunk(outs[i], chunk, chunk_selection,
+                                            indexers[i].drop_axes, lfields[i],
+                                            out_selection)
+
+        # N.B., distinct chunks are loaded into distinct regions of each output array,
+        # so can be processed concurrently
+        executor = self._read_executor
+        if executor is None:
+            for ckey in ckeys:
+                load(ckey)
+        else:
+            run_concurrently(executor, load, ckeys)
+
+        # restore shapes of coordinate selections and unwrap scalars
+        for i, indexer in enumerate(indexers):
+            sel_shape = getattr(indexer, '_sel_shape', None)
+            if sel_shape is not None:
+                outs[i] = outs[i].reshape(sel_shape)
+            elif not outs[i].shape:
+                outs[i] = outs[i][()]
+        return outs
+
     def _get_selection(self, indexer, out=None, fields=None):
 
         # We iterate over all chunks which overlap the selection and thus contain data
@@ -1106,6 +1937,10 @@ class Array:
 
         # setup output array
         if out is None:
+            if not fields and getattr(self.chunk_store, 'memory_map', False):
+                view = self._get_selection_view(indexer)
+                if view is not None:
+                    return view
             out = np.empty(out_shape, dtype=out_dtype, order=self._order)
         else:
             check_array_shape('out', out, out_shape)
@@ -1113,12 +1948,25 @@ class Array:
         # iterate over chunks
         if not hasattr(self.chunk_store, "getitems") or \
            any(map(lambda x: x == 0, self.shape)):
-            # sequentially get one key at a time from storage
-            for chunk_coords, chunk_selection, out_selection in indexer:
-
-                # load chunk selection into output array
-                self._chunk_getitem(chunk_coords, chunk_selection, out, out_selection,
-                                    drop_axes=indexer.drop_axes, fields=fields)
+            executor = self._read_executor
+            if executor is None:
+                # sequentially get one key at a time from storage
+                for chunk_coords, chunk_selection, out_selection in indexer:
+
+                    # load chunk selection into output array
+                    self._chunk_getitem(chunk_coords, chunk_selection, out,
+                                        out_selection, drop_axes=indexer.drop_axes,
+                                        fields=fields)
+            else:
+                # get one key at a time from storage, but process several chunks
+                # concurrently; N.B., each chunk is loaded into a region of the output
+                # array that does not overlap with the region of any other chunk
+                def load(chunk_coords, chunk_selection, out_selection):
+                    self._chunk_getitem(chunk_coords, chunk_selection, out,
+                                        out_selection, drop_axes=indexer.drop_axes,
+                                        fields=fields)
+
+                run_concurrently(executor, load, *zip(*indexer))
         else:
             # allow storage to get multiple items at once
             lchunk_coords, lchunk_selection, lout_selection = zip(*indexer)
@@ -1130,6 +1978,33 @@ class Array:
         else:
             return out[()]
 
+    def _get_selection_view(self, indexer):
+        """Zero-copy fast path for a basic selection lying within a single chunk,
+        where chunks are stored without compression or filters in a memory-mapped
+        store. Returns a read-only view of the stored chunk, or None if the fast path
+        does not apply."""
+
+        if (not isinstance(indexer, BasicIndexer) or self._compressor or
+                self._filters or self._dtype == object):
+            return None
+        projections = list(itertools.islice(indexer, 2))
+        if len(projections) != 1:
+            return None
+        chunk_coords, chunk_selection, _ = projections[0]
+        ckey = self._chunk_key(chunk_coords)
+        if self._write_buffer and ckey in self._write_buffer:
+            return None
+        try:
+            cdata = self.chunk_store[ckey]
+        except KeyError:
+            return None
+        view = self._decode_chunk(cdata)[chunk_selection]
+        if indexer.drop_axes:
+            view = np.squeeze(view, axis=indexer.drop_axes)
+        if view.shape:
+            return view
+        return view[()]
+
     def __setitem__(self, selection, value):
         """Modify data for an item or region of the array.
 
@@ -1587,8 +2462,12 @@ class Array:
             chunk[selection] = value
 
         # encode and store
-        cdata = self._encode_chunk(chunk)
-        self.chunk_store[ckey] = cdata
+        if self._is_empty_chunk(chunk):
+            self._chunk_delitems([ckey])
+        else:
+            cdata = self._encode_chunk(chunk)
+            self.chunk_store[ckey] = cdata
+        self._invalidate_cached_chunks([ckey])
 
     def _set_basic_selection_nd(self, selection, value, fields=None):
         # implementation of __setitem__ for array with at least one dimension
@@ -1611,6 +2490,32 @@ class Array:
         check_fields(fields, self._dtype)
         fields = check_no_multi_fields(fields)
 
+        # check value shape
+        value = self._check_value(indexer, value)
+
+        # iterate over chunks in range
+        if any(map(lambda x: x == 0, self.shape)) or self._write_buffer is not None or (
+            self.executor is None and
+            (not hasattr(self.store, "setitems") or self._synchronizer is not None)
+        ):
+            # iterative approach
+            for chunk_coords, chunk_selection, out_selection in indexer:
+
+                # extract data to store
+                chunk_value = self._chunk_value(indexer, value, out_selection)
+
+                # put data
+                self._chunk_setitem(chunk_coords, chunk_selection, chunk_value, fields=fields)
+        else:
+            lchunk_coords, lchunk_selection, lout_selection = zip(*indexer)
+            chunk_values = [self._chunk_value(indexer, value, out_selection)
+                            for out_selection in lout_selection]
+
+            self._chunk_setitems(lchunk_coords, lchunk_selection, chunk_values,
+                                 fields=fields)
+
+    def _check_value(self, indexer, value):
+
         # determine indices of chunks overlapping the selection
         sel_shape = indexer.shape
 
@@ -1626,50 +2531,267 @@ class Array:
                 value = np.asanyarray(value)
             check_array_shape('value', value, sel_shape)
 
-        # iterate over chunks in range
-        if not hasattr(self.store, "setitems") or self._synchronizer is not None \
-           or any(map(lambda x: x == 0, self.shape)):
-            # iterative approach
-            for chunk_coords, chunk_selection, out_selection in indexer:
+        return value
+
+    def _chunk_value(self, indexer, value, out_selection):
+        # extract the data to store in a single chunk
+        if indexer.shape == () or is_scalar(value, self._dtype):
+            return value
+        chunk_value = value[out_selection]
+        # handle missing singleton dimensions
+        if indexer.drop_axes:
+            item = [slice(None)] * self.ndim
+            for a in indexer.drop_axes:
+                item[a] = np.newaxis
+            item = tuple(item)
+            chunk_value = chunk_value[item]
+        return chunk_value
+
+    async def get_basic_selection_async(self, selection=Ellipsis, out=None,
+                                        fields=None):
+        """Retrieve data for an item or region of the array, without blocking the
+        event loop. This is the coroutine counterpart of
+        :func:`get_basic_selection`, see that method for a description of the
+        parameters.
+
+        Chunks are retrieved via the ``getitems`` coroutine of the chunk store if
+        it provides one, otherwise the chunk store is accessed from a thread pool
+        via a :class:`zarr.storage.AsyncStoreAdapter`. Chunks are decoded in a
+        thread pool.
 
-                # extract data to store
-                if sel_shape == ():
-                    chunk_value = value
-                elif is_scalar(value, self._dtype):
-                    chunk_value = value
-                else:
-                    chunk_value = value[out_selection]
-                    # handle missing singleton dimensions
-                    if indexer.drop_axes:
-                        item = [slice(None)] * self.ndim
-                        for a in indexer.drop_axes:
-                            item[a] = np.newaxis
-                        item = tuple(item)
-                        chunk_value = chunk_value[item]
+        Examples
+        --------
+        >>> import asyncio
+        >>> import zarr
+        >>> import numpy as np
+        >>> z = zarr.array(np.arange(100), chunks=10)
+        >>> asyncio.run(z.get_basic_selection_async(slice(5, 15)))
+        array([ 5,  6,  7,  8,  9, 10, 11, 12, 13, 14])
 
-                # put data
-                self._chunk_setitem(chunk_coords, chunk_selection, chunk_value, fields=fields)
+        See Also
+        --------
+        get_basic_selection, get_orthogonal_selection_async,
+        get_coordinate_selection_async, set_basic_selection_async
+
+        """
+        loop = asyncio.get_running_loop()
+
+        # refresh metadata
+        if not self._cache_metadata:
+            await loop.run_in_executor(None, self._load_metadata)
+
+        # check args
+        check_fields(fields, self._dtype)
+
+        # handle zero-dimensional arrays
+        if self._shape == ():
+            return await loop.run_in_executor(
+                None, functools.partial(self._get_basic_selection_zd,
+                                        selection=selection, out=out, fields=fields)
+            )
+
+        indexer = BasicIndexer(selection, self)
+        return await self._get_selection_async(indexer=indexer, out=out, fields=fields)
+
+    async def get_orthogonal_selection_async(self, selection, out=None, fields=None):
+        """Retrieve data by making a selection for each dimension of the array,
+        without blocking the event loop. This is the coroutine counterpart of
+        :func:`get_orthogonal_selection`, see that method for a description of the
+        parameters.
+
+        See Also
+        --------
+        get_orthogonal_selection, get_basic_selection_async,
+        get_coordinate_selection_async
+
+        """
+        loop = asyncio.get_running_loop()
+
+        # refresh metadata
+        if not self._cache_metadata:
+            await loop.run_in_executor(None, self._load_metadata)
+
+        # check args
+        check_fields(fields, self._dtype)
+
+        indexer = OrthogonalIndexer(selection, self)
+        return await self._get_selection_async(indexer=indexer, out=out, fields=fields)
+
+    async def get_coordinate_selection_async(self, selection, out=None, fields=None):
+        """Retrieve a selection of individual items, by providing the indices
+        (coordinates) for each selected item, without blocking the event loop. This
+        is the coroutine counterpart of :func:`get_coordinate_selection`, see that
+        method for a description of the parameters.
+
+        See Also
+        --------
+        get_coordinate_selection, get_basic_selection_async,
+        get_orthogonal_selection_async
+
+        """
+        loop = asyncio.get_running_loop()
+
+        # refresh metadata
+        if not self._cache_metadata:
+            await loop.run_in_executor(None, self._load_metadata)
+
+        # check args
+        check_fields(fields, self._dtype)
+
+        indexer = CoordinateIndexer(selection, self)
+
+        # handle output - need to flatten
+        if out is not None:
+            out = out.reshape(-1)
+
+        out = await self._get_selection_async(indexer=indexer, out=out, fields=fields)
+
+        # restore shape
+        return out.reshape(indexer.sel_shape)
+
+    async def set_basic_selection_async(self, selection, value, fields=None):
+        """Modify data for an item or region of the array, without blocking the
+        event loop. This is the coroutine counterpart of
+        :func:`set_basic_selection`, see that method for a description of the
+        parameters.
+
+        Existing data for chunks which are only partially modified are retrieved
+        and modified chunks are stored via the ``getitems`` and ``setitems``
+        coroutines of the chunk store, or via a
+        :class:`zarr.storage.AsyncStoreAdapter` if the chunk store does not
+        provide them. Chunks are encoded in a thread pool. If the array has a
+        synchronizer, or is in write-back mode, the whole operation is run in a
+        thread pool so that chunks are locked or buffered while they are modified.
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> import zarr
+        >>> z = zarr.zeros(100, chunks=10, dtype='i4')
+        >>> asyncio.run(z.set_basic_selection_async(slice(5, 15), 42))
+        >>> z[:20]
+        array([ 0,  0,  0,  0,  0, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42,  0,  0,
+                0,  0,  0], dtype=int32)
+
+        See Also
+        --------
+        set_basic_selection, get_basic_selection_async
+
+        """
+        loop = asyncio.get_running_loop()
+
+        # guard conditions
+        if self._read_only:
+            raise ReadOnlyError()
+
+        if (self._synchronizer is not None or self._write_buffer is not None or
+                self._shape == ()):
+            await loop.run_in_executor(
+                None, functools.partial(self.set_basic_selection, selection, value,
+                                        fields=fields)
+            )
+            return
+
+        # refresh metadata
+        if not self._cache_metadata:
+            await loop.run_in_executor(None, self._load_metadata_nosync)
+
+        indexer = BasicIndexer(selection, self)
+        await self._set_selection_async(indexer, value, fields=fields)
+
+    def _async_chunk_store(self):
+        store = self.chunk_store
+        if is_async_store(store):
+            return store
+        return AsyncStoreAdapter(store)
+
+    async def _get_selection_async(self, indexer, out=None, fields=None):
+
+        # check fields are sensible
+        out_dtype = check_fields(fields, self._dtype)
+
+        # determine output shape
+        out_shape = indexer.shape
+
+        # setup output array
+        if out is None:
+            out = np.empty(out_shape, dtype=out_dtype, order=self._order)
         else:
-            lchunk_coords, lchunk_selection, lout_selection = zip(*indexer)
-            chunk_values = []
-            for out_selection in lout_selection:
-                if sel_shape == ():
-                    chunk_values.append(value)
-                elif is_scalar(value, self._dtype):
-                    chunk_values.append(value)
+            check_array_shape('out', out, out_shape)
+
+        projections = list(indexer)
+        if projections:
+            lchunk_coords, lchunk_selection, lout_selection = zip(*projections)
+            ckeys = [self._chunk_key(ch) for ch in lchunk_coords]
+
+            # retrieve all chunks at once, then decode outside of the event loop
+            chunks = self._cached_chunks(ckeys)
+            fetch_ckeys = [ckey for ckey in ckeys if ckey not in chunks]
+            if fetch_ckeys:
+                cdatas = await self._async_chunk_store().getitems(fetch_ckeys,
+                                                                  on_error="omit")
+            else:
+                cdatas = dict()
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                None, functools.partial(self._process_chunks, ckeys, cdatas,
+                                        lchunk_selection, out, lout_selection,
+                                        drop_axes=indexer.drop_axes, fields=fields,
+                                        chunks=chunks)
+            )
+
+        if out.shape:
+            return out
+        else:
+            return out[()]
+
+    async def _set_selection_async(self, indexer, value, fields=None):
+
+        # check fields are sensible
+        check_fields(fields, self._dtype)
+        fields = check_no_multi_fields(fields)
+
+        # check value shape
+        value = self._check_value(indexer, value)
+
+        projections = list(indexer)
+        if not projections:
+            return
+        lchunk_coords, lchunk_selection, lout_selection = zip(*projections)
+        ckeys = [self._chunk_key(ch) for ch in lchunk_coords]
+        chunk_values = [self._chunk_value(indexer, value, out_selection)
+                        for out_selection in lout_selection]
+
+        # retrieve existing data for chunks that are only partially modified
+        store = self._async_chunk_store()
+        partial_ckeys = [
+            ckey for ckey, chunk_selection in zip(ckeys, lchunk_selection)
+            if fields or not is_total_slice(chunk_selection, self._chunks)
+        ]
+        if partial_ckeys:
+            cdatas = await store.getitems(partial_ckeys, on_error="omit")
+        else:
+            cdatas = dict()
+
+        def encode():
+            values, empty_ckeys = dict(), []
+            for ckey, chunk_selection, chunk_value in zip(
+                    ckeys, lchunk_selection, chunk_values):
+                chunk = self._modify_chunk(cdatas.get(ckey), chunk_selection,
+                                           chunk_value, fields=fields)
+                if self._is_empty_chunk(chunk):
+                    empty_ckeys.append(ckey)
                 else:
-                    cv = value[out_selection]
-                    # handle missing singleton dimensions
-                    if indexer.drop_axes:  # pragma: no cover
-                        item = [slice(None)] * self.ndim
-                        for a in indexer.drop_axes:
-                            item[a] = np.newaxis
-                        item = tuple(item)
-                        cv = chunk_value[item]
-                    chunk_values.append(cv)
+                    values[ckey] = self._encode_chunk(chunk)
+            return values, empty_ckeys
 
-            self._chunk_setitems(lchunk_coords, lchunk_selection, chunk_values,
-                                 fields=fields)
+        loop = asyncio.get_running_loop()
+        values, empty_ckeys = await loop.run_in_executor(None, encode)
+        if values:
+            await store.setitems(values)
+        if empty_ckeys:
+            await loop.run_in_executor(None, self._chunk_delitems, empty_ckeys)
+        self._invalidate_cached_chunks(ckeys)
 
     def _process_chunk(
         self,
@@ -1718,31 +2840,84 @@ class Array:
         try:
             if partial_read_decode:
                 cdata.prepare_chunk()
-                # size of chunk
-                tmp = np.empty(self._chunks, dtype=self.dtype)
+                if (len(chunk_selection) == len(self._chunks) and
+                        all(isinstance(sel, np.ndarray) for sel in chunk_selection)):
+                    # selection of points via integer arrays
+                    tmp = self._decode_partial_points(cdata, chunk_selection)
+                    if drop_axes:
+                        tmp = np.squeeze(tmp, axis=drop_axes)
+                    out[out_selection] = tmp
+                    return
                 index_selection = PartialChunkIterator(chunk_selection, self.chunks)
-                for start, nitems, partial_out_selection in index_selection:
-                    expected_shape = [
-                        len(
-                            range(*partial_out_selection[i].indices(self.chunks[0] + 1))
-                        )
-                        if i < len(partial_out_selection)
-                        else dim
-                        for i, dim in enumerate(self.chunks)
-                    ]
-                    cdata.read_part(start, nitems)
-                    chunk_partial = self._decode_chunk(
-                        cdata.buff,
-                        start=start,
-                        nitems=nitems,
-                        expected_shape=expected_shape,
+                # retrieve the blocks required for all runs together
+                cdata.read_parts([(start, nitems) for start, nitems, _ in index_selection])
+                # runs concatenated form the selected data in C order, so can be
+                # decompressed straight into the output if that is contiguous
+                nitems_selected = int(np.prod(index_selection.out_shape, dtype=int))
+                dest = None
+                if out_is_ndarray and is_contiguous_selection(out_selection):
+                    dest = out[out_selection]
+                    if not (dest.flags.writeable and dest.flags.c_contiguous and
+                            dest.size == nitems_selected):
+                        dest = None
+                if dest is None:
+                    tmp = np.empty(index_selection.out_shape, dtype=self._dtype)
+                else:
+                    tmp = dest
+                flat = tmp.reshape(-1).view('u1')
+                itemsize = self._dtype.itemsize
+                for start, nitems, offset in index_selection:
+                    self._compressor.decode_partial(
+                        cdata.buff, start, nitems,
+                        out=flat[offset * itemsize:(offset + nitems) * itemsize]
                     )
-                    tmp[partial_out_selection] = chunk_partial
-                out[out_selection] = tmp[chunk_selection]
+                if dest is None:
+                    # integer indices drop dimensions, as when selecting from a chunk
+                    tmp = tmp[tuple(0 if is_integer(sel) else slice(None)
+                                    for sel in chunk_selection)]
+                    if drop_axes:
+                        tmp = np.squeeze(tmp, axis=drop_axes)
+                    out[out_selection] = tmp
                 return
         except ArrayIndexError:
             cdata = cdata.read_full()
         chunk = self._decode_chunk(cdata)
+        self._process_decoded_chunk(out, chunk, chunk_selection, drop_axes, fields,
+                                    out_selection)
+
+    def _decode_partial_points(self, cdata, chunk_selection):
+        """Decode the items of a chunk selected via integer arrays, as for numpy advanced
+        indexing, only retrieving and decompressing the Blosc blocks which hold the
+        selected items."""
+
+        # flat offsets of the selected items, shaped as the selected data
+        offsets = np.ravel_multi_index(chunk_selection, self._chunks)
+        chunk_nitems = int(np.prod(self._chunks, dtype=int))
+        n_per_block = cdata.n_per_block or chunk_nitems  # N.B., None if single block
+        blocks = offsets // n_per_block
+        read_blocks = np.unique(blocks)
+        cdata.read_parts([(block * n_per_block, 1) for block in read_blocks.tolist()])
+
+        # decompress runs of consecutive blocks, each block is decompressed into
+        # consecutive regions of the decoded buffer
+        decoded = np.empty(len(read_blocks) * n_per_block, dtype=self._dtype)
+        flat = decoded.view('u1')
+        itemsize = self._dtype.itemsize
+        breaks = (np.nonzero(np.diff(read_blocks) > 1)[0] + 1).tolist()
+        for i, j in zip([0] + breaks, breaks + [len(read_blocks)]):
+            start = int(read_blocks[i]) * n_per_block
+            nitems = min((j - i) * n_per_block, chunk_nitems - start)
+            offset = i * n_per_block * itemsize
+            self._compressor.decode_partial(cdata.buff, start, nitems,
+                                            out=flat[offset:offset + nitems * itemsize])
+
+        # select items from the decoded blocks
+        index = np.searchsorted(read_blocks, blocks) * n_per_block + offsets % n_per_block
+        return decoded[index]
+
+    def _process_decoded_chunk(self, out, chunk, chunk_selection, drop_axes, fields,
+                               out_selection):
+        """Take a decoded chunk and fill output array"""
 
         # select data from chunk
         if fields:
@@ -1780,11 +2955,28 @@ class Array:
         except TypeError:
             out_is_ndarray = False
 
-        assert len(chunk_coords) == len(self._cdata_shape)
+        assert len(chunk_coords) == len(self._shape)
 
         # obtain key for chunk
         ckey = self._chunk_key(chunk_coords)
 
+        chunk = self._cached_chunk(ckey)
+        if chunk is not None:
+            self._process_decoded_chunk(out, chunk, chunk_selection, drop_axes,
+                                        fields, out_selection)
+            return
+
+        if self._use_partial_read(fields):
+            # compressed data for chunk are read from the store on demand
+            if ckey in self.chunk_store:
+                cdata = PartialReadBuffer(ckey, self.chunk_store)
+                self._process_chunk(out, cdata, chunk_selection, drop_axes,
+                                    out_is_ndarray, fields, out_selection,
+                                    partial_read_decode=True)
+            elif self._fill_value is not None:
+                out[out_selection] = self._fill_value
+            return
+
         try:
             # obtain compressed data for chunk
             cdata = self.chunk_store[ckey]
@@ -1799,8 +2991,27 @@ class Array:
                 out[out_selection] = fill_value
 
         else:
-            self._process_chunk(out, cdata, chunk_selection, drop_axes,
-                                out_is_ndarray, fields, out_selection)
+            if self._chunk_cache is None:
+                self._process_chunk(out, cdata, chunk_selection, drop_axes,
+                                    out_is_ndarray, fields, out_selection)
+            else:
+                chunk = self._cache_chunk(ckey, cdata)
+                self._process_decoded_chunk(out, chunk, chunk_selection, drop_axes,
+                                            fields, out_selection)
+
+    def _use_partial_read(self, fields=None):
+        # whether chunks can be partially decoded from byte ranges read from the store
+        return (
+            self._chunk_cache is None
+            and self._partial_decompress
+            and self._compressor
+            and self._compressor.codec_id == "blosc"
+            and hasattr(self._compressor, "decode_partial")
+            and not self._filters
+            and self._order == 'C'
+            and not fields
+            and self.dtype != object
+        )
 
     def _chunk_getitems(self, lchunk_coords, lchunk_selection, out, lout_selection,
                         drop_axes=None, fields=None):
@@ -1809,33 +3020,53 @@ class Array:
         This gets called where the storage supports ``getitems``, so that
         it can decide how to fetch the keys, allowing concurrency.
         """
-        out_is_ndarray = True
-        try:
-            out = ensure_ndarray(out)
-        except TypeError:  # pragma: no cover
-            out_is_ndarray = False
-
         ckeys = [self._chunk_key(ch) for ch in lchunk_coords]
-        if (
-            self._partial_decompress
-            and self._compressor
-            and self._compressor.codec_id == "blosc"
-            and hasattr(self._compressor, "decode_partial")
-            and not fields
-            and self.dtype != object
-            and hasattr(self.chunk_store, "getitems")
-        ):
+
+        # use cached chunks where possible
+        chunks = self._cached_chunks(ckeys)
+        fetch_ckeys = [ckey for ckey in ckeys if ckey not in chunks]
+
+        if self._use_partial_read(fields):
             partial_read_decode = True
             cdatas = {
                 ckey: PartialReadBuffer(ckey, self.chunk_store)
-                for ckey in ckeys
+                for ckey in fetch_ckeys
                 if ckey in self.chunk_store
             }
         else:
             partial_read_decode = False
-            cdatas = self.chunk_store.getitems(ckeys, on_error="omit")
-        for ckey, chunk_select, out_select in zip(ckeys, lchunk_selection, lout_selection):
-            if ckey in cdatas:
+            if fetch_ckeys:
+                cdatas = self.chunk_store.getitems(fetch_ckeys, on_error="omit")
+            else:
+                cdatas = dict()
+
+        self._process_chunks(ckeys, cdatas, lchunk_selection, out, lout_selection,
+                             drop_axes=drop_axes, fields=fields,
+                             partial_read_decode=partial_read_decode, chunks=chunks)
+
+    def _process_chunks(self, ckeys, cdatas, lchunk_selection, out, lout_selection,
+                        drop_axes=None, fields=None, partial_read_decode=False,
+                        chunks=None):
+        """Fill output array from a mapping of chunk keys to encoded data and an
+        optional mapping of chunk keys to decoded data, where chunks missing from
+        both mappings have not been initialized."""
+        out_is_ndarray = True
+        try:
+            out = ensure_ndarray(out)
+        except TypeError:  # pragma: no cover
+            out_is_ndarray = False
+        if chunks is None:
+            chunks = dict()
+
+        def load(ckey, chunk_select, out_select):
+            if ckey in chunks:
+                self._process_decoded_chunk(out, chunks[ckey], chunk_select, drop_axes,
+                                            fields, out_select)
+            elif ckey in cdatas and self._chunk_cache is not None:
+                chunk = self._cache_chunk(ckey, cdatas[ckey])
+                self._process_decoded_chunk(out, chunk, chunk_select, drop_axes,
+                                            fields, out_select)
+            elif ckey in cdatas:
                 self._process_chunk(
                     out,
                     cdatas[ckey],
@@ -1855,12 +3086,126 @@ class Array:
                         fill_value = self._fill_value
                     out[out_select] = fill_value
 
+        executor = self._read_executor
+        if executor is None:
+            for ckey, chunk_select, out_select in zip(ckeys, lchunk_selection,
+                                                      lout_selection):
+                load(ckey, chunk_select, out_select)
+        else:
+            # decode chunks concurrently, each chunk is loaded into a region of the
+            # output array that does not overlap with the region of any other chunk
+            run_concurrently(executor, load, ckeys, lchunk_selection, lout_selection)
+
+    def _cached_chunk(self, ckey):
+        # obtain a decoded chunk held in the write-back buffer or the chunk cache
+        if self._write_buffer:
+            chunk = self._write_buffer.get(ckey)
+            if chunk is not None:
+                return chunk
+        if self._chunk_cache is not None:
+            return self._chunk_cache.get(self.chunk_store, ckey)
+        return None
+
+    def _cached_chunks(self, ckeys):
+        # obtain any decoded chunks held in the write-back buffer or the chunk cache
+        if not self._write_buffer and self._chunk_cache is None:
+            return dict()
+        chunks = dict()
+        for ckey in ckeys:
+            chunk = self._cached_chunk(ckey)
+            if chunk is not None:
+                chunks[ckey] = chunk
+        return chunks
+
+    def _cache_chunk(self, ckey, cdata):
+        # decode the whole chunk and add it to the chunk cache
+        if isinstance(cdata, PartialReadBuffer):
+            cdata = cdata.read_full()
+        chunk = self._decode_chunk(cdata)
+        return self._chunk_cache.put(self.chunk_store, ckey, chunk)
+
+    def _invalidate_cached_chunks(self, ckeys):
+        # N.B., called after chunks have been modified in the store
+        if self._chunk_cache is not None:
+            self._chunk_cache.invalidate_chunks(self.chunk_store, ckeys)
+
     def _chunk_setitems(self, lchunk_coords, lchunk_selection, values, fields=None):
+        executor = self.executor
+        if executor is not None:
+            self._chunk_setitems_concurrent(executor, lchunk_coords, lchunk_selection,
+                                            values, fields=fields)
+            return
         ckeys = [self._chunk_key(co) for co in lchunk_coords]
         cdatas = [self._process_for_setitem(key, sel, val, fields=fields)
                   for key, sel, val in zip(ckeys, lchunk_selection, values)]
-        values = {k: v for k, v in zip(ckeys, cdatas)}
-        self.chunk_store.setitems(values)
+        values = {k: v for k, v in zip(ckeys, cdatas) if v is not None}
+        if values:
+            self.chunk_store.setitems(values)
+        self._chunk_delitems([k for k, v in zip(ckeys, cdatas) if v is None])
+        self._invalidate_cached_chunks(ckeys)
+
+    def _chunk_setitems_concurrent(self, executor, lchunk_coords, lchunk_selection,
+                                   values, fields=None):
+        """As _chunk_setitems, but encoding chunks concurrently.
+
+        Chunks are prepared in the calling thread, i.e., existing chunk data are
+        retrieved and modified if required, and then encoded via `executor`. Encoded
+        chunks are written to the store as soon as they are ready, while subsequent
+        chunks are still being encoded. If the array has a synchronizer, the lock for
+        each chunk is held from preparation of the chunk until it has been stored.
+        """
+
+        # limit the number of chunks held in memory awaiting encoding
+        max_pending = 2 * (os.cpu_count() or 1)
+        pending = dict()
+
+        def store(future):
+            ckey, lock = pending.pop(future)
+            try:
+                self.chunk_store[ckey] = self._ensure_cdata(future.result())
+                self._invalidate_cached_chunks([ckey])
+            finally:
+                lock.__exit__(None, None, None)
+
+        try:
+            for chunk_coords, chunk_selection, value in zip(lchunk_coords,
+                                                            lchunk_selection, values):
+                ckey = self._chunk_key(chunk_coords)
+                if self._synchronizer is None:
+                    lock = nolock
+                else:
+                    lock = self._synchronizer[ckey]
+                lock.__enter__()
+                try:
+                    chunk = self._chunk_for_setitem(ckey, chunk_selection, value,
+                                                    fields=fields)
+                    if self._is_empty_chunk(chunk):
+                        self._chunk_delitems([ckey])
+                        self._invalidate_cached_chunks([ckey])
+                        future = None
+                    else:
+                        future = executor.submit(_encode_chunk_data, chunk,
+                                                 self._filters, self._compressor)
+                except BaseException:
+                    lock.__exit__(None, None, None)
+                    raise
+                if future is None:
+                    lock.__exit__(None, None, None)
+                    continue
+                pending[future] = ckey, lock
+                if len(pending) >= max_pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        store(future)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    store(future)
+        finally:
+            # clean up after an error
+            for future, (_, lock) in pending.items():
+                future.cancel()
+                lock.__exit__(None, None, None)
 
     def _chunk_setitem(self, chunk_coords, chunk_selection, value, fields=None):
         """Replace part or whole of a chunk.
@@ -1890,11 +3235,52 @@ class Array:
 
     def _chunk_setitem_nosync(self, chunk_coords, chunk_selection, value, fields=None):
         ckey = self._chunk_key(chunk_coords)
+        if self._write_buffer is not None:
+            self._buffer_chunk_setitem(ckey, chunk_selection, value, fields=fields)
+            return
         cdata = self._process_for_setitem(ckey, chunk_selection, value, fields=fields)
         # store
-        self.chunk_store[ckey] = cdata
+        if cdata is None:
+            self._chunk_delitems([ckey])
+        else:
+            self.chunk_store[ckey] = cdata
+        self._invalidate_cached_chunks([ckey])
 
     def _process_for_setitem(self, ckey, chunk_selection, value, fields=None):
+        # N.B., returns None if the chunk only contains the fill value and need not be
+        # stored
+        chunk = self._chunk_for_setitem(ckey, chunk_selection, value, fields=fields)
+        if self._is_empty_chunk(chunk):
+            return None
+        return self._encode_chunk(chunk)
+
+    def _is_empty_chunk(self, chunk):
+        return not self._write_empty_chunks and all_equal(self._fill_value, chunk)
+
+    def _chunk_delitems(self, ckeys):
+        # remove chunks which are no longer required
+        for ckey in ckeys:
+            try:
+                del self.chunk_store[ckey]
+            except KeyError:
+                # chunk not initialized
+                pass
+
+    def _chunk_for_setitem(self, ckey, chunk_selection, value, fields=None):
+        if is_total_slice(chunk_selection, self._chunks) and not fields:
+            # no need to access the existing chunk data
+            cdata = None
+        else:
+            try:
+                # obtain compressed data for chunk
+                cdata = self.chunk_store[ckey]
+            except KeyError:
+                # chunk not initialized
+                cdata = None
+        return self._modify_chunk(cdata, chunk_selection, value, fields=fields)
+
+    def _modify_chunk(self, cdata, chunk_selection, value, fields=None):
+        # N.B., cdata is None if the chunk has not been initialized
         if is_total_slice(chunk_selection, self._chunks) and not fields:
             # totally replace chunk
 
@@ -1915,12 +3301,7 @@ class Array:
         else:
             # partially replace the contents of this chunk
 
-            try:
-
-                # obtain compressed data for chunk
-                cdata = self.chunk_store[ckey]
-
-            except KeyError:
+            if cdata is None:
 
                 # chunk not initialized
                 if self._fill_value is not None:
@@ -1948,23 +3329,16 @@ class Array:
             else:
                 chunk[chunk_selection] = value
 
-        # encode chunk
-        return self._encode_chunk(chunk)
+        return chunk
 
     def _chunk_key(self, chunk_coords):
-        return self._key_prefix + '.'.join(map(str, chunk_coords))
+        # N.B., the single chunk of a zero-dimensional array has key '0'
+        return self._key_prefix + '.'.join(map(str, chunk_coords or (0,)))
 
-    def _decode_chunk(self, cdata, start=None, nitems=None, expected_shape=None):
+    def _decode_chunk(self, cdata):
         # decompress
         if self._compressor:
-            # only decode requested items
-            if (
-                all([x is not None for x in [start, nitems]])
-                and self._compressor.codec_id == "blosc"
-            ) and hasattr(self._compressor, "decode_partial"):
-                chunk = self._compressor.decode_partial(cdata, start, nitems)
-            else:
-                chunk = self._compressor.decode(cdata)
+            chunk = self._compressor.decode(cdata)
         else:
             chunk = cdata
 
@@ -1989,31 +3363,18 @@ class Array:
 
         # ensure correct chunk shape
         chunk = chunk.reshape(-1, order='A')
-        chunk = chunk.reshape(expected_shape or self._chunks, order=self._order)
+        chunk = chunk.reshape(self._chunks, order=self._order)
 
         return chunk
 
     def _encode_chunk(self, chunk):
+        cdata = _encode_chunk_data(chunk, self._filters, self._compressor)
+        return self._ensure_cdata(cdata)
 
-        # apply filters
-        if self._filters:
-            for f in self._filters:
-                chunk = f.encode(chunk)
-
-        # check object encoding
-        if ensure_ndarray(chunk).dtype == object:
-            raise RuntimeError('cannot write object array without object codec')
-
-        # compress
-        if self._compressor:
-            cdata = self._compressor.encode(chunk)
-        else:
-            cdata = chunk
-
+    def _ensure_cdata(self, cdata):
         # ensure in-memory data is immutable and easy to compare
         if isinstance(self.chunk_store, dict):
             cdata = ensure_bytes(cdata)
-
         return cdata
 
     def __repr__(self):
@@ -2250,11 +3611,15 @@ class Array:
                 pass  # keep the chunk
             else:
                 key = self._chunk_key(cidx)
+                if self._write_buffer and key in self._write_buffer:
+                    self._write_buffer_size -= self._write_buffer.pop(key).nbytes
                 try:
                     del chunk_store[key]
                 except KeyError:
                     # chunk not initialized
                     pass
+                else:
+                    self._invalidate_cached_chunks([key])
 
     def append(self, data, axis=0):
         """Append `data` to `axis`.
@@ -2331,6 +3696,124 @@ class Array:
 
         return new_shape
 
+    @contextlib.contextmanager
+    def write_back(self, max_size=2**28):
+        """Context manager within which modified chunks are buffered in memory, so that
+        repeated writes to the same chunk do not each require the chunk to be
+        retrieved, decoded, encoded and stored.
+
+        Parameters
+        ----------
+        max_size : int, optional
+            Maximum total size in bytes of buffered chunks. When exceeded, least
+            recently modified chunks are encoded and stored until the buffer fits.
+
+        Notes
+        -----
+        Buffered chunks are stored on exit from the context and by calling
+        :func:`Array.flush`. Reads via this array see buffered data, however other
+        arrays, including views of this array, and operations which access the store
+        directly, such as :func:`Array.digest` or the `nchunks_initialized`
+        property, only see data once it has been stored. Write-back mode is not
+        suitable where other processes or arrays modify the same chunks
+        concurrently. If write-back mode is already active, entering the context
+        has no further effect.
+
+        Examples
+        --------
+        >>> import zarr
+        >>> import numpy as np
+        >>> z = zarr.zeros((1000, 10), chunks=(1000, 10), dtype='i4')
+        >>> with z.write_back():
+        ...     for i in range(1000):
+        ...         z[i] = i
+        ...     z.nchunks_initialized
+        ...     int(z[999, 0])
+        0
+        999
+        >>> z.nchunks_initialized
+        1
+
+        """
+        if self._write_buffer is not None:
+            yield self
+            return
+        self._write_buffer = collections.OrderedDict()
+        self._write_buffer_size = 0
+        self._write_buffer_max_size = max_size
+        try:
+            yield self
+        finally:
+            try:
+                self.flush()
+            finally:
+                self._write_buffer = None
+
+    def flush(self):
+        """Store any chunks which have been modified in write-back mode. See
+        :func:`Array.write_back`."""
+        if self._write_buffer:
+            self._flush_chunks(list(self._write_buffer))
+
+    def _buffer_chunk_setitem(self, ckey, chunk_selection, value, fields=None):
+        # modify a chunk held in the write-back buffer, retrieving the chunk if it is
+        # not already buffered
+        chunk = self._write_buffer.get(ckey)
+        if chunk is None:
+            chunk = self._chunk_for_setitem(ckey, chunk_selection, value, fields=fields)
+            if not chunk.flags.writeable or np.may_share_memory(chunk, value):
+                chunk = chunk.copy(order='K')
+            self._write_buffer_size += chunk.nbytes
+        else:
+            self._write_buffer.move_to_end(ckey)
+            if fields:
+                chunk[fields][chunk_selection] = value
+            else:
+                chunk[chunk_selection] = value
+        self._write_buffer[ckey] = chunk
+
+        # evict least recently modified chunks
+        if self._write_buffer_size > self._write_buffer_max_size:
+            ckeys = []
+            size = self._write_buffer_size
+            for k, c in self._write_buffer.items():
+                if size <= self._write_buffer_max_size:
+                    break
+                ckeys.append(k)
+                size -= c.nbytes
+            self._flush_chunks(ckeys)
+
+    def _flush_chunks(self, ckeys):
+        # encode and store chunks held in the write-back buffer
+        chunks = [self._write_buffer[k] for k in ckeys]
+        empty_ckeys = [k for k, c in zip(ckeys, chunks) if self._is_empty_chunk(c)]
+        if empty_ckeys:
+            self._chunk_delitems(empty_ckeys)
+            self._invalidate_cached_chunks(empty_ckeys)
+            for ckey in empty_ckeys:
+                self._write_buffer_size -= self._write_buffer.pop(ckey).nbytes
+            ckeys = [k for k in ckeys if k in self._write_buffer]
+            chunks = [self._write_buffer[k] for k in ckeys]
+        encode = functools.partial(_encode_chunk_data, filters=self._filters,
+                                   compressor=self._compressor)
+        executor = self.executor
+        if executor is None:
+            cdatas = [encode(c) for c in chunks]
+        else:
+            cdatas = run_concurrently(executor, encode, chunks)
+        cdatas = [self._ensure_cdata(c) for c in cdatas]
+        if self._synchronizer is None and hasattr(self.chunk_store, "setitems"):
+            self.chunk_store.setitems(dict(zip(ckeys, cdatas)))
+        else:
+            for ckey, cdata in zip(ckeys, cdatas):
+                lock = nolock if self._synchronizer is None else self._synchronizer[ckey]
+                with lock:
+                    self.chunk_store[ckey] = cdata
+        self._invalidate_cached_chunks(ckeys)
+        for ckey, chunk in zip(ckeys, chunks):
+            del self._write_buffer[ckey]
+            self._write_buffer_size -= chunk.nbytes
+
     def view(self, shape=None, chunks=None, dtype=None,
              fill_value=None, filters=None, read_only=None,
              synchronizer=None):
@@ -2449,7 +3932,9 @@ class Array:
         if synchronizer is None:
             synchronizer = self._synchronizer
         a = Array(store=store, path=path, chunk_store=chunk_store, read_only=read_only,
-                  synchronizer=synchronizer, cache_metadata=True)
+                  synchronizer=synchronizer, cache_metadata=True,
+                  executor=self._executor, prefetch=self._prefetch,
+                  write_empty_chunks=self._write_empty_chunks)
         a._is_view = True
 
         # allow override of some properties
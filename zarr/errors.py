@@ -63,6 +63,11 @@ class BoundsCheckError(_BaseZarrIndexError):
     _msg = "index out of bounds for dimension with length {0}"
 
 
+class StalePlanError(_BaseZarrError):
+    _msg = ("selection plan is stale; the shape or chunks of the array have changed "
+            "since the plan was compiled")
+
+
 class NegativeStepError(IndexError):
     def __init__(self):
         super().__init__("only slices with step >= 1 are supported")
@@ -1,4 +1,5 @@
 import collections
+import copy
 import itertools
 import math
 import numbers
@@ -12,6 +13,7 @@ from zarr.errors import (
     err_too_many_indices,
     VindexInvalidSelectionError,
     BoundsCheckError,
+    StalePlanError,
 )
 
 
@@ -41,6 +43,19 @@ def is_scalar(value, dtype):
     return False
 
 
+def is_item_selection(selection, shape):
+    """Return True if `selection` selects a single item of an array with the given
+    `shape`, via an integer for each dimension."""
+    if not isinstance(selection, tuple):
+        return len(shape) == 1 and is_integer(selection)
+    # N.B., checking for int first avoids the slower abstract base class check in
+    # the common case
+    return (
+        len(selection) == len(shape) and
+        all(type(dim_sel) is int or is_integer(dim_sel) for dim_sel in selection)
+    )
+
+
 def normalize_integer_selection(dim_sel, dim_len):
 
     # normalize type to int
@@ -117,12 +132,25 @@ class SliceDimIndexer(object):
 
     def __iter__(self):
 
-        # figure out the range of chunks we need to visit
-        dim_chunk_ix_from = self.start // self.dim_chunk_len
-        dim_chunk_ix_to = ceildiv(self.stop, self.dim_chunk_len)
+        # nothing to visit if no items are selected
+        if self.nitems == 0:
+            return
+
+        # figure out the chunks we need to visit, i.e., the chunks holding at least
+        # one selected item
+        dim_sel_last = self.start + (self.nitems - 1) * self.step
+        if self.step >= self.dim_chunk_len:
+            # each chunk holds at most one selected item
+            dim_chunk_ixs = range(self.start, dim_sel_last + 1, self.step)
+            dim_chunk_ixs = (ix // self.dim_chunk_len for ix in dim_chunk_ixs)
+        else:
+            # consecutive selected items are closer than the length of a chunk, so
+            # every chunk from the first to the last selected item holds one
+            dim_chunk_ixs = range(self.start // self.dim_chunk_len,
+                                  dim_sel_last // self.dim_chunk_len + 1)
 
-        # iterate over chunks in range
-        for dim_chunk_ix in range(dim_chunk_ix_from, dim_chunk_ix_to):
+        # iterate over chunks
+        for dim_chunk_ix in dim_chunk_ixs:
 
             # compute offsets for chunk within overall array
             dim_offset = dim_chunk_ix * self.dim_chunk_len
@@ -609,6 +637,18 @@ class OIndex(object):
         selection = replace_lists(selection)
         return self.array.set_orthogonal_selection(selection, value, fields=fields)
 
+    def plan(self, selection):
+        """Compile an orthogonal selection into a reusable :class:`SelectionPlan`, see
+        :func:`zarr.core.Array.plan`."""
+        fields, selection = pop_fields(selection)
+        selection = ensure_tuple(selection)
+        selection = replace_lists(selection)
+        # noinspection PyProtectedMember
+        if not self.array._cache_metadata:
+            self.array._load_metadata()
+        return SelectionPlan(self.array, OrthogonalIndexer(selection, self.array),
+                             fields=fields)
+
 
 # noinspection PyProtectedMember
 def is_coordinate_selection(selection, array):
@@ -727,7 +767,11 @@ class CoordinateIndexer(object):
 
 
 # noinspection PyProtectedMember
-class MaskIndexer(CoordinateIndexer):
+class MaskIndexer(object):
+    """Indexer for a Boolean mask selection, which visits the chunks of the array one
+    at a time and computes the selected coordinates within each chunk on demand,
+    so that memory use is bounded by the size of a chunk rather than the number of
+    selected items."""
 
     def __init__(self, selection, array):
 
@@ -741,11 +785,56 @@ class MaskIndexer(CoordinateIndexer):
                              'array with the same shape as the target array, got {!r}'
                              .format(selection))
 
-        # convert to indices
-        selection = np.nonzero(selection[0])
+        # number of selected items in each line along the last dimension, and the
+        # number of items selected before the start of each line
+        mask = selection[0]
+        line_nitems = np.asarray(np.count_nonzero(mask, axis=-1), dtype=np.intp)
+        line_offsets = np.cumsum(line_nitems.reshape(-1)) - line_nitems.reshape(-1)
 
-        # delegate the rest to superclass
-        super().__init__(selection, array)
+        # store attributes
+        self.mask = mask
+        self.line_offsets = line_offsets.reshape(line_nitems.shape)
+        self.shape = (int(line_nitems.sum()),)
+        self.drop_axes = None
+        self.array = array
+
+    def __iter__(self):
+        chunks = self.array._chunks
+        cdata_shape = self.array._cdata_shape
+
+        # iterate over blocks of chunks sharing the same lines along the last dimension
+        for outer_coords in itertools.product(*[range(n) for n in cdata_shape[:-1]]):
+            outer_selection = tuple(
+                slice(dim_chunk_ix * dim_chunk_len, (dim_chunk_ix + 1) * dim_chunk_len)
+                for dim_chunk_ix, dim_chunk_len in zip(outer_coords, chunks)
+            )
+
+            # number of items selected before the current chunk in each line
+            line_offsets = np.array(self.line_offsets[outer_selection])
+
+            for dim_chunk_ix in range(cdata_shape[-1]):
+                dim_offset = dim_chunk_ix * chunks[-1]
+                chunk_mask = self.mask[outer_selection +
+                                       (slice(dim_offset, dim_offset + chunks[-1]),)]
+                chunk_selection = np.nonzero(chunk_mask)
+                nitems = len(chunk_selection[-1])
+                if nitems == 0:
+                    continue
+
+                # output position of each item is the offset of its line plus its
+                # rank within the line
+                line_ranks = np.cumsum(chunk_mask, axis=-1, dtype=np.intp)
+                out_selection = (line_offsets[chunk_selection[:-1]] +
+                                 line_ranks[chunk_selection] - 1)
+                line_offsets += line_ranks[..., -1]
+
+                # items are selected in order, use a slice if they are contiguous
+                out_start = int(out_selection[0])
+                if int(out_selection[-1]) - out_start + 1 == nitems:
+                    out_selection = slice(out_start, out_start + nitems)
+
+                chunk_coords = outer_coords + (dim_chunk_ix,)
+                yield ChunkProjection(chunk_coords, chunk_selection, out_selection)
 
 
 class VIndex(object):
@@ -775,6 +864,185 @@ class VIndex(object):
         else:
             raise VindexInvalidSelectionError(selection)
 
+    def plan(self, selection):
+        """Compile a coordinate or mask selection into a reusable :class:`SelectionPlan`,
+        see :func:`zarr.core.Array.plan`."""
+        fields, selection = pop_fields(selection)
+        selection = ensure_tuple(selection)
+        selection = replace_lists(selection)
+        # noinspection PyProtectedMember
+        if not self.array._cache_metadata:
+            self.array._load_metadata()
+        if is_coordinate_selection(selection, self.array):
+            indexer = CoordinateIndexer(selection, self.array)
+            return SelectionPlan(self.array, indexer, fields=fields,
+                                 sel_shape=indexer.sel_shape)
+        elif is_mask_selection(selection, self.array):
+            return SelectionPlan(self.array, MaskIndexer(selection, self.array),
+                                 fields=fields)
+        else:
+            raise VindexInvalidSelectionError(selection)
+
+
+def _max_chunk_index(dim_chunk_sel):
+    # largest index within a chunk touched by one dimension of a chunk selection
+    if is_integer(dim_chunk_sel):
+        return dim_chunk_sel
+    elif is_slice(dim_chunk_sel):
+        return range(dim_chunk_sel.start, dim_chunk_sel.stop, dim_chunk_sel.step or 1)[-1]
+    elif dim_chunk_sel.dtype == bool:
+        return int(np.flatnonzero(dim_chunk_sel)[-1])
+    else:
+        return int(dim_chunk_sel.max())
+
+
+# noinspection PyProtectedMember
+class SelectionPlan(object):
+    """A selection compiled against the shape and chunk layout of an array, holding
+    the chunk keys and the chunk and output selections needed to retrieve it. A plan
+    can be executed any number of times via :func:`SelectionPlan.get`, skipping the
+    indexing machinery on each call. Plans are created via :func:`zarr.core.Array.plan`,
+    ``Array.oindex.plan`` or ``Array.vindex.plan``.
+
+    A plan is only valid while the shape and chunks of the array are unchanged;
+    executing a plan after the array has been resized raises
+    :class:`zarr.errors.StalePlanError`.
+
+    """
+
+    def __init__(self, array, indexer, fields=None, sel_shape=None):
+        self.array = array
+        self._array_shape = array._shape
+        self._array_chunks = array._chunks
+        self._fields = fields
+        self._dtype = check_fields(fields, array._dtype)
+        self._projections = tuple(indexer)
+        self._chunk_keys = tuple(array._chunk_key(p.chunk_coords)
+                                 for p in self._projections)
+        self._shape = indexer.shape
+        self._drop_axes = indexer.drop_axes
+        self._sel_shape = sel_shape
+
+    @property
+    def out_shape(self):
+        """Shape of the array returned by :func:`SelectionPlan.get`."""
+        if self._sel_shape is None:
+            return self._shape
+        return self._sel_shape
+
+    @property
+    def dtype(self):
+        """Data type of the array returned by :func:`SelectionPlan.get`."""
+        return self._dtype
+
+    @property
+    def chunk_keys(self):
+        """Storage keys of the chunks holding selected items."""
+        return self._chunk_keys
+
+    @property
+    def chunk_selections(self):
+        """Selection to extract from each chunk, in the order of `chunk_keys`."""
+        return tuple(p.chunk_selection for p in self._projections)
+
+    @property
+    def out_selections(self):
+        """Region of the output receiving each chunk selection, in the order of
+        `chunk_keys`."""
+        return tuple(p.out_selection for p in self._projections)
+
+    # the following make a plan usable wherever an indexer is expected
+
+    @property
+    def shape(self):
+        return self._shape
+
+    @property
+    def drop_axes(self):
+        return self._drop_axes
+
+    def __iter__(self):
+        return iter(self._projections)
+
+    def __len__(self):
+        return len(self._projections)
+
+    def _check_valid(self):
+        array = self.array
+        if not array._cache_metadata:
+            array._load_metadata()
+        if array._shape != self._array_shape or array._chunks != self._array_chunks:
+            raise StalePlanError()
+
+    def get(self, out=None):
+        """Retrieve the planned selection.
+
+        Parameters
+        ----------
+        out : ndarray, optional
+            If given, load the selected data directly into this array, which must
+            have shape `out_shape`. The same buffer may be reused across calls.
+
+        Returns
+        -------
+        out : ndarray
+            A NumPy array containing the data for the planned selection.
+
+        """
+        self._check_valid()
+        if self._sel_shape is None:
+            return self.array._get_selection(indexer=self, out=out, fields=self._fields)
+        # coordinate selection, need to flatten
+        if out is not None:
+            out = out.reshape(-1)
+        out = self.array._get_selection(indexer=self, out=out, fields=self._fields)
+        return out.reshape(self._sel_shape)
+
+    def translate(self, offset):
+        """Return a plan for the same selection shifted by `offset` items along each
+        dimension. The offset must be a multiple of the chunk length in every
+        dimension, so that only chunk keys change and all chunk and output selections
+        are shared with this plan.
+
+        Parameters
+        ----------
+        offset : int or tuple of ints
+            Number of items to shift the selection by, per dimension.
+
+        Returns
+        -------
+        plan : SelectionPlan
+
+        """
+        self._check_valid()
+        offset = ensure_tuple(offset)
+        if len(offset) != len(self._array_shape):
+            raise ValueError('offset must have one item per dimension; expected {}, got {}'
+                             .format(len(self._array_shape), len(offset)))
+        shift = []
+        for o, c in zip(offset, self._array_chunks):
+            if not is_integer(o) or o % c:
+                raise ValueError('offset must be a multiple of the chunk length in each '
+                                 'dimension; got offset {!r} for chunks {!r}'
+                                 .format(offset, self._array_chunks))
+            shift.append(o // c)
+
+        projections = []
+        for p in self._projections:
+            chunk_coords = tuple(ix + s for ix, s in zip(p.chunk_coords, shift))
+            for ix, dim_chunk_sel, dim_len, dim_chunk_len in \
+                    zip(chunk_coords, p.chunk_selection, self._array_shape,
+                        self._array_chunks):
+                if ix < 0 or ix * dim_chunk_len + _max_chunk_index(dim_chunk_sel) >= dim_len:
+                    raise BoundsCheckError(dim_len)
+            projections.append(ChunkProjection(chunk_coords, p.chunk_selection,
+                                               p.out_selection))
+
+        plan = copy.copy(self)
+        plan._projections = tuple(projections)
+        plan._chunk_keys = tuple(self.array._chunk_key(p.chunk_coords) for p in projections)
+        return plan
+
 
 def check_fields(fields, dtype):
     # early out
@@ -835,8 +1103,9 @@ def make_slice_selection(selection):
         if is_integer(dim_selection):
             ls.append(slice(dim_selection, dim_selection + 1, 1))
         elif isinstance(dim_selection, np.ndarray):
-            if len(dim_selection) == 1:
-                ls.append(slice(dim_selection[0], dim_selection[0] + 1, 1))
+            if dim_selection.size == 1:
+                x = int(dim_selection.reshape(-1)[0])
+                ls.append(slice(x, x + 1, 1))
             else:
                 raise ArrayIndexError()
         else:
@@ -857,7 +1126,13 @@ class PartialChunkIterator(object):
     Attributes
     -----------
     arr_shape
-    selection
+    out_shape : tuple of ints
+        Shape of the selected data, including any dimensions selected with an
+        integer.
+    starts : ndarray
+        Offsets in the flattened chunk of each run of selected elements.
+    nitems : int
+        Number of elements in each run.
 
     Returns
     -------
@@ -867,76 +1142,73 @@ class PartialChunkIterator(object):
         elements offset in the chunk to read from
     nitems: int
         number of elements to read in the chunk from start
-    partial_out_selection: list of slices
-        indices of a temporary empty array of size `Array._chunks` to assign
-        the decompressed data to after the partial read.
+    offset: int
+        elements offset in the flattened selected data to write the decompressed
+        data to.
 
     Notes
     -----
-    An array is flattened when compressed with blosc, so this iterator takes
-    the wanted selection of an array and determines the wanted coordinates
-    of the flattened, compressed data to be read and then decompressed. The
-    decompressed data is then placed in a temporary empty array of size
-    `Array._chunks` at the indices yielded as partial_out_selection.
-    Once all the slices yielded by this iterator have been read, decompressed
-    and written to the temporary array, the wanted slice of the chunk can be
-    indexed from the temporary array and written to the out_selection slice
-    of the out array.
+    An array is flattened in C order when compressed with blosc, so this iterator
+    takes the wanted selection of an array and determines the wanted runs of
+    contiguous elements of the flattened, compressed data to be read and then
+    decompressed. Runs are as long as possible, i.e., trailing dimensions which
+    are selected in full are merged with the dimension preceding them. The runs
+    are yielded in order, so that the decompressed data of the runs concatenated
+    form the selected data in C order.
 
     """
 
     def __init__(self, selection, arr_shape):
         selection = make_slice_selection(selection)
         self.arr_shape = arr_shape
+        ndim = len(arr_shape)
 
         # number of selection dimensions can't be greater than the number of chunk dimensions
-        if len(selection) > len(self.arr_shape):
+        if len(selection) > ndim:
             raise ValueError(
                 "Selection has more dimensions then the array:\n"
                 f"selection dimensions = {len(selection)}\n"
-                f"array dimensions = {len(self.arr_shape)}"
+                f"array dimensions = {ndim}"
             )
 
         # any selection can not be out of the range of the chunk
-        selection_shape = np.empty(self.arr_shape)[tuple(selection)].shape
-        if any(
-            [
-                selection_dim < 0 or selection_dim > arr_dim
-                for selection_dim, arr_dim in zip(selection_shape, self.arr_shape)
-            ]
-        ):
-            raise IndexError(
-                "a selection index is out of range for the dimension"
-            )  # pragma: no cover
-
-        for i, dim_size in enumerate(self.arr_shape[::-1]):
-            index = len(self.arr_shape) - (i + 1)
-            if index <= len(selection) - 1:
-                slice_size = selection_shape[index]
-                if slice_size == dim_size and index > 0:
-                    selection.pop()
-                else:
-                    break
-
-        chunk_loc_slices = []
-        last_dim_slice = None if selection[-1].step > 1 else selection.pop()
-        for arr_shape_i, sl in zip(arr_shape, selection):
-            dim_chunk_loc_slices = []
+        ranges = []
+        for sl, dim_len in zip(selection, arr_shape):
             assert isinstance(sl, slice)
-            for x in slice_to_range(sl, arr_shape_i):
-                dim_chunk_loc_slices.append(slice(x, x + 1, 1))
-            chunk_loc_slices.append(dim_chunk_loc_slices)
-        if last_dim_slice:
-            chunk_loc_slices.append([last_dim_slice])
-        self.chunk_loc_slices = list(itertools.product(*chunk_loc_slices))
+            if (sl.start or 0) > dim_len or (sl.stop or 0) > dim_len:
+                raise IndexError("a selection index is out of range for the dimension")
+            ranges.append(slice_to_range(sl, dim_len))
+        ranges += [range(dim_len) for dim_len in arr_shape[len(ranges):]]
+        self.out_shape = tuple(len(r) for r in ranges)
+
+        # number of elements between consecutive indices of each dimension
+        strides = [int(np.prod(arr_shape[i + 1:], dtype=int)) for i in range(ndim)]
+
+        # find the last dimension which is not selected in full, elements are
+        # contiguous from there on
+        dim = ndim - 1
+        while dim > 0 and ranges[dim].step == 1 and len(ranges[dim]) == arr_shape[dim]:
+            dim -= 1
+        if ranges[dim].step == 1 or len(ranges[dim]) == 1:
+            # a run spans all indices selected in this dimension
+            self.nitems = len(ranges[dim]) * strides[dim]
+            starts = np.array(ranges[dim].start * strides[dim] if ranges[dim] else 0)
+            outer = ranges[:dim]
+        else:
+            self.nitems = strides[dim]
+            starts = np.array(0)
+            outer = ranges[:dim + 1]
+
+        # offsets of runs for all combinations of indices in the outer dimensions
+        for r, stride in zip(outer, strides):
+            starts = np.add.outer(starts, np.asarray(r, dtype=np.intp) * stride)
+        if 0 in self.out_shape:
+            starts = np.zeros(0, dtype=np.intp)
+        self.starts = starts.reshape(-1)
+
+    def __len__(self):
+        return len(self.starts)
 
     def __iter__(self):
-        chunk1 = self.chunk_loc_slices[0]
-        nitems = (chunk1[-1].stop - chunk1[-1].start) * np.prod(
-            self.arr_shape[len(chunk1):], dtype=int
-        )
-        for partial_out_selection in self.chunk_loc_slices:
-            start = 0
-            for i, sl in enumerate(partial_out_selection):
-                start += sl.start * np.prod(self.arr_shape[i + 1:], dtype=int)
-            yield start, nitems, partial_out_selection
+        for i, start in enumerate(self.starts.tolist()):
+            yield start, self.nitems, i * self.nitems
@@ -11,7 +11,7 @@ from numcodecs.compat import ndarray_copy
 from numcodecs.registry import get_codec, register_codec
 
 from .meta import ZARR_FORMAT, json_dumps, json_loads
-from .storage import NestedDirectoryStore, _prog_ckey, _prog_number
+from .storage import NestedDirectoryStore, _getrange_from_value, _prog_ckey, _prog_number
 from .storage import array_meta_key as zarr_array_meta_key
 from .storage import attrs_key as zarr_attrs_key
 from .storage import group_meta_key as zarr_group_meta_key
@@ -98,6 +98,16 @@ class N5Store(NestedDirectoryStore):
 
         return super().__getitem__(key)
 
+    def getrange(self, key, start, length):
+
+        if is_chunk_key(key):
+
+            key = invert_chunk_coords(key)
+            return super().getrange(key, start, length)
+
+        # metadata are translated from N5 attributes, so must be read in full
+        return _getrange_from_value(self[key], start, length)
+
     def __setitem__(self, key, value):
 
         if key.endswith(zarr_group_meta_key):
@@ -14,9 +14,13 @@ classes may also optionally implement a `rename` method (rename all members unde
 path) and a `getsize` method (return the size in bytes of a given value).
 
 """
+import asyncio
 import atexit
 import errno
+import functools
 import glob
+import inspect
+import mmap
 import multiprocessing
 import operator
 import os
@@ -26,11 +30,14 @@ import sys
 import tempfile
 import warnings
 import zipfile
+import zlib
 from collections import OrderedDict
 from collections.abc import MutableMapping
+from contextlib import contextmanager, ExitStack
+from concurrent.futures import Future
 from os import scandir
 from pickle import PicklingError
-from threading import Lock, RLock
+from threading import Lock, RLock, local
 from typing import Optional, Union, List, Tuple, Dict
 import uuid
 import time
@@ -205,6 +212,76 @@ def getsize(store, path: Path = None) -> int:
         return -1
 
 
+def _getrange_from_value(value, start: int, length: int) -> bytes:
+    # slice a range of bytes out of a value retrieved in full from a store
+    value = ensure_contiguous_ndarray(value).view('u1')
+    return value[start:start + length].tobytes()
+
+
+def getrange(store, key: str, start: int, length: int) -> bytes:
+    """Read `length` bytes starting at byte offset `start` from the value stored under
+    `key`. If `store` provides a `getrange` method, this will be called, otherwise the
+    whole value is retrieved and the range sliced out of it. Fewer than `length` bytes
+    are returned if the range extends beyond the end of the value."""
+    if hasattr(store, 'getrange'):
+        # pass through
+        return store.getrange(key, start, length)
+    else:
+        # slow version, retrieve the whole value
+        return _getrange_from_value(store[key], start, length)
+
+
+def getranges(store, ranges: List[Tuple[str, int, int]]) -> List[bytes]:
+    """Read several byte ranges, each given as a ``(key, start, length)`` tuple, see
+    :func:`getrange`. If `store` provides a `getranges` method, this will be called,
+    allowing the store to fetch the ranges in a single request."""
+    if hasattr(store, 'getranges'):
+        # pass through
+        return store.getranges(ranges)
+    else:
+        return [getrange(store, key, start, length) for key, start, length in ranges]
+
+
+def getitems(store, keys: List[str]) -> Dict[str, bytes]:
+    """Retrieve the values stored under several keys, omitting any keys that are not
+    present. If `store` provides a `getitems` method, this will be called, allowing
+    the store to retrieve the values concurrently or in a single request."""
+    if hasattr(store, 'getitems'):
+        # pass through
+        return store.getitems(keys, on_error='omit')
+    else:
+        # slow version, retrieve one key at a time
+        values = dict()
+        for key in keys:
+            try:
+                values[key] = store[key]
+            except KeyError:
+                pass
+        return values
+
+
+def setitems(store, values: Dict[str, bytes]) -> None:
+    """Store several values, given as a mapping from keys to values. If `store`
+    provides a `setitems` method, this will be called, otherwise each value is stored
+    in turn."""
+    if hasattr(store, 'setitems'):
+        # pass through
+        store.setitems(values)
+    else:
+        # slow version, store one value at a time
+        for key, value in values.items():
+            store[key] = value
+
+
+def is_async_store(store) -> bool:
+    """Return True if `store` provides ``getitems`` and ``setitems`` coroutines, i.e.,
+    can be used directly by the coroutine methods of :class:`zarr.core.Array`."""
+    return (
+        inspect.iscoroutinefunction(getattr(store, 'getitems', None)) and
+        inspect.iscoroutinefunction(getattr(store, 'setitems', None))
+    )
+
+
 def _require_parent_group(
     path: Optional[str],
     store: MutableMapping,
@@ -606,6 +683,10 @@ class MemoryStore(MutableMapping):
             else:
                 return value
 
+    def getrange(self, item: str, start: int, length: int) -> bytes:
+        # values are held in memory, so only the requested range is copied
+        return _getrange_from_value(self[item], start, length)
+
     def __setitem__(self, item: str, value):
         with self.write_mutex:
             parent, key = self._require_parent(item)
@@ -743,6 +824,9 @@ class DirectoryStore(MutableMapping):
         case-insensitive file system. Default value is False.
     dimension_separator : {'.', '/'}, optional
         Separator placed between the dimensions of a chunk.
+    memory_map : bool, optional
+        If True, values are read by memory-mapping files, and are returned as
+        read-only memoryviews rather than bytes, which avoids copying data.
 
     Examples
     --------
@@ -785,11 +869,19 @@ class DirectoryStore(MutableMapping):
     completed. Files are only held open while they are being read or written and are
     closed immediately afterwards, so there is no need to manually close any files.
 
+    If `memory_map` is True, reading a selection of an array which has no compressor
+    or filters copies data from the mapped files only once. A selection lying within
+    a single chunk is returned as a read-only view of the mapped file, without
+    copying. As values are written by replacing files, existing mappings continue to
+    refer to the data which was read. Memory-mapped files cannot be replaced on
+    Windows, so `memory_map` is only suitable for reading there.
+
     Safe to write in multiple threads or processes.
 
     """
 
-    def __init__(self, path, normalize_keys=False, dimension_separator=None):
+    def __init__(self, path, normalize_keys=False, dimension_separator=None,
+                 memory_map=False):
 
         # guard conditions
         path = os.path.abspath(path)
@@ -798,6 +890,7 @@ class DirectoryStore(MutableMapping):
 
         self.path = path
         self.normalize_keys = normalize_keys
+        self.memory_map = memory_map
         self._dimension_separator = dimension_separator
 
     def _normalize_key(self, key):
@@ -817,6 +910,11 @@ class DirectoryStore(MutableMapping):
         file reading logic.
         """
         with open(fn, 'rb') as f:
+            if self.memory_map:
+                # N.B., the mapping remains valid after the file is closed
+                if os.fstat(f.fileno()).st_size == 0:
+                    return b''
+                return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
             return f.read()
 
     def _tofile(self, a, fn):
@@ -845,6 +943,16 @@ class DirectoryStore(MutableMapping):
         else:
             raise KeyError(key)
 
+    def getrange(self, key, start, length):
+        key = self._normalize_key(key)
+        filepath = os.path.join(self.path, key)
+        if os.path.isfile(filepath):
+            with open(filepath, 'rb') as f:
+                f.seek(start)
+                return f.read(length)
+        else:
+            raise KeyError(key)
+
     def __setitem__(self, key, value):
         key = self._normalize_key(key)
 
@@ -1094,6 +1202,26 @@ class FSStore(MutableMapping):
         except self.exceptions as e:
             raise KeyError(key) from e
 
+    def getrange(self, key, start, length):
+        key = self._normalize_key(key)
+        path = self.map._key_to_str(key)
+        try:
+            return self.fs.read_block(path, start, length)
+        except self.exceptions as e:
+            raise KeyError(key) from e
+
+    def getranges(self, ranges):
+        if not hasattr(self.fs, 'cat_ranges'):
+            return [self.getrange(key, start, length) for key, start, length in ranges]
+        # retrieve all ranges concurrently where the file system supports it
+        paths = [self.map._key_to_str(self._normalize_key(key)) for key, _, _ in ranges]
+        starts = [start for _, start, _ in ranges]
+        ends = [start + length for _, start, length in ranges]
+        try:
+            return self.fs.cat_ranges(paths, starts, ends)
+        except self.exceptions as e:
+            raise KeyError(ranges[0][0]) from e
+
     def setitems(self, values):
         if self.mode == 'r':
             raise ReadOnlyError()
@@ -1249,6 +1377,9 @@ class NestedDirectoryStore(DirectoryStore):
     dimension_separator : {'/'}, optional
         Separator placed between the dimensions of a chunk.
         Only supports "/" unlike other implementations.
+    memory_map : bool, optional
+        If True, values are read by memory-mapping files, see
+        :class:`DirectoryStore`.
 
     Examples
     --------
@@ -1305,8 +1436,9 @@ class NestedDirectoryStore(DirectoryStore):
 
     """
 
-    def __init__(self, path, normalize_keys=False, dimension_separator="/"):
-        super().__init__(path, normalize_keys=normalize_keys)
+    def __init__(self, path, normalize_keys=False, dimension_separator="/",
+                 memory_map=False):
+        super().__init__(path, normalize_keys=normalize_keys, memory_map=memory_map)
         if dimension_separator is None:
             dimension_separator = "/"
         elif dimension_separator != "/":
@@ -1318,6 +1450,10 @@ class NestedDirectoryStore(DirectoryStore):
         key = _nested_map_ckey(key)
         return super().__getitem__(key)
 
+    def getrange(self, key, start, length):
+        key = _nested_map_ckey(key)
+        return super().getrange(key, start, length)
+
     def __setitem__(self, key, value):
         key = _nested_map_ckey(key)
         super().__setitem__(key, value)
@@ -1512,6 +1648,17 @@ class ZipStore(MutableMapping):
             with self.zf.open(key) as f:  # will raise KeyError
                 return f.read()
 
+    def getrange(self, key, start, length):
+        with self.mutex:
+            info = self.zf.getinfo(key)  # will raise KeyError
+            with self.zf.open(info) as f:
+                # N.B., seeking within a compressed entry decompresses everything
+                # before the offset, only stored entries allow direct access
+                if info.compress_type == zipfile.ZIP_STORED:
+                    f.seek(start)
+                    return f.read(length)
+                return _getrange_from_value(f.read(), start, length)
+
     def __setitem__(self, key, value):
         if self.mode == 'r':
             raise ReadOnlyError()
@@ -1981,6 +2128,17 @@ class LMDBStore(MutableMapping):
             raise KeyError(key)
         return value
 
+    def getrange(self, key, start, length):
+        if isinstance(key, str):
+            key = key.encode("ascii")
+        # with buffers the value is a view into the memory map, so only the requested
+        # range is copied, which must happen before the transaction ends
+        with self.db.begin(buffers=True) as txn:
+            value = txn.get(key)
+            if value is None:
+                raise KeyError(key)
+            return bytes(value[start:start + length])
+
     def __setitem__(self, key, value):
         if isinstance(key, str):
             key = key.encode("ascii")
@@ -2026,12 +2184,231 @@ class LMDBStore(MutableMapping):
         return self.db.stat()['entries']
 
 
+class LRUPolicy:
+    """Cache policy evicting the least recently used value, and admitting every value.
+    This is the default policy of :class:`LRUStoreCache`.
+
+    A policy tracks the keys of the values held by a cache and decides which values
+    are cached and evicted. Policies are called by the cache with its lock held, via
+    the following methods, which other policies must also implement: ``hit(key)``
+    when a cached value is requested, ``miss(key)`` when a value which is not cached
+    is requested, ``admit(key, size)`` when a value has been retrieved but space
+    must be made to cache it, returning False if the value should not be cached,
+    ``insert(key, size)`` when a value is cached, ``evict()`` to remove and return
+    the key of the value to evict next, ``remove(key)`` when a value is removed from
+    the cache and ``clear()`` when all values are removed.
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum size of the cache, in number of bytes, or `None`.
+
+    """
+
+    def __init__(self, max_size):
+        self._max_size = max_size
+        self._order = OrderedDict()
+
+    def hit(self, key):
+        # treat the end as most recently used
+        self._order.move_to_end(key)
+
+    def miss(self, key):
+        pass
+
+    def admit(self, key, size):
+        return True
+
+    def insert(self, key, size):
+        self._order[key] = size
+
+    def evict(self):
+        # the first key is the least recently used
+        key, _ = self._order.popitem(last=False)
+        return key
+
+    def remove(self, key):
+        self._order.pop(key, None)
+
+    def clear(self):
+        self._order.clear()
+
+
+_halve = bytes(i >> 1 for i in range(256))
+
+
+class TinyLFUPolicy(LRUPolicy):
+    """Cache policy evicting the least recently used value, but admitting a new value
+    only if it has been requested more frequently than the value it would evict, as
+    in TinyLFU (Einziger et al., 2017). Frequencies of requests for recently used
+    keys, cached or not, are estimated via a count-min sketch, and are halved
+    periodically so that old requests are forgotten. Values requested once only, e.g.,
+    during a scan over a whole array, are thus not cached at the expense of values
+    which are requested repeatedly.
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum size of the cache, in number of bytes, or `None`.
+    width : int, optional
+        The number of counters in each row of the sketch.
+    sample_size : int, optional
+        The number of requests after which all frequencies are halved. Defaults to
+        ten times `width`.
+
+    """
+
+    _depth = 4
+    _max_count = 15
+
+    def __init__(self, max_size, width=2**16, sample_size=None):
+        super().__init__(max_size)
+        self._width = width
+        self._sample_size = 10 * width if sample_size is None else sample_size
+        self._sketch = [bytearray(width) for _ in range(self._depth)]
+        self._nrequests = 0
+
+    def _indices(self, key):
+        data = key.encode()
+        return [zlib.crc32(data, seed) % self._width for seed in range(self._depth)]
+
+    def _record(self, key):
+        for row, i in zip(self._sketch, self._indices(key)):
+            if row[i] < self._max_count:
+                row[i] += 1
+        self._nrequests += 1
+        if self._nrequests >= self._sample_size:
+            # age frequencies
+            self._sketch = [row.translate(_halve) for row in self._sketch]
+            self._nrequests //= 2
+
+    def frequency(self, key):
+        """Estimate how frequently `key` has been requested recently."""
+        return min(row[i] for row, i in zip(self._sketch, self._indices(key)))
+
+    def hit(self, key):
+        super().hit(key)
+        self._record(key)
+
+    def miss(self, key):
+        self._record(key)
+
+    def admit(self, key, size):
+        # compare against the value which would be evicted first
+        victim = next(iter(self._order), None)
+        return victim is None or self.frequency(key) > self.frequency(victim)
+
+
+class ARCPolicy:
+    """Cache policy adapting between recency and frequency, as in the Adaptive
+    Replacement Cache (Megiddo and Modha, 2003). Values requested once are held in a
+    recency list, and values requested again are promoted to a frequency list. The
+    keys of values evicted from either list are remembered in ghost lists, and
+    requests for those keys shift the share of the cache given to each list, so that
+    a scan over a whole array evicts values from the recency list rather than
+    values which are requested repeatedly. Sizes of values are taken into account
+    throughout, all values are admitted.
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum size of the cache, in number of bytes, or `None`.
+
+    """
+
+    def __init__(self, max_size):
+        self._max_size = max_size
+        # recency and frequency lists, and ghost lists, mapping keys to sizes
+        self._t1, self._t2 = OrderedDict(), OrderedDict()
+        self._b1, self._b2 = OrderedDict(), OrderedDict()
+        self._t1_size = self._b1_size = self._b2_size = 0
+        # target size of the recency list
+        self._p = 0
+        # keys found in a ghost list, to be cached in the frequency list
+        self._promote = set()
+
+    def hit(self, key):
+        if key in self._t1:
+            size = self._t1.pop(key)
+            self._t1_size -= size
+            self._t2[key] = size
+        else:
+            self._t2.move_to_end(key)
+
+    def miss(self, key):
+        if key in self._b1:
+            size = self._b1.pop(key)
+            self._b1_size -= size
+            delta = max(1, self._b2_size / max(self._b1_size, 1)) * size
+            self._p = min(self._max_size, self._p + delta)
+            self._promote.add(key)
+        elif key in self._b2:
+            size = self._b2.pop(key)
+            self._b2_size -= size
+            delta = max(1, self._b1_size / max(self._b2_size, 1)) * size
+            self._p = max(0, self._p - delta)
+            self._promote.add(key)
+
+    def admit(self, key, size):
+        return True
+
+    def insert(self, key, size):
+        if key in self._promote:
+            self._promote.discard(key)
+            self._t2[key] = size
+        else:
+            self._t1[key] = size
+            self._t1_size += size
+
+    def evict(self):
+        if self._t1 and (self._t1_size > self._p or not self._t2):
+            key, size = self._t1.popitem(last=False)
+            self._t1_size -= size
+            self._b1[key] = size
+            self._b1_size += size
+            while self._b1_size > self._max_size:
+                self._b1_size -= self._b1.popitem(last=False)[1]
+        else:
+            key, size = self._t2.popitem(last=False)
+            self._b2[key] = size
+            self._b2_size += size
+            while self._b2_size > self._max_size:
+                self._b2_size -= self._b2.popitem(last=False)[1]
+        return key
+
+    def remove(self, key):
+        if key in self._t1:
+            self._t1_size -= self._t1.pop(key)
+        else:
+            self._t2.pop(key, None)
+        self._promote.discard(key)
+
+    def clear(self):
+        self._t1.clear()
+        self._t2.clear()
+        self._b1.clear()
+        self._b2.clear()
+        self._t1_size = self._b1_size = self._b2_size = 0
+        self._p = 0
+        self._promote.clear()
+
+
+_cache_policies = {
+    'lru': LRUPolicy,
+    'tinylfu': TinyLFUPolicy,
+    'arc': ARCPolicy,
+}
+
+
 class LRUStoreCache(MutableMapping):
     """Storage class that implements a least-recently-used (LRU) cache layer over
     some other store. Intended primarily for use with stores that can be slow to
     access, e.g., remote stores that require network communication to store and
     retrieve data.
 
+    If several threads request a key which is not cached at the same time, the value
+    is retrieved from the store only once and shared between the threads.
+
     Parameters
     ----------
     store : MutableMapping
@@ -2039,6 +2416,16 @@ class LRUStoreCache(MutableMapping):
     max_size : int
         The maximum size that the cache may grow to, in number of bytes. Provide `None`
         if you would like the cache to have unlimited size.
+    max_missing_keys : int, optional
+        The maximum number of keys known to be missing from the store to remember, so
+        that repeated reads of keys which do not exist, e.g., chunks of a sparse array
+        which have never been written, do not require a request to the store. Provide
+        `None` for no limit or 0 to disable.
+    policy : {'lru', 'tinylfu', 'arc'} or callable, optional
+        The policy deciding which values are cached and which are evicted when the
+        cache is full, either the name of a policy provided by zarr, see
+        :class:`LRUPolicy`, :class:`TinyLFUPolicy` and :class:`ARCPolicy`, or a
+        callable returning a policy object given the maximum size of the cache.
 
     Examples
     --------
@@ -2061,28 +2448,49 @@ class LRUStoreCache(MutableMapping):
         b'Hello from the cloud!'
         0.0009490990014455747
 
+    A bulk operation such as a copy of a whole array can be made without evicting
+    values which are in use, via :func:`LRUStoreCache.bypass`::
+
+        >>> with cache.bypass():  # doctest: +SKIP
+        ...     zarr.copy_store(cache, zarr.DirectoryStore('backup'))
+
     """
 
-    def __init__(self, store, max_size):
+    def __init__(self, store, max_size, max_missing_keys=2**16, policy='lru'):
         self._store = store
         self._max_size = max_size
+        self._max_missing_keys = max_missing_keys
+        if isinstance(policy, str):
+            try:
+                policy = _cache_policies[policy]
+            except KeyError:
+                raise ValueError('unknown cache policy: {!r}'.format(policy))
+        self._policy = policy(max_size)
         self._current_size = 0
         self._keys_cache = None
         self._contains_cache = None
         self._listdir_cache = dict()
-        self._values_cache = OrderedDict()
+        self._values_cache = dict()
+        self._missing_cache = OrderedDict()
+        self._missing_listings = dict()
+        self._in_flight = dict()
+        self._local = local()
         self._mutex = Lock()
         self.hits = self.misses = 0
 
     def __getstate__(self):
-        return (self._store, self._max_size, self._current_size, self._keys_cache,
-                self._contains_cache, self._listdir_cache, self._values_cache, self.hits,
-                self.misses)
+        return (self._store, self._max_size, self._max_missing_keys, self._policy,
+                self._current_size, self._keys_cache, self._contains_cache,
+                self._listdir_cache, self._values_cache, self._missing_cache,
+                self._missing_listings, self.hits, self.misses)
 
     def __setstate__(self, state):
-        (self._store, self._max_size, self._current_size, self._keys_cache,
-         self._contains_cache, self._listdir_cache, self._values_cache, self.hits,
-         self.misses) = state
+        (self._store, self._max_size, self._max_missing_keys, self._policy,
+         self._current_size, self._keys_cache, self._contains_cache,
+         self._listdir_cache, self._values_cache, self._missing_cache,
+         self._missing_listings, self.hits, self.misses) = state
+        self._in_flight = dict()
+        self._local = local()
         self._mutex = Lock()
 
     def __len__(self):
@@ -2122,11 +2530,24 @@ class LRUStoreCache(MutableMapping):
     def getsize(self, path=None):
         return getsize(self._store, path=path)
 
+    @contextmanager
+    def bypass(self):
+        """Context manager within which requests made by the current thread bypass
+        the cache, e.g., for a scan over a whole array. Cached values are still
+        returned, but values retrieved from or written to the store are not cached,
+        and requests are not taken into account by the cache policy."""
+        self._local.bypass = getattr(self._local, 'bypass', 0) + 1
+        try:
+            yield
+        finally:
+            self._local.bypass -= 1
+
+    def _bypassing(self):
+        return getattr(self._local, 'bypass', 0) > 0
+
     def _pop_value(self):
-        # remove the first value from the cache, as this will be the least recently
-        # used value
-        _, v = self._values_cache.popitem(last=False)
-        return v
+        # remove the value chosen by the policy from the cache
+        return self._values_cache.pop(self._policy.evict())
 
     def _accommodate_value(self, value_size):
         if self._max_size is None:
@@ -2138,27 +2559,77 @@ class LRUStoreCache(MutableMapping):
 
     def _cache_value(self, key, value):
         # cache a value
+        if self._bypassing():
+            return
         value_size = buffer_size(value)
         # check size of the value against max size, as if the value itself exceeds max
         # size then we are never going to cache it
         if self._max_size is None or value_size <= self._max_size:
+            if (self._max_size is not None and
+                    self._current_size + value_size > self._max_size and
+                    not self._policy.admit(key, value_size)):
+                return
             self._accommodate_value(value_size)
             self._values_cache[key] = value
             self._current_size += value_size
+            self._policy.insert(key, value_size)
+
+    def _clear_values(self):
+        self._values_cache.clear()
+        self._current_size = 0
+        self._policy.clear()
+        self._in_flight.clear()
+
+    def _cache_missing(self, key):
+        # remember a key is not present in the store
+        if self._max_missing_keys is None or self._max_missing_keys > 0:
+            self._missing_cache[key] = None
+            self._missing_cache.move_to_end(key)
+            if (self._max_missing_keys is not None and
+                    len(self._missing_cache) > self._max_missing_keys):
+                self._missing_cache.popitem(last=False)
+
+    def _is_missing(self, key):
+        # check whether a key is known not to be present in the store, either directly
+        # or because it is absent from the listing of a parent path
+        if key in self._missing_cache:
+            self._missing_cache.move_to_end(key)
+            return True
+        if self._missing_listings:
+            path = key
+            while path:
+                path = path.rpartition('/')[0]
+                names = self._missing_listings.get(path)
+                if names is not None:
+                    name = key[len(path) + 1 if path else 0:].split('/')[0]
+                    return name not in names
+        return False
+
+    def seed_missing_keys(self, path=None):
+        """List the contents of `path` in the underlying store, e.g., the path of a
+        sparse array, via a single call to :func:`listdir`. Until the keys cache is
+        next invalidated, any key under `path` which is not in the listing is known
+        to be missing without making a request to the store."""
+        path = normalize_storage_path(path)
+        self._seed_missing_keys(path, set(listdir(self._store, path)))
+
+    def _seed_missing_keys(self, path, names):
+        with self._mutex:
+            self._missing_listings[path] = names
 
     def invalidate(self):
         """Completely clear the cache."""
         with self._mutex:
-            self._values_cache.clear()
+            self._clear_values()
             self._invalidate_keys()
 
     def invalidate_values(self):
         """Clear the values cache."""
         with self._mutex:
-            self._values_cache.clear()
+            self._clear_values()
 
     def invalidate_keys(self):
-        """Clear the keys cache."""
+        """Clear the keys cache, including keys known to be missing."""
         with self._mutex:
             self._invalidate_keys()
 
@@ -2166,11 +2637,25 @@ class LRUStoreCache(MutableMapping):
         self._keys_cache = None
         self._contains_cache = None
         self._listdir_cache.clear()
+        self._missing_cache.clear()
+        self._missing_listings.clear()
 
     def _invalidate_value(self, key):
         if key in self._values_cache:
             value = self._values_cache.pop(key)
             self._current_size -= buffer_size(value)
+            self._policy.remove(key)
+        # any retrieval of the key in progress will not be cached
+        self._in_flight.pop(key, None)
+
+    def _end_retrieval(self, key, future):
+        # called with the mutex held once a value has been retrieved from the store,
+        # returns False if the key has been modified or the values cache invalidated
+        # since the retrieval started, in which case the result should not be cached
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+            return True
+        return False
 
     def __getitem__(self, key):
         try:
@@ -2179,33 +2664,511 @@ class LRUStoreCache(MutableMapping):
                 value = self._values_cache[key]
                 # cache hit if no KeyError is raised
                 self.hits += 1
-                # treat the end as most recently used
-                self._values_cache.move_to_end(key)
+                if not self._bypassing():
+                    self._policy.hit(key)
 
         except KeyError:
+            with self._mutex:
+                missing = self._is_missing(key)
+                if missing:
+                    # cache hit, key is known not to be present in the store
+                    self.hits += 1
+                else:
+                    self.misses += 1
+                    if not self._bypassing():
+                        self._policy.miss(key)
+                    # only one thread at a time retrieves a given key from the store,
+                    # other threads requesting the key wait for the result
+                    future = self._in_flight.get(key)
+                    retrieve = future is None
+                    if retrieve:
+                        future = self._in_flight[key] = Future()
+            if missing:
+                raise KeyError(key)
+            if not retrieve:
+                return future.result()
+
             # cache miss, retrieve value from the store
-            value = self._store[key]
+            try:
+                value = self._store[key]
+            except BaseException as e:
+                with self._mutex:
+                    if self._end_retrieval(key, future) and isinstance(e, KeyError):
+                        self._cache_missing(key)
+                future.set_exception(e)
+                raise
             with self._mutex:
-                self.misses += 1
                 # need to check if key is not in the cache, as it may have been cached
                 # while we were retrieving the value from the store
-                if key not in self._values_cache:
+                if self._end_retrieval(key, future) and key not in self._values_cache:
                     self._cache_value(key, value)
+            future.set_result(value)
 
         return value
 
-    def __setitem__(self, key, value):
-        self._store[key] = value
+    def _begin_retrievals(self, keys, values):
+        # look up keys in the cache, adding any cached values to `values`, and return
+        # the keys to be retrieved from the store by this thread and the keys being
+        # retrieved by other threads, each mapped to a future for the value
+        retrieve = dict()
+        wait = dict()
+        bypass = self._bypassing()
+        with self._mutex:
+            for key in keys:
+                try:
+                    values[key] = self._values_cache[key]
+                except KeyError:
+                    if self._is_missing(key):
+                        self.hits += 1
+                        continue
+                    self.misses += 1
+                    if not bypass:
+                        self._policy.miss(key)
+                    future = self._in_flight.get(key)
+                    if future is None:
+                        retrieve[key] = self._in_flight[key] = Future()
+                    else:
+                        wait[key] = future
+                else:
+                    self.hits += 1
+                    if not bypass:
+                        self._policy.hit(key)
+        return retrieve, wait
+
+    def _end_retrievals(self, retrieve, retrieved):
+        # cache values retrieved from the store and pass them on to waiting threads
+        with self._mutex:
+            for key, future in retrieve.items():
+                if self._end_retrieval(key, future):
+                    if key not in retrieved:
+                        self._cache_missing(key)
+                    elif key not in self._values_cache:
+                        self._cache_value(key, retrieved[key])
+        for key, future in retrieve.items():
+            if key in retrieved:
+                future.set_result(retrieved[key])
+            else:
+                future.set_exception(KeyError(key))
+
+    def _fail_retrievals(self, retrieve, e):
+        # pass an error retrieving values from the store on to waiting threads
+        with self._mutex:
+            for key, future in retrieve.items():
+                self._end_retrieval(key, future)
+        for future in retrieve.values():
+            future.set_exception(e)
+
+    def getitems(self, keys, **kwargs):
+        """Retrieve values for multiple keys, omitting any keys that are not present in
+        the store. Values held in the cache are returned directly, and all other keys
+        are retrieved from the underlying store together, via :func:`getitems`."""
+        return _cache_getitems(self._store, [(self, keys)])
+
+    def _cache_values(self, values):
+        # called after values have been stored
+        with self._mutex:
+            self._invalidate_keys()
+            for key, value in values.items():
+                self._invalidate_value(key)
+                self._cache_value(key, value)
+
+    def _uncache_values(self, keys):
+        # called after values have been deleted
         with self._mutex:
             self._invalidate_keys()
-            self._invalidate_value(key)
-            self._cache_value(key, value)
+            for key in keys:
+                self._invalidate_value(key)
+
+    def __setitem__(self, key, value):
+        self._store[key] = value
+        self._cache_values({key: value})
+
+    def setitems(self, values):
+        """Store multiple values, via :func:`setitems` on the underlying store."""
+        setitems(self._store, values)
+        self._cache_values(values)
+
+    def __delitem__(self, key):
+        del self._store[key]
+        self._uncache_values([key])
+
+
+def _cache_getitems(store, cache_keys):
+    # retrieve values via one or more LRUStoreCache instances over `store`, given as a
+    # list of (cache, keys) pairs, retrieving all cache misses in a single batch
+    values = dict()
+    retrievals = [(cache, *cache._begin_retrievals(keys, values))
+                  for cache, keys in cache_keys]
+    retrieve_keys = [key for _, retrieve, _ in retrievals for key in retrieve]
+
+    if retrieve_keys:
+        # cache misses, retrieve values from the store in a single batch
+        try:
+            retrieved = getitems(store, retrieve_keys)
+        except BaseException as e:
+            for cache, retrieve, _ in retrievals:
+                cache._fail_retrievals(retrieve, e)
+            raise
+        for cache, retrieve, _ in retrievals:
+            cache._end_retrievals(retrieve, retrieved)
+        values.update(retrieved)
+
+    # collect values retrieved by other threads
+    for _, _, wait in retrievals:
+        for key, future in wait.items():
+            try:
+                values[key] = future.result()
+            except KeyError:
+                pass
+
+    return values
+
+
+class ShardedLRUStoreCache(MutableMapping):
+    """Storage class that implements a least-recently-used (LRU) cache layer over
+    some other store, like :class:`LRUStoreCache`, but with keys partitioned by hash
+    across a number of independent LRU caches, each with its own lock and an equal
+    share of the maximum size. Intended for use by many threads at once, where
+    contention for the lock of a single cache can dominate the time taken to
+    retrieve cached values.
+
+    Parameters
+    ----------
+    store : MutableMapping
+        The store containing the actual data to be cached.
+    max_size : int
+        The maximum size that the cache may grow to, in number of bytes. Provide `None`
+        if you would like the cache to have unlimited size.
+    nshards : int, optional
+        The number of independent caches to partition keys across.
+    max_missing_keys : int, optional
+        The maximum number of keys known to be missing from the store to remember,
+        see :class:`LRUStoreCache`.
+    policy : {'lru', 'tinylfu', 'arc'} or callable, optional
+        The policy deciding which values are cached and which are evicted when a
+        shard is full, see :class:`LRUStoreCache`.
+
+    Examples
+    --------
+    >>> import zarr
+    >>> store = zarr.MemoryStore()
+    >>> cache = zarr.ShardedLRUStoreCache(store, max_size=2**28, nshards=8)
+    >>> z = zarr.zeros(100, chunks=10, store=cache)
+    >>> z[:] = 42
+    >>> z[:5]
+    array([42., 42., 42., 42., 42.])
+    >>> cache.misses  # values written via the cache are cached
+    0
+
+    """
+
+    def __init__(self, store, max_size, nshards=16, max_missing_keys=2**16, policy='lru'):
+        self._store = store
+        self._max_size = max_size
+        shard_max_size = None if max_size is None else max_size // nshards
+        shard_max_missing_keys = (None if max_missing_keys is None
+                                  else -(-max_missing_keys // nshards))
+        self._shards = [LRUStoreCache(store, max_size=shard_max_size,
+                                      max_missing_keys=shard_max_missing_keys,
+                                      policy=policy)
+                        for _ in range(nshards)]
+
+    def _shard_index(self, key):
+        # N.B., use a hash which is stable across processes, as caches may be pickled
+        return zlib.crc32(key.encode()) % len(self._shards)
+
+    def _shard_values(self, values):
+        # partition a mapping of keys to values across shards
+        shard_values = [dict() for _ in self._shards]
+        for key, value in values.items():
+            shard_values[self._shard_index(key)][key] = value
+        return zip(self._shards, shard_values)
+
+    @property
+    def hits(self):
+        return sum(shard.hits for shard in self._shards)
+
+    @property
+    def misses(self):
+        return sum(shard.misses for shard in self._shards)
+
+    # the keys cache is held by the first shard, all shards are invalidated on writes
+
+    def __len__(self):
+        return len(self._shards[0])
+
+    def __iter__(self):
+        return self.keys()
+
+    def __contains__(self, key):
+        return key in self._shards[0]
+
+    def keys(self):
+        return self._shards[0].keys()
+
+    def listdir(self, path=None):
+        return self._shards[0].listdir(path)
+
+    def getsize(self, path=None):
+        return getsize(self._store, path=path)
+
+    def clear(self):
+        self._store.clear()
+        self.invalidate()
+
+    def seed_missing_keys(self, path=None):
+        """List the contents of `path` in the underlying store, see
+        :func:`LRUStoreCache.seed_missing_keys`."""
+        path = normalize_storage_path(path)
+        names = set(listdir(self._store, path))
+        for shard in self._shards:
+            shard._seed_missing_keys(path, names)
+
+    @contextmanager
+    def bypass(self):
+        """Context manager within which requests made by the current thread bypass
+        the cache, see :func:`LRUStoreCache.bypass`."""
+        with ExitStack() as stack:
+            for shard in self._shards:
+                stack.enter_context(shard.bypass())
+            yield
+
+    def invalidate(self):
+        """Completely clear the cache."""
+        for shard in self._shards:
+            shard.invalidate()
+
+    def invalidate_values(self):
+        """Clear the values cache."""
+        for shard in self._shards:
+            shard.invalidate_values()
+
+    def invalidate_keys(self):
+        """Clear the keys cache, including keys known to be missing."""
+        for shard in self._shards:
+            shard.invalidate_keys()
+
+    def __getitem__(self, key):
+        return self._shards[self._shard_index(key)][key]
+
+    def getitems(self, keys, **kwargs):
+        """Retrieve values for multiple keys, omitting any keys that are not present in
+        the store. All keys not held in the cache are retrieved from the underlying
+        store together, via :func:`getitems`."""
+        shard_keys = [[] for _ in self._shards]
+        for key in keys:
+            shard_keys[self._shard_index(key)].append(key)
+        return _cache_getitems(self._store, [(shard, k) for shard, k in
+                                             zip(self._shards, shard_keys) if k])
+
+    def __setitem__(self, key, value):
+        self._store[key] = value
+        for shard, values in self._shard_values({key: value}):
+            shard._cache_values(values)
+
+    def setitems(self, values):
+        """Store multiple values, via :func:`setitems` on the underlying store."""
+        setitems(self._store, values)
+        for shard, shard_values in self._shard_values(values):
+            shard._cache_values(shard_values)
 
     def __delitem__(self, key):
         del self._store[key]
+        for shard, keys in self._shard_values({key: None}):
+            shard._uncache_values(keys)
+
+
+class LRUChunkCache:
+    """Least-recently-used (LRU) cache of decoded chunks. Unlike
+    :class:`LRUStoreCache`, which caches encoded data retrieved from a store, this
+    cache holds chunks after they have been decompressed and decoded, so that
+    repeated reads of the same chunk do not need to decode the chunk again.
+
+    A cache may be shared by several arrays via the `chunk_cache` argument to
+    :class:`zarr.core.Array`. Chunks are identified by the chunk store they were
+    retrieved from together with their key, so arrays sharing a cache should only
+    share a chunk store if they also share the same configuration, e.g., they
+    should not be views with a different dtype or filters. Chunks are removed from
+    the cache when they are modified via an array using the cache. Chunks returned
+    from the cache are read-only.
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum size that the cache may grow to, in number of bytes. Provide `None`
+        if you would like the cache to have unlimited size.
+
+    Examples
+    --------
+    >>> import zarr
+    >>> import numpy as np
+    >>> cache = zarr.LRUChunkCache(max_size=2**28)
+    >>> z = zarr.array(np.arange(100), chunks=10)
+    >>> z = zarr.Array(z.store, chunk_cache=cache)
+    >>> z[:15]
+    array([ 0,  1,  2,  3,  4,  5,  6,  7,  8,  9, 10, 11, 12, 13, 14])
+    >>> z[5]
+    5
+    >>> cache.hits, cache.misses
+    (1, 2)
+
+    """
+
+    def __init__(self, max_size):
+        self._max_size = max_size
+        self._current_size = 0
+        self._values_cache = OrderedDict()
+        self._mutex = Lock()
+        self.hits = self.misses = 0
+
+    def __getstate__(self):
+        return self._max_size
+
+    def __setstate__(self, state):
+        # reinitialize from scratch, cached chunks are not pickled
+        self.__init__(state)
+
+    def __len__(self):
+        return len(self._values_cache)
+
+    @property
+    def max_size(self):
+        """The maximum size of the cache in bytes."""
+        return self._max_size
+
+    @property
+    def current_size(self):
+        """The total size of cached chunks in bytes."""
+        return self._current_size
+
+    def get(self, store, key):
+        """Return the decoded chunk stored under `key` in `store`, or None if the chunk
+        is not in the cache."""
         with self._mutex:
-            self._invalidate_keys()
-            self._invalidate_value(key)
+            try:
+                cached_store, chunk = self._values_cache[id(store), key]
+            except KeyError:
+                self.misses += 1
+                return None
+            if cached_store is not store:  # pragma: no cover
+                # object identifier has been reused by a different store
+                self.misses += 1
+                return None
+            self.hits += 1
+            # treat the end as most recently used
+            self._values_cache.move_to_end((id(store), key))
+            return chunk
+
+    def put(self, store, key, chunk):
+        """Add the decoded chunk stored under `key` in `store` to the cache. The chunk
+        is made read-only and returned."""
+        chunk.setflags(write=False)
+        value_size = chunk.nbytes
+        with self._mutex:
+            ckey = id(store), key
+            self._invalidate_value(ckey)
+            # check size of the value against max size, as if the value itself exceeds
+            # max size then we are never going to cache it
+            if self._max_size is None or value_size <= self._max_size:
+                self._accommodate_value(value_size)
+                # N.B., hold a reference to the store, so the identifier of the store
+                # cannot be reused while the chunk is cached
+                self._values_cache[ckey] = store, chunk
+                self._current_size += value_size
+        return chunk
+
+    def _accommodate_value(self, value_size):
+        if self._max_size is None:
+            return
+        # ensure there is enough space in the cache for a new value, removing the least
+        # recently used values first
+        while self._current_size + value_size > self._max_size:
+            _, (_, chunk) = self._values_cache.popitem(last=False)
+            self._current_size -= chunk.nbytes
+
+    def _invalidate_value(self, ckey):
+        if ckey in self._values_cache:
+            _, chunk = self._values_cache.pop(ckey)
+            self._current_size -= chunk.nbytes
+
+    def invalidate(self):
+        """Completely clear the cache."""
+        with self._mutex:
+            self._values_cache.clear()
+            self._current_size = 0
+
+    def invalidate_chunks(self, store, keys):
+        """Remove the chunks stored under `keys` in `store` from the cache."""
+        with self._mutex:
+            for key in keys:
+                self._invalidate_value((id(store), key))
+
+
+class AsyncStoreAdapter:
+    """Adapter providing ``getitems`` and ``setitems`` coroutines over a store with
+    a synchronous interface, so that the store can be used by the coroutine methods of
+    :class:`zarr.core.Array` without blocking the event loop. The store is called via
+    an executor, and if the store does not provide ``getitems`` or ``setitems``
+    methods of its own, each key is retrieved or stored by a separate call so that
+    many requests can be in flight at once.
+
+    Parameters
+    ----------
+    store : MutableMapping
+        The store to adapt. If the store does not provide ``getitems`` or
+        ``setitems`` methods, it must support concurrent access from multiple
+        threads.
+    executor : concurrent.futures.Executor, optional
+        The executor used to call the store. If not provided, the default executor of
+        the running event loop is used.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> import zarr
+    >>> store = zarr.MemoryStore()
+    >>> store['foo'] = b'bar'
+    >>> adapter = zarr.storage.AsyncStoreAdapter(store)
+    >>> asyncio.run(adapter.getitems(['foo', 'baz']))
+    {'foo': b'bar'}
+
+    """
+
+    def __init__(self, store, executor=None):
+        self.store = store
+        self.executor = executor
+
+    def _get(self, key):
+        try:
+            return key, self.store[key]
+        except KeyError:
+            return key, None
+
+    async def getitems(self, keys, **kwargs):
+        """Retrieve values for multiple keys, omitting any keys that are not present
+        in the store."""
+        loop = asyncio.get_running_loop()
+        if hasattr(self.store, 'getitems'):
+            return await loop.run_in_executor(
+                self.executor, functools.partial(self.store.getitems, keys, **kwargs)
+            )
+        results = await asyncio.gather(*[
+            loop.run_in_executor(self.executor, self._get, key) for key in keys
+        ])
+        return {key: value for key, value in results if value is not None}
+
+    async def setitems(self, values):
+        """Store multiple values."""
+        loop = asyncio.get_running_loop()
+        if hasattr(self.store, 'setitems'):
+            await loop.run_in_executor(
+                self.executor, functools.partial(self.store.setitems, values)
+            )
+            return
+        await asyncio.gather(*[
+            loop.run_in_executor(self.executor, self.store.__setitem__, key, value)
+            for key, value in values.items()
+        ])
 
 
 class ABSStore(MutableMapping):
@@ -1,6 +1,8 @@
 import atexit
+import itertools
 import tempfile
 import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from numbers import Integral
 
 import numpy as np
@@ -14,6 +16,7 @@ from zarr.convenience import (
     copy,
     copy_store,
     load,
+    map_blocks,
     open,
     open_consolidated,
     save,
@@ -21,10 +24,11 @@ from zarr.convenience import (
     copy_all,
 )
 from zarr.core import Array
-from zarr.errors import CopyError
+from zarr.errors import CopyError, ReadOnlyError
 from zarr.hierarchy import Group, group
-from zarr.storage import (ConsolidatedMetadataStore, MemoryStore,
+from zarr.storage import (ConsolidatedMetadataStore, DirectoryStore, MemoryStore,
                           atexit_rmtree, getsize)
+from zarr.tests.util import CountingDict
 
 
 def test_open_array():
@@ -223,6 +227,63 @@ def test_consolidated_with_chunk_store():
                       chunk_store=chunk_store)
 
 
+def _scale_and_add(a, b):
+    return a * 2 + b
+
+
+@pytest.mark.parametrize('executor', [None, ThreadPoolExecutor, ProcessPoolExecutor])
+def test_map_blocks(executor):
+    path = tempfile.mkdtemp()
+    atexit.register(atexit_rmtree, path)
+    x = zarr.array(np.arange(105 * 23).reshape(105, 23), chunks=(10, 5),
+                   store=DirectoryStore(path))
+    y = zarr.zeros((105, 23), chunks=(10, 5), dtype='i4')
+    y[:50] = 1
+    store = CountingDict()
+    z = zarr.create((105, 23), chunks=(10, 5), dtype='i8', fill_value=-1, store=store)
+    expect = x[:] * 2 + y[:]
+
+    if executor is None:
+        map_blocks(_scale_and_add, x, y, out=z)
+    else:
+        with executor(max_workers=2) as pool:
+            map_blocks(_scale_and_add, x, y, out=z, executor=pool, max_chunks=3)
+
+    # each chunk is written once without being read back
+    for i, j in itertools.product(range(11), range(5)):
+        ckey = '{}.{}'.format(i, j)
+        assert 1 == store.counter['__setitem__', ckey]
+        assert 0 == store.counter['__getitem__', ckey]
+    assert_array_equal(expect, z[:])
+
+    # edge chunks are padded with the fill value
+    chunk = z._decode_chunk(store['10.4'])
+    assert_array_equal(-1, chunk[5:])
+    assert_array_equal(-1, chunk[:, 3:])
+
+
+def test_map_blocks_errors():
+    x = zarr.zeros(10, chunks=3)
+    with pytest.raises(ValueError):
+        map_blocks(np.negative, x, out=zarr.zeros(10, chunks=5))
+    with pytest.raises(ValueError):
+        map_blocks(lambda a: np.zeros(3), x, out=zarr.zeros(10, chunks=3))
+    with pytest.raises(ValueError):
+        map_blocks(np.negative, x, out=zarr.zeros(10, chunks=3), max_chunks=0)
+    with pytest.raises(TypeError):
+        map_blocks(np.negative, x, out=np.zeros(10))
+    with pytest.raises(ValueError):
+        map_blocks(lambda a: np.zeros(2), x, out=zarr.zeros(10, chunks=3))
+    with pytest.raises(ReadOnlyError):
+        z = zarr.open(zarr.zeros(10, chunks=3).store, mode='r')
+        map_blocks(np.negative, x, out=z)
+
+    # scalar results are broadcast
+    z = zarr.zeros(10, chunks=3)
+    map_blocks(lambda a: 42, x, out=z)
+    assert_array_equal(np.full(10, 42.), z[:])
+
+
 class TestCopyStore(unittest.TestCase):
 
     def setUp(self):
@@ -1,9 +1,13 @@
+import asyncio
 import atexit
+import collections
+import itertools
 import os
 import sys
 import pickle
 import shutil
 import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from itertools import zip_longest
 from tempfile import mkdtemp, mktemp
 
@@ -16,7 +20,8 @@ from numcodecs.compat import ensure_bytes, ensure_ndarray
 from numcodecs.tests.common import greetings
 from numpy.testing import assert_array_almost_equal, assert_array_equal
 
-from zarr.core import Array
+from zarr.core import Array, set_executor
+from zarr.errors import StalePlanError
 from zarr.meta import json_loads
 from zarr.n5 import N5Store, n5_keywords
 from zarr.storage import (
@@ -24,8 +29,10 @@ from zarr.storage import (
     DBMStore,
     DirectoryStore,
     LMDBStore,
+    LRUChunkCache,
     LRUStoreCache,
     NestedDirectoryStore,
+    ShardedLRUStoreCache,
     SQLiteStore,
     FSStore,
     atexit_rmglob,
@@ -34,7 +41,8 @@ from zarr.storage import (
     init_group,
 )
 from zarr.util import buffer_size
-from zarr.tests.util import abs_container, skip_test_env_var, have_fsspec
+from zarr.tests.util import (CountingDict, GetitemsCountingDict, abs_container,
+                             skip_test_env_var, have_fsspec)
 
 # noinspection PyMethodMayBeStatic
 
@@ -1443,9 +1451,420 @@ class TestArray(unittest.TestCase):
             for expect, actual in zip_longest(a[start:end_array],
                                               z.islice(start, end)):
                 assert_array_equal(expect, actual)
+            for expect, actual in zip_longest(a[start:end_array],
+                                              z.islice(start, end, prefetch=2)):
+                assert_array_equal(expect, actual)
             if hasattr(z.store, 'close'):
                 z.store.close()
 
+    def test_islice_prefetch(self):
+        z = self.create_array(shape=(1000, 10), chunks=(10, 5), dtype='i4')
+        a = np.arange(10000, dtype='i4').reshape(1000, 10)
+        z[:] = a
+
+        # read-ahead depth configured on the array
+        z._prefetch = 3
+        assert 3 == z.prefetch
+        for expect, actual in zip_longest(a, z):
+            assert_array_equal(expect, actual)
+        assert_array_equal(a[5:995], np.array(list(z.islice(5, 995))))
+        assert_array_equal(a[5:995], np.array(list(z.islice(5, 995, prefetch=0))))
+
+        # closing the generator early stops reading ahead
+        it = z.islice(prefetch=5)
+        assert_array_equal(a[0], next(it))
+        it.close()
+        with pytest.raises(StopIteration):
+            next(it)
+
+        with pytest.raises(ValueError):
+            z.islice(prefetch=-1)
+        if hasattr(z.store, 'close'):
+            z.store.close()
+
+    def test_iter_chunks(self):
+        a = np.arange(105 * 23, dtype='i4').reshape(105, 23)
+        z = self.create_array(shape=a.shape, chunks=(10, 5), dtype='i4', fill_value=0)
+        z[:42] = a[:42]
+        a[42:] = 0
+
+        def check(region=None, **kwargs):
+            expect = a if region is None else a[region]
+            actual = np.full_like(expect, -1)
+            offset = [0, 0] if region is None else [s.start or 0 for s in region]
+            visited = []
+            results = list(z.iter_chunks(region, **kwargs))
+            for chunk_coords, selection, data in results:
+                visited.append(chunk_coords)
+                assert_array_equal(z[selection], data)
+                actual[tuple(slice(s.start - o, s.stop - o)
+                             for s, o in zip(selection, offset))] = data
+            return expect, actual, visited
+
+        expect, actual, visited = check()
+        assert_array_equal(expect, actual)
+        assert z.nchunks == len(visited)
+        assert sorted(visited) == visited
+        expect, actual, _ = check(prefetch=3)
+        assert_array_equal(expect, actual)
+        expect, actual, visited = check(np.s_[3:57, 4:16])
+        assert_array_equal(expect, actual)
+        assert 6 * 4 == len(visited)
+
+        # uninitialized chunks
+        _, actual, visited = check(skip_uninitialized=True)
+        assert 5 * 5 == len(visited)
+        assert_array_equal(a[:50], actual[:50])
+        assert (actual[50:] == -1).all()
+
+        # storage order
+        _, _, visited = check(storage_order=True)
+        assert visited == sorted(visited, key=lambda c: '.'.join(map(str, c)))
+
+        # closing the generator early
+        it = z.iter_chunks(prefetch=5)
+        assert (0, 0) == next(it)[0]
+        it.close()
+
+        with pytest.raises(IndexError):
+            list(z.iter_chunks(np.s_[::2]))
+        with pytest.raises(IndexError):
+            list(z.iter_chunks(0))
+        with pytest.raises(ValueError):
+            list(z.iter_chunks(prefetch=-1))
+        if hasattr(z.store, 'close'):
+            z.store.close()
+
+    def test_reductions(self):
+        a = np.random.RandomState(42).normal(1000, 10, size=(105, 23, 3))
+        z = self.create_array(shape=a.shape, chunks=(10, 5, 2), dtype='f8',
+                              fill_value=0)
+        # some chunks are left uninitialized
+        a[:, 20:] = 0
+        z[:, :20] = a[:, :20]
+        assert z.nchunks_initialized < z.nchunks
+        # N.B., filters may be lossy
+        a = z[:]
+
+        for axis in None, 0, 1, -1, (0, 2), (1, 2):
+            for kind in 'sum', 'mean', 'min', 'max', 'var', 'std':
+                expect = getattr(a, kind)(axis=axis)
+                actual = getattr(z, kind)(axis=axis)
+                assert np.shape(expect) == np.shape(actual)
+                np.testing.assert_allclose(expect, actual, rtol=1e-10)
+        np.testing.assert_allclose(a.var(axis=0, ddof=1), z.var(axis=0, ddof=1))
+        np.testing.assert_allclose(a.std(ddof=1), z.std(ddof=1))
+        np.testing.assert_allclose(a.sum(axis=1, keepdims=True),
+                                   z.sum(axis=1, keepdims=True))
+        out = np.empty(23 * 3, dtype='f4').reshape(23, 3)
+        assert out is z.mean(axis=0, dtype='f4', out=out)
+        np.testing.assert_allclose(a.mean(axis=0), out, rtol=1e-6)
+
+        with pytest.raises(ValueError):
+            z.sum(axis=3)
+        with pytest.raises(ValueError):
+            z.sum(axis=(0, 0))
+        with pytest.raises(TypeError):
+            z.sum(axis=1.5)
+        if hasattr(z.store, 'close'):
+            z.store.close()
+
+    def test_reductions_dtypes(self):
+        a = np.arange(1000, dtype='u1').reshape(40, 25)
+        z = self.create_array(shape=a.shape, chunks=(7, 6), dtype='u1', fill_value=0)
+        z[:] = a
+        a = z[:]
+        assert a.sum() == z.sum()
+        assert a.sum(dtype='u8').dtype == z.sum().dtype
+        assert_array_equal(a.max(axis=0), z.max(axis=0))
+        assert a.max(axis=0).dtype == z.max(axis=0).dtype
+        assert a.mean() == z.mean()
+
+        # stable for large offsets
+        a = np.arange(10000, dtype='f8') % 7 + 1e9
+        z = self.create_array(shape=a.shape, chunks=100, dtype='f8', fill_value=0)
+        z[:] = a
+        a = z[:]
+        np.testing.assert_allclose(a.var(), z.var(), rtol=1e-9)
+
+        # empty arrays
+        z = self.create_array(shape=(0, 10), chunks=(5, 5), dtype='f8', fill_value=0)
+        assert_array_equal(np.zeros(10), z.sum(axis=0))
+        with pytest.raises(ValueError):
+            z.max()
+        if hasattr(z.store, 'close'):
+            z.store.close()
+
+    def test_write_back(self):
+        z = self.create_array(shape=(100, 10), chunks=(50, 10), dtype='i4',
+                              fill_value=0)
+        a = np.zeros((100, 10), dtype='i4')
+        z[:] = a
+
+        def stored():
+            return Array(z.store, path=z.path, chunk_store=z._chunk_store)
+
+        with z.write_back(max_size=3000):
+            for i in range(40):
+                z[i] = i
+                a[i] = i
+            # reads see buffered data, which has not been stored yet
+            assert_array_equal(a, z[:])
+            assert_array_equal(a[:, 3], z.oindex[:, 3])
+            assert_array_equal(np.zeros(10), stored()[39])
+            assert_array_equal(a, np.array(list(z.islice())))
+            assert 0 == z[:, 4].sum() - a[:, 4].sum()
+            z.flush()
+            assert_array_equal(a, stored()[:])
+
+            # least recently modified chunks are stored once over budget
+            z[60:80] = 7
+            a[60:80] = 7
+            z[10] = -1
+            a[10] = -1
+            assert_array_equal(a[50:], stored()[50:])
+            z[:, 1] = 42
+            a[:, 1] = 42
+            assert_array_equal(a[:50], stored()[:50])
+            z[99] = 3
+            a[99] = 3
+            assert 2000 == z._write_buffer_size
+            assert_array_equal(a, z[:])
+
+            # chunks removed by resizing are discarded
+            z.resize(50, 10)
+            a = a[:50]
+            assert 0 == z._write_buffer_size
+
+        assert z._write_buffer is None
+        assert_array_equal(a, z[:])
+        assert_array_equal(a, stored()[:])
+        if hasattr(z.store, 'close'):
+            z.store.close()
+
+    def test_write_empty_chunks(self):
+        z = self.create_array(shape=(100, 10), chunks=(10, 5), dtype='i4', fill_value=0)
+        z._write_empty_chunks = False
+
+        def stored_chunks():
+            return sorted(co for co in itertools.product(range(10), range(2))
+                          if z._chunk_key(co) in z.chunk_store)
+
+        z[:] = 0
+        assert [] == stored_chunks()
+        z[:20, :] = 1
+        z[95, 9] = 2
+        assert [(0, 0), (0, 1), (1, 0), (1, 1), (9, 1)] == stored_chunks()
+
+        # chunks which become empty are removed
+        z[:15] = 0
+        z[95, 9] = 0
+        assert [(1, 0), (1, 1)] == stored_chunks()
+        expect = np.zeros((100, 10), dtype='i4')
+        expect[15:20] = 1
+        assert_array_equal(expect, z[:])
+
+        z.set_orthogonal_selection(([12, 13], slice(None)), np.arange(20).reshape(2, 10))
+        asyncio.run(z.set_basic_selection_async((slice(15, 20), slice(0, 5)), 0))
+        assert [(1, 0), (1, 1)] == stored_chunks()
+        with z.write_back():
+            z[10:20, 5:] = 0
+        assert [(1, 0)] == stored_chunks()
+        z[10:20] = 0
+        assert [] == stored_chunks()
+        if hasattr(z.store, 'close'):
+            z.store.close()
+
+    def test_get_item(self):
+        a = np.arange(1050 * 20, dtype='f8').reshape(1050, 20)
+        z = self.create_array(shape=a.shape, chunks=(100, 7), dtype='f8',
+                              fill_value=0)
+        z[:500] = a[:500]
+        a[500:] = 0
+
+        for selection in [(0, 0), (42, 3), (499, 19), (-1, -1), (np.int64(7), 13),
+                          (np.uint8(2), np.int32(-3)), (1049, 6)]:
+            item = z[selection]
+            assert isinstance(item, np.float64)
+            assert a[selection] == item
+            assert a[selection] == z.get_basic_selection(selection)
+        for selection in [(1050, 0), (0, 20), (-1051, 0)]:
+            with pytest.raises(IndexError):
+                z[selection]
+
+        # items of chunks held in the write-back buffer
+        with z.write_back():
+            z[42, 3] = a[99, 9]
+            assert a[99, 9] == z[42, 3]
+        assert a[99, 9] == z[42, 3]
+
+        # 1-dimensional array
+        z = self.create_array(shape=105, chunks=10, dtype='i4', fill_value=0)
+        z[:50] = np.arange(50)
+        assert 42 == z[42]
+        assert 0 == z[-1]
+        assert isinstance(z[np.int16(7)], np.int32)
+        if hasattr(z.store, 'close'):
+            z.store.close()
+
+    def test_plan(self):
+        a = np.arange(1050 * 20, dtype='i4').reshape(1050, 20)
+        z = self.create_array(shape=a.shape, chunks=(100, 7), dtype='i4',
+                              fill_value=0)
+        z[:] = a
+
+        # basic selection
+        p = z.plan((slice(0, 150), 5))
+        assert (150,) == p.out_shape
+        assert np.dtype('i4') == p.dtype
+        assert (z._chunk_key((0, 0)), z._chunk_key((1, 0))) == p.chunk_keys
+        assert 2 == len(p.chunk_selections) == len(p.out_selections)
+        assert_array_equal(a[0:150, 5], p.get())
+        out = np.zeros(p.out_shape, dtype=p.dtype)
+        for _ in range(2):
+            assert p.get(out=out) is out
+            assert_array_equal(a[0:150, 5], out)
+        assert a[42, 3] == z.plan((42, 3)).get()
+
+        # sliding window by a multiple of the chunk shape
+        for t0 in range(0, 1000, 100):
+            q = p.translate((t0, 0))
+            assert_array_equal(a[t0:t0 + 150, 5], q.get(out=out))
+            assert_array_equal(a[t0:t0 + 150, 5], out)
+        assert_array_equal(a[400:550, 19], p.translate((400, 14)).get())
+        assert_array_equal(a[0:150, 5], p.get())
+        with pytest.raises(ValueError):
+            p.translate((50, 0))
+        with pytest.raises(ValueError):
+            p.translate(100)
+        with pytest.raises(IndexError):
+            p.translate((1000, 0))
+        with pytest.raises(IndexError):
+            p.translate((-100, 0))
+
+        # orthogonal selection
+        ix0 = [999, 3, 3, 500]
+        ix1 = a[0] % 3 == 0
+        p = z.oindex.plan((ix0, ix1))
+        assert_array_equal(a[np.ix_(ix0, ix1)], p.get())
+        out = np.zeros(p.out_shape, dtype=p.dtype)
+        assert_array_equal(a[np.ix_(ix0, ix1)], p.get(out=out))
+        assert_array_equal(a[np.ix_(ix0, ix1)], out)
+        assert_array_equal(a[2:152, 5], z.oindex.plan((slice(2, 152), 5)).get())
+
+        # coordinate and mask selections
+        ix0 = np.array([[1, 1049], [3, 500]])
+        ix1 = np.array([[0, 19], [7, 3]])
+        p = z.vindex.plan((ix0, ix1))
+        assert (2, 2) == p.out_shape
+        out = np.zeros(p.out_shape, dtype=p.dtype)
+        assert_array_equal(a[ix0, ix1], p.get(out=out))
+        assert_array_equal(a[ix0, ix1], out)
+        with pytest.raises(IndexError):
+            p.translate((100, 0))
+        assert_array_equal(a[ix0 - 1, ix1], z.vindex.plan((ix0 - 1, ix1)).get())
+        mask = a % 11 == 0
+        p = z.vindex.plan(mask)
+        assert_array_equal(a[mask], p.get())
+        with pytest.raises(IndexError):
+            z.vindex.plan((slice(None), 0))
+
+        # plans are invalidated when the shape of the array changes
+        p = z.plan((slice(0, 150), 5))
+        z.resize(2000, 20)
+        with pytest.raises(StalePlanError):
+            p.get()
+        with pytest.raises(StalePlanError):
+            p.translate((100, 0))
+        z.resize(a.shape)
+        assert_array_equal(a[0:150, 5], p.get())
+
+        if hasattr(z.store, 'close'):
+            z.store.close()
+
+    def test_get_many(self):
+        a = np.arange(1050 * 20, dtype='i4').reshape(1050, 20)
+        z = self.create_array(shape=a.shape, chunks=(100, 7), dtype='i4',
+                              fill_value=0)
+        z[:500] = a[:500]
+        a[500:] = 0
+
+        selections = [
+            (slice(90, 210), slice(5, 9)),
+            (slice(95, 105), 6),
+            (42, 3),
+            Ellipsis,
+            (slice(None, None, 7), slice(2, None, 3)),
+            (slice(480, 620),),
+            (slice(50, 50),),
+        ]
+        outs = z.get_many(selections)
+        assert len(selections) == len(outs)
+        for selection, out in zip(selections, outs):
+            assert_array_equal(a[selection], out)
+        assert isinstance(outs[2], np.int32)
+
+        # mixed with plans
+        ix0 = np.array([[1, 1049], [3, 500]])
+        ix1 = np.array([[0, 19], [7, 3]])
+        mask = a % 11 == 0
+        outs = z.get_many([z.plan((slice(0, 150), 5)), z.oindex.plan(([7, 3], [1, 2])),
+                           z.vindex.plan((ix0, ix1)), z.vindex.plan(mask), (0, 0)])
+        assert_array_equal(a[0:150, 5], outs[0])
+        assert_array_equal(a[np.ix_([7, 3], [1, 2])], outs[1])
+        assert_array_equal(a[ix0, ix1], outs[2])
+        assert_array_equal(a[mask], outs[3])
+        assert a[0, 0] == outs[4]
+        assert [] == z.get_many([])
+
+        # with a chunk cache
+        z2 = Array(z.store, path=z.path, chunk_store=z.chunk_store, read_only=True,
+                   chunk_cache=LRUChunkCache(max_size=None))
+        for _ in range(2):
+            for selection, out in zip(selections, z2.get_many(selections)):
+                assert_array_equal(a[selection], out)
+
+        other = self.create_array(shape=a.shape, chunks=(100, 7), dtype='i4')
+        with pytest.raises(ValueError):
+            z.get_many([other.plan(Ellipsis)])
+        p = z.plan((slice(0, 150), 5))
+        z.resize(2000, 20)
+        with pytest.raises(StalePlanError):
+            z.get_many([p])
+
+        if hasattr(z.store, 'close'):
+            z.store.close()
+
+    def test_async_selections(self):
+        a = np.arange(1050 * 20, dtype='i4').reshape(1050, 20)
+        z = self.create_array(shape=a.shape, chunks=(100, 7), dtype='i4',
+                              fill_value=0)
+
+        async def run():
+            assert_array_equal(np.zeros_like(a), await z.get_basic_selection_async())
+            await z.set_basic_selection_async(Ellipsis, a)
+            await z.set_basic_selection_async((slice(95, 205), 3), 42)
+            a[95:205, 3] = 42
+            results = await asyncio.gather(
+                z.get_basic_selection_async(),
+                z.get_basic_selection_async((slice(90, 1010, 3), slice(2, 17))),
+                z.get_basic_selection_async((5, 5)),
+                z.get_orthogonal_selection_async(([1, 500, 1049], slice(None))),
+                z.get_coordinate_selection_async(([[1, 5], [99, 1000]],
+                                                  [[0, 19], [3, 3]])),
+            )
+            assert_array_equal(a, results[0])
+            assert_array_equal(a[90:1010:3, 2:17], results[1])
+            assert a[5, 5] == results[2]
+            assert_array_equal(a[[1, 500, 1049]], results[3])
+            assert_array_equal(a[[[1, 5], [99, 1000]], [[0, 19], [3, 3]]], results[4])
+
+        asyncio.run(run())
+        assert_array_equal(a, z[:])
+
+        if hasattr(z.store, 'close'):
+            z.store.close()
+
     def test_compressors(self):
         compressors = [
             None, BZ2(), Blosc(), LZ4(), Zlib(), GZip()
@@ -1623,6 +2042,122 @@ class TestArrayWithDirectoryStore(TestArray):
         assert expect_nbytes_stored == z.nbytes_stored
 
 
+class TestArrayWithDirectoryStorePartialRead(TestArrayWithDirectoryStore):
+
+    @staticmethod
+    def create_array(read_only=False, **kwargs):
+        path = mkdtemp()
+        atexit.register(shutil.rmtree, path)
+        store = DirectoryStore(path)
+        cache_metadata = kwargs.pop('cache_metadata', True)
+        cache_attrs = kwargs.pop('cache_attrs', True)
+        kwargs.setdefault('compressor', Blosc())
+        init_array(store, **kwargs)
+        return Array(store, read_only=read_only, cache_metadata=cache_metadata,
+                     cache_attrs=cache_attrs, partial_decompress=True)
+
+    def test_hexdigest(self):
+        TestArrayWithFSStorePartialRead.test_hexdigest(self)
+
+    def test_read_from_all_blocks(self):
+        z = self.create_array(shape=1000000, chunks=100_000, dtype='i4')
+        z[2:99_000] = 1
+        b = Array(z.store, read_only=True, partial_decompress=True)
+        assert (b[2:99_000] == 1).all()
+        assert (b[40_000:80_000:7] == 1).all()
+
+    def test_partial_read_selections(self):
+        a = np.arange(60_000, dtype='i4').reshape(60, 40, 25)
+        z = self.create_array(shape=a.shape, chunks=(30, 20, 25), dtype='i4',
+                              compressor=Blosc(blocksize=1000))
+        z[:] = a
+        selections = [
+            (slice(3, 17), slice(None), slice(None)),
+            (slice(3, 17), slice(5, 30), slice(None)),
+            (slice(1, 50, 7), slice(2, 33, 3), slice(4, 20)),
+            (5, slice(None), 7),
+            (slice(None), 11, slice(1, 24, 2)),
+            (44, 3, 24),
+            (slice(20, 20), slice(None), slice(None)),
+        ]
+        for selection in selections:
+            assert_array_equal(a[selection], z[selection])
+            assert_array_equal(a[selection], z.get_orthogonal_selection(selection))
+        ix = [2, 45, 46]
+        assert_array_equal(a[ix, 3:7], z.get_orthogonal_selection((ix, slice(3, 7))))
+        ix = np.array([3, 35])
+        assert_array_equal(a[ix, ix, 2], z.get_coordinate_selection((ix, ix, 2)))
+        rs = np.random.RandomState(42)
+        ix = tuple(rs.randint(0, n, size=100) for n in a.shape)
+        assert_array_equal(a[ix], z.vindex[ix])
+        ix = [np.array([59, 2, 31, 30]), np.array([0, 39, 21]), np.array([24, 0, 5])]
+        assert_array_equal(a[np.ix_(*ix)], z.oindex[tuple(ix)])
+        assert_array_equal(a[ix[0], 5, :], z.oindex[ix[0], 5, :])
+        mask = np.zeros(a.shape, dtype=bool)
+        mask[::7, 3::11, ::3] = True
+        assert_array_equal(a[mask], z.vindex[mask])
+        assert_array_equal(a[:, mask[0, :, 0]], z.oindex[:, mask[0, :, 0]])
+
+        # values written into a non-contiguous output
+        out = np.zeros((14, 40, 50), dtype='i4')
+        z.get_basic_selection((slice(3, 17), slice(None), slice(None)),
+                              out=out[:, :, ::2])
+        assert_array_equal(a[3:17], out[:, :, ::2])
+
+
+class TestArrayWithDirectoryStoreMemoryMap(TestArrayWithDirectoryStore):
+
+    @staticmethod
+    def create_array(read_only=False, **kwargs):
+        path = mkdtemp()
+        atexit.register(shutil.rmtree, path)
+        store = DirectoryStore(path, memory_map=True)
+        cache_metadata = kwargs.pop('cache_metadata', True)
+        cache_attrs = kwargs.pop('cache_attrs', True)
+        kwargs.setdefault('compressor', None)
+        init_array(store, **kwargs)
+        return Array(store, read_only=read_only, cache_metadata=cache_metadata,
+                     cache_attrs=cache_attrs)
+
+    def test_hexdigest(self):
+        TestArrayWithNoCompressor.test_hexdigest(self)
+
+    def test_store_has_bytes_values(self):
+        pass  # returns values as memoryviews instead of bytes
+
+    def test_selection_view(self):
+        a = np.arange(2000, dtype='i4').reshape(100, 20)
+        z = self.create_array(shape=a.shape, chunks=(10, 10), dtype='i4')
+        z[:] = a
+
+        # selections within a single chunk are views of the mapped chunk
+        v = z[12:17, 3:8]
+        assert_array_equal(a[12:17, 3:8], v)
+        assert not v.flags.writeable
+        assert not v.flags.owndata
+        v = z[15, 10:]
+        assert_array_equal(a[15, 10:], v)
+        assert not v.flags.writeable
+        assert a[15, 15] == z[15, 15]
+
+        # views are not affected by subsequent writes
+        z[:] = 0
+        assert_array_equal(a[15, 10:], v)
+        assert_array_equal(np.zeros(10), z[15, 10:])
+
+        # other selections are copied into a new array
+        v = z[5:15]
+        assert v.flags.writeable
+        v = z.get_orthogonal_selection(([1, 2], slice(None)))
+        assert v.flags.writeable
+        with z.write_back():
+            z[15, 15] = 1
+            assert z[15:17, 10:20].flags.writeable
+            assert 1 == z[15, 15]
+        if hasattr(z.store, 'close'):
+            z.store.close()
+
+
 @skip_test_env_var("ZARR_TEST_ABS")
 class TestArrayWithABSStore(TestArray):
 
@@ -2059,6 +2594,10 @@ class TestArrayWithSQLiteStore(TestArray):
     def test_nbytes_stored(self):
         pass  # not implemented
 
+    def test_async_selections(self):
+        # skip this one, store does not support concurrent reads from multiple threads
+        pass
+
 
 class TestArrayWithNoCompressor(TestArray):
 
@@ -2466,6 +3005,19 @@ class TestArrayWithStoreCache(TestArray):
         pass
 
 
+class TestArrayWithShardedStoreCache(TestArrayWithStoreCache):
+
+    @staticmethod
+    def create_array(read_only=False, **kwargs):
+        store = ShardedLRUStoreCache(dict(), max_size=None, nshards=4)
+        kwargs.setdefault('compressor', Zlib(level=1))
+        cache_metadata = kwargs.pop('cache_metadata', True)
+        cache_attrs = kwargs.pop('cache_attrs', True)
+        init_array(store, **kwargs)
+        return Array(store, read_only=read_only, cache_metadata=cache_metadata,
+                     cache_attrs=cache_attrs)
+
+
 @pytest.mark.skipif(have_fsspec is False, reason="needs fsspec")
 class TestArrayWithFSStore(TestArray):
     @staticmethod
@@ -2731,3 +3283,322 @@ class TestArrayWithFSStoreNestedPartialRead(TestArray):
         z[2:99_000] = 1
         b = Array(z.store, read_only=True, partial_decompress=True)
         assert (b[2:99_000] == 1).all()
+
+
+class TestArrayWithChunkCache(TestArray):
+
+    @staticmethod
+    def create_array(read_only=False, **kwargs):
+        store = dict()
+        kwargs.setdefault('compressor', Zlib(level=1))
+        cache_metadata = kwargs.pop('cache_metadata', True)
+        cache_attrs = kwargs.pop('cache_attrs', True)
+        init_array(store, **kwargs)
+        return Array(store, read_only=read_only, cache_metadata=cache_metadata,
+                     cache_attrs=cache_attrs, chunk_cache=LRUChunkCache(max_size=None))
+
+    def test_chunk_cache_hits(self):
+        z = self.create_array(shape=(100, 100), chunks=(10, 10), dtype='i4')
+        cache = z.chunk_cache
+        a = np.arange(10000, dtype='i4').reshape(100, 100)
+        z[:] = a
+        assert 0 == len(cache)
+        assert_array_equal(a[:20, :20], z[:20, :20])
+        assert 0 == cache.hits
+        assert 4 == cache.misses
+        assert 4 == len(cache)
+        assert 4 * 400 == cache.current_size
+        assert_array_equal(a[5:15, 5:15], z[5:15, 5:15])
+        assert 4 == cache.hits
+        assert 4 == cache.misses
+
+        # writes invalidate cached chunks
+        z[5, 5] = -1
+        a[5, 5] = -1
+        assert 3 == len(cache)
+        assert_array_equal(a[:20, :20], z[:20, :20])
+        assert 7 == cache.hits
+        assert 5 == cache.misses
+
+        # cached chunks are read-only
+        for _, chunk in cache._values_cache.values():
+            assert not chunk.flags.writeable
+
+        # resizing removes deleted chunks
+        z.resize(10, 10)
+        assert 1 == len(cache)
+
+    def test_chunk_cache_shared(self):
+        z1 = self.create_array(shape=100, chunks=10, dtype='i4', fill_value=0)
+        z1[:] = 42
+        cache = z1.chunk_cache
+        z2 = Array(z1.store, chunk_cache=cache)
+        assert_array_equal(np.full(100, 42), z1[:])
+        assert_array_equal(np.full(100, 42), z2[:])
+        assert 10 == cache.hits
+        assert 10 == cache.misses
+        z2[:50] = 0
+        assert_array_equal(np.array([0] * 50 + [42] * 50), z1[:])
+
+    def test_chunk_cache_max_size(self):
+        z = self.create_array(shape=100, chunks=10, dtype='i8')
+        z._chunk_cache = LRUChunkCache(max_size=200)
+        z[:] = np.arange(100)
+        assert_array_equal(np.arange(100), z[:])
+        assert 2 == len(z.chunk_cache)
+        assert 160 == z.chunk_cache.current_size
+        assert_array_equal(np.arange(80, 100), z[80:])
+        assert 2 == z.chunk_cache.hits
+
+
+@pytest.mark.skipif(have_fsspec is False, reason="needs fsspec")
+class TestArrayWithFSStoreChunkCache(TestArrayWithFSStore):
+
+    def create_array(self, read_only=False, **kwargs):
+        z = super().create_array(read_only=read_only, **kwargs)
+        z._chunk_cache = LRUChunkCache(max_size=None)
+        return z
+
+
+class TestArrayWithExecutor(TestArray):
+
+    executor = ThreadPoolExecutor(max_workers=4)
+
+    def create_array(self, read_only=False, **kwargs):
+        store = dict()
+        kwargs.setdefault('compressor', Zlib(level=1))
+        cache_metadata = kwargs.pop('cache_metadata', True)
+        cache_attrs = kwargs.pop('cache_attrs', True)
+        init_array(store, **kwargs)
+        return Array(store, read_only=read_only, cache_metadata=cache_metadata,
+                     cache_attrs=cache_attrs, executor=self.executor)
+
+    def test_executor(self):
+        z = self.create_array(shape=(1000, 1000), chunks=(100, 100), dtype='i4')
+        assert z.executor is self.executor
+        assert z.view().executor is self.executor
+        a = np.arange(1000000, dtype='i4').reshape(1000, 1000)
+        z[:] = a
+        assert_array_equal(a, z[:])
+        assert_array_equal(a[55:555, 5:995:3], z[55:555, 5:995:3])
+        assert_array_equal(a[[1, 500, 999]], z.oindex[[1, 500, 999]])
+
+    def test_executor_error(self):
+        z = self.create_array(shape=1000, chunks=100, dtype='i4')
+        z[:] = 42
+        z.store['5'] = b'corrupt'
+        with pytest.raises(Exception):
+            z[:]
+
+    def test_process_pool_executor(self):
+        a = np.arange(100000, dtype='i4').reshape(1000, 100)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            z = self.create_array(shape=a.shape, chunks=(100, 30), dtype='i4')
+            z._executor = executor
+            z[:] = a
+            z[5, :] = 42
+            z[:10, 95:] = -1
+            expect = a.copy()
+            expect[5, :] = 42
+            expect[:10, 95:] = -1
+            # chunks are decoded sequentially
+            assert_array_equal(expect, z[:])
+            assert z.nchunks == z.nchunks_initialized
+
+    def test_default_executor(self):
+        store = dict()
+        init_array(store, shape=1000, chunks=100, dtype='i4')
+        z = Array(store)
+        assert z.executor is None
+        previous = set_executor(self.executor)
+        try:
+            assert previous is None
+            assert z.executor is self.executor
+            z[:] = np.arange(1000)
+            assert_array_equal(np.arange(1000), z[:])
+        finally:
+            set_executor(previous)
+        assert z.executor is None
+
+
+@pytest.mark.skipif(have_fsspec is False, reason="needs fsspec")
+class TestArrayWithFSStoreExecutor(TestArrayWithFSStore):
+
+    executor = ThreadPoolExecutor(max_workers=4)
+
+    def create_array(self, read_only=False, **kwargs):
+        z = super().create_array(read_only=read_only, **kwargs)
+        z._executor = self.executor
+        return z
+
+
+class AsyncDict(dict):
+    """Store with a coroutine interface for retrieving and storing chunks."""
+
+    async def getitems(self, keys, **kwargs):
+        return {k: self[k] for k in keys if k in self}
+
+    async def setitems(self, values):
+        self.update(values)
+
+
+def test_async_store():
+    store = AsyncDict()
+    init_array(store, shape=100, chunks=10, dtype='i4', fill_value=0)
+    z = Array(store)
+
+    async def run():
+        await z.set_basic_selection_async(slice(5, 35), np.arange(30))
+        return await z.get_basic_selection_async(slice(0, 40))
+
+    expect = np.zeros(40, dtype='i4')
+    expect[5:35] = np.arange(30)
+    assert_array_equal(expect, asyncio.run(run()))
+    assert ['.zarray', '0', '1', '2', '3'] == sorted(store)
+
+    # a read-only array cannot be modified
+    z = Array(store, read_only=True)
+    with pytest.raises(PermissionError):
+        asyncio.run(z.set_basic_selection_async(slice(None), 0))
+
+
+def test_write_back_store_access():
+    store = CountingDict()
+    init_array(store, shape=(1000, 10), chunks=(500, 10), dtype='i4', fill_value=0)
+    z = Array(store)
+    z[:] = 1
+    store.counter.clear()
+    with z.write_back():
+        for i in range(1000):
+            z[i] = i
+        with z.write_back():
+            z[0] = -1
+        assert 0 == sum(v for k, v in store.counter.items() if k[0] == '__setitem__')
+    # each chunk retrieved and stored only once
+    assert 1 == store.counter['__getitem__', '0.0']
+    assert 1 == store.counter['__getitem__', '1.0']
+    assert 1 == store.counter['__setitem__', '0.0']
+    assert 1 == store.counter['__setitem__', '1.0']
+    assert -1 == z[0, 0]
+    assert 999 == z[999, 9]
+
+    # buffered chunks are stored on error
+    with pytest.raises(ValueError):
+        with z.write_back():
+            z[5] = 5
+            raise ValueError
+    assert 5 == z[5, 0]
+    assert 2 == store.counter['__setitem__', '0.0']
+
+
+class RangeCountingDict(CountingDict):
+
+    def getrange(self, key, start, length):
+        value = self.wrapped[key][start:start + length]
+        self.counter['getrange', key] += 1
+        self.counter['nbytes_read'] += len(value)
+        return value
+
+
+def test_partial_read_store_access():
+    store = RangeCountingDict()
+    init_array(store, shape=100_000, chunks=100_000, dtype='i4',
+               compressor=Blosc(cname='zstd', clevel=1, shuffle=0, blocksize=4000))
+    z = Array(store)
+    a = np.random.RandomState(42).randint(0, 1000, size=100_000, dtype='i4')
+    z[:] = a
+    cbytes = len(store['0'])
+    b = Array(store, read_only=True, partial_decompress=True)
+
+    # only the blocks holding the selected items are read
+    store.counter.clear()
+    assert_array_equal(a[10_000:12_000], b[10_000:12_000])
+    assert_array_equal(a[5], b[5])
+    assert 0 == store.counter['__getitem__', '0']
+    assert 0 < store.counter['nbytes_read'] < cbytes // 10
+
+    # only the blocks holding scattered points are read
+    ix = np.array([4322, 7, 99_999, 4321])
+    store.counter.clear()
+    assert_array_equal(a[ix], b.vindex[ix])
+    assert_array_equal(a[ix], b.oindex[ix])
+    assert 0 == store.counter['__getitem__', '0']
+    assert 0 < store.counter['nbytes_read'] < cbytes // 5
+
+    # reading the whole chunk
+    store.counter.clear()
+    assert_array_equal(a, b[:])
+    assert 1 == store.counter['__getitem__', '0']
+
+
+def test_get_item_store_access():
+    store = CountingDict()
+    init_array(store, shape=(100, 100), chunks=(10, 10), dtype='i4')
+    z = Array(store)
+    z[:] = np.arange(10000).reshape(100, 100)
+
+    # with a chunk cache, a decoded chunk is reused for subsequent items
+    z = Array(store, chunk_cache=LRUChunkCache(max_size=None))
+    store.counter.clear()
+    for i in range(10):
+        assert 5 * 100 + i == z[5, i]
+    assert 1 == store.counter['__getitem__', '0.0']
+
+
+def test_get_many_store_access():
+    store = GetitemsCountingDict()
+    init_array(store, shape=(100, 100), chunks=(10, 10), dtype='i4', fill_value=0)
+    z = Array(store)
+    a = np.arange(10000, dtype='i4').reshape(100, 100)
+    z[:50] = a[:50]
+    a[50:] = 0
+
+    # overlapping tiles, all chunks are retrieved with a single call
+    selections = [(slice(i, i + 15), slice(i, i + 15)) for i in range(0, 80, 5)]
+    store.counter.clear()
+    decode_chunk = z._decode_chunk
+    decoded = collections.Counter()
+
+    def counting_decode_chunk(cdata):
+        decoded[bytes(cdata)] += 1
+        return decode_chunk(cdata)
+
+    z._decode_chunk = counting_decode_chunk
+    outs = z.get_many(selections)
+    for selection, out in zip(selections, outs):
+        assert_array_equal(a[selection], out)
+    assert 1 == store.counter['getitems']
+    expect_keys = {'{}.{}'.format(ci, cj) for i in range(0, 80, 5)
+                   for ci in range(i // 10, (i + 14) // 10 + 1)
+                   for cj in range(i // 10, (i + 14) // 10 + 1)}
+    assert expect_keys == {k[1] for k in store.counter if k != 'getitems'}
+    assert all(1 == store.counter['getitems', k] for k in expect_keys)
+    assert all(1 == n for n in decoded.values())
+
+    # zero-dimensional array
+    store = dict()
+    init_array(store, shape=())
+    z = Array(store)
+    z[...] = 42
+    assert [42, 42] == z.get_many([(), Ellipsis])
+    assert 42 == z.plan(()).get()
+
+
+def test_store_cache_getitems():
+    store = GetitemsCountingDict()
+    init_array(store, shape=(100, 100), chunks=(10, 10), dtype='i4', fill_value=0)
+    a = np.arange(10000, dtype='i4').reshape(100, 100)
+    Array(store)[:] = a
+    z = Array(LRUStoreCache(store, max_size=None))
+
+    # chunks are retrieved from the store wrapped by the cache in a single batch
+    store.counter.clear()
+    assert_array_equal(a[5:45, 5:45], z[5:45, 5:45])
+    assert 1 == store.counter['getitems']
+    assert 0 == sum(n for k, n in store.counter.items() if k[0] == '__getitem__')
+    assert_array_equal(a[5:55, 5:45], z[5:55, 5:45])
+    assert 2 == store.counter['getitems']
+    # only the chunks not already cached are retrieved
+    retrieved = [k[1] for k in store.counter if k[0] == 'getitems' and k != 'getitems']
+    assert 5 * 5 + 5 == len(retrieved)
+    assert all(1 == store.counter['getitems', k] for k in retrieved)
@@ -461,6 +461,26 @@ def test_create():
     assert z.chunks == z.shape
 
 
+def test_create_write_empty_chunks():
+    store = dict()
+    z = create(100, chunks=10, dtype='f8', fill_value=np.nan, store=store,
+               write_empty_chunks=False)
+    assert not z.write_empty_chunks
+    z[:] = np.nan
+    z[5] = 1
+    assert ['.zarray', '0'] == sorted(store)
+    z[5] = np.nan
+    assert ['.zarray'] == sorted(store)
+
+    z = open_array(store, mode='r+', write_empty_chunks=False)
+    z[:15] = 0
+    assert ['.zarray', '0', '1'] == sorted(store)
+    z = open_array(store, mode='r+')
+    assert z.write_empty_chunks
+    z[:] = np.nan
+    assert 11 == len(store)
+
+
 def test_compression_args():
 
     z = create(100, compression='zlib', compression_opts=9)
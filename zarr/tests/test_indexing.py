@@ -1,15 +1,21 @@
+import itertools
+
 import numpy as np
 import pytest
 from numpy.testing import assert_array_equal
 
 import zarr
 from zarr.indexing import (
+    MaskIndexer,
+    SliceDimIndexer,
     normalize_integer_selection,
     oindex,
     oindex_set,
     replace_ellipsis,
     PartialChunkIterator,
+    make_slice_selection,
 )
+from zarr.tests.util import CountingDict
 
 
 def test_normalize_integer_selection():
@@ -208,6 +214,40 @@ def test_get_basic_selection_1d():
             z[selection]
 
 
+def test_slice_dim_indexer():
+
+    for dim_len, dim_chunk_len in [(100, 10), (105, 10), (7, 10), (100, 1)]:
+        for start, stop, step in itertools.product([None, 0, 3, 9, 55], [None, 5, 57, 101],
+                                                   [1, 2, 9, 10, 11, 33, 1000]):
+            dim_sel = slice(start, stop, step)
+            selected = np.arange(dim_len)[dim_sel]
+            projections = list(SliceDimIndexer(dim_sel, dim_len, dim_chunk_len))
+            # only chunks holding selected items are visited, in order
+            expect_chunks = np.unique(selected // dim_chunk_len)
+            assert list(expect_chunks) == [p.dim_chunk_ix for p in projections]
+            # projections cover the selection
+            result = np.empty(len(selected), dtype=int)
+            for p in projections:
+                offset = p.dim_chunk_ix * dim_chunk_len
+                result[p.dim_out_sel] = np.arange(dim_len)[offset:][p.dim_chunk_sel]
+            assert_array_equal(selected, result)
+
+
+def test_get_basic_selection_strided_store_access():
+
+    store = CountingDict()
+    a = np.arange(100_000)
+    z = zarr.create(shape=a.shape, chunks=10, dtype=a.dtype, store=store)
+    z[:] = a
+    store.counter.clear()
+
+    # only chunks holding selected items are retrieved
+    assert_array_equal(a[::1000], z[::1000])
+    assert_array_equal(a[5::1000], z.get_orthogonal_selection(slice(5, None, 1000)))
+    nretrieved = sum(v for k, v in store.counter.items() if k[0] == '__getitem__')
+    assert 200 == nretrieved
+
+
 basic_selections_2d = [
     # single row
     42,
@@ -978,6 +1018,47 @@ def test_get_mask_selection_2d():
         z.vindex[[True, False]]  # wrong no. dimensions
 
 
+def test_mask_selection_3d():
+
+    # setup
+    v = np.arange(30 * 20 * 17, dtype=int).reshape(30, 20, 17)
+    a = np.empty_like(v)
+    z = zarr.create(shape=a.shape, chunks=(7, 6, 5), dtype=a.dtype)
+    z[:] = v
+
+    np.random.seed(42)
+    # test with different degrees of sparseness
+    for p in 0.5, 0.1, 0.01, 0:
+        ix = np.random.binomial(1, p, size=a.shape).astype(bool)
+        assert_array_equal(v[ix], z.get_mask_selection(ix))
+        _test_set_mask_selection(v, a, z, ix)
+        z[:] = v
+
+
+def test_mask_indexer():
+
+    a = np.arange(100).reshape(10, 10)
+    z = zarr.create(shape=a.shape, chunks=(4, 3), dtype=a.dtype)
+    mask = (a % 7 == 0) | (a > 90)
+    indexer = MaskIndexer(mask, z)
+    assert (np.count_nonzero(mask),) == indexer.shape
+    expect = np.zeros(indexer.shape, dtype=bool)
+    for chunk_coords, chunk_selection, out_selection in indexer:
+        # chunks holding no selected items are not visited
+        assert len(chunk_selection[0]) > 0
+        offset = np.array(chunk_coords) * z.chunks
+        coords = np.stack(chunk_selection, axis=-1) + offset
+        assert_array_equal(a[mask][out_selection], a[tuple(coords.T)])
+        assert not expect[out_selection].any()
+        expect[out_selection] = True
+    assert expect.all()
+
+    # items selected from a single chunk in each line are contiguous in the output
+    z = zarr.create(shape=a.shape, chunks=(4, 10), dtype=a.dtype)
+    for _, _, out_selection in MaskIndexer(mask, z):
+        assert isinstance(out_selection, slice)
+
+
 def _test_set_mask_selection(v, a, z, selection):
     a[:] = 0
     z[:] = 0
@@ -1301,60 +1382,68 @@ def test_set_selections_with_fields():
         (
             (slice(5, 8, 1), slice(2, 4, 1), slice(0, 100, 1)),
             np.arange(2, 100_002).reshape((100, 10, 100)),
-            [
-                (5200, 200, (slice(5, 6, 1), slice(2, 4, 1))),
-                (6200, 200, (slice(6, 7, 1), slice(2, 4, 1))),
-                (7200, 200, (slice(7, 8, 1), slice(2, 4, 1))),
-            ],
+            [(5200, 200, 0), (6200, 200, 200), (7200, 200, 400)],
         ),
         (
             (slice(5, 8, 1), slice(2, 4, 1), slice(0, 5, 1)),
             np.arange(2, 100_002).reshape((100, 10, 100)),
             [
-                (5200.0, 5.0, (slice(5, 6, 1), slice(2, 3, 1), slice(0, 5, 1))),
-                (5300.0, 5.0, (slice(5, 6, 1), slice(3, 4, 1), slice(0, 5, 1))),
-                (6200.0, 5.0, (slice(6, 7, 1), slice(2, 3, 1), slice(0, 5, 1))),
-                (6300.0, 5.0, (slice(6, 7, 1), slice(3, 4, 1), slice(0, 5, 1))),
-                (7200.0, 5.0, (slice(7, 8, 1), slice(2, 3, 1), slice(0, 5, 1))),
-                (7300.0, 5.0, (slice(7, 8, 1), slice(3, 4, 1), slice(0, 5, 1))),
+                (5200, 5, 0),
+                (5300, 5, 5),
+                (6200, 5, 10),
+                (6300, 5, 15),
+                (7200, 5, 20),
+                (7300, 5, 25),
             ],
         ),
         (
             (slice(5, 8, 1), slice(2, 4, 1), slice(0, 5, 1)),
             np.asfortranarray(np.arange(2, 100_002).reshape((100, 10, 100))),
             [
-                (5200.0, 5.0, (slice(5, 6, 1), slice(2, 3, 1), slice(0, 5, 1))),
-                (5300.0, 5.0, (slice(5, 6, 1), slice(3, 4, 1), slice(0, 5, 1))),
-                (6200.0, 5.0, (slice(6, 7, 1), slice(2, 3, 1), slice(0, 5, 1))),
-                (6300.0, 5.0, (slice(6, 7, 1), slice(3, 4, 1), slice(0, 5, 1))),
-                (7200.0, 5.0, (slice(7, 8, 1), slice(2, 3, 1), slice(0, 5, 1))),
-                (7300.0, 5.0, (slice(7, 8, 1), slice(3, 4, 1), slice(0, 5, 1))),
+                (5200, 5, 0),
+                (5300, 5, 5),
+                (6200, 5, 10),
+                (6300, 5, 15),
+                (7200, 5, 20),
+                (7300, 5, 25),
             ],
         ),
         (
             (slice(5, 8, 1), slice(2, 4, 1)),
             np.arange(2, 100_002).reshape((100, 10, 100)),
-            [
-                (5200, 200, (slice(5, 6, 1), slice(2, 4, 1))),
-                (6200, 200, (slice(6, 7, 1), slice(2, 4, 1))),
-                (7200, 200, (slice(7, 8, 1), slice(2, 4, 1))),
-            ],
+            [(5200, 200, 0), (6200, 200, 200), (7200, 200, 400)],
         ),
         (
             (slice(0, 10, 1),),
             np.arange(0, 10).reshape((10)),
-            [(0, 10, (slice(0, 10, 1),))],
+            [(0, 10, 0)],
         ),
-        ((0,), np.arange(0, 100).reshape((10, 10)), [(0, 10, (slice(0, 1, 1),))]),
+        ((0,), np.arange(0, 100).reshape((10, 10)), [(0, 10, 0)]),
         (
             (
                 0,
                 0,
             ),
             np.arange(0, 100).reshape((10, 10)),
-            [(0, 1, (slice(0, 1, 1), slice(0, 1, 1)))],
+            [(0, 1, 0)],
         ),
-        ((0,), np.arange(0, 10).reshape((10)), [(0, 1, (slice(0, 1, 1),))]),
+        ((0,), np.arange(0, 10).reshape((10)), [(0, 1, 0)]),
+        (
+            (slice(0, 10, 2),),
+            np.arange(0, 10),
+            [(0, 1, 0), (2, 1, 1), (4, 1, 2), (6, 1, 3), (8, 1, 4)],
+        ),
+        (
+            (slice(1, 10, 3), slice(0, 4, 1)),
+            np.arange(0, 40).reshape((10, 4)),
+            [(4, 4, 0), (16, 4, 4), (28, 4, 8)],
+        ),
+        (
+            (slice(2, 4, 1), slice(0, 4, 2)),
+            np.arange(0, 40).reshape((10, 4)),
+            [(8, 1, 0), (10, 1, 1), (12, 1, 2), (14, 1, 3)],
+        ),
+        ((slice(3, 3, 1),), np.arange(0, 10), []),
         pytest.param(
             (slice(5, 8, 1), slice(2, 4, 1), slice(0, 5, 1)),
             np.arange(2, 100002).reshape((10, 1, 10000)),
@@ -1373,3 +1462,10 @@ def test_PartialChunkIterator(selection, arr, expected):
     PCI = PartialChunkIterator(selection, arr.shape)
     results = list(PCI)
     assert results == expected
+
+    # runs concatenated form the selected data
+    flat = np.ascontiguousarray(arr).reshape(-1)
+    selected = np.concatenate(
+        [flat[start:start + nitems] for start, nitems, _ in results] or [flat[:0]]
+    )
+    assert_array_equal(arr[tuple(make_slice_selection(selection))].reshape(-1), selected)
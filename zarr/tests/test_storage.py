@@ -1,14 +1,19 @@
 import array
+import asyncio
 import atexit
+import functools
 import json
 import os
 import sys
 import pickle
 import shutil
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pickle import PicklingError
-from zipfile import ZipFile
+from zipfile import ZIP_DEFLATED, ZipFile
 
 import numpy as np
 import pytest
@@ -23,15 +28,17 @@ from zarr.meta import (ZARR_FORMAT, decode_array_metadata,
                        decode_group_metadata, encode_array_metadata,
                        encode_group_metadata)
 from zarr.n5 import N5Store
-from zarr.storage import (ABSStore, ConsolidatedMetadataStore, DBMStore,
-                          DictStore, DirectoryStore, LMDBStore, LRUStoreCache,
+from zarr.storage import (ABSStore, AsyncStoreAdapter, ConsolidatedMetadataStore, DBMStore,
+                          DictStore, DirectoryStore, LMDBStore, LRUChunkCache,
+                          LRUPolicy, LRUStoreCache, TinyLFUPolicy,
                           MemoryStore, MongoDBStore, NestedDirectoryStore,
-                          RedisStore, SQLiteStore, TempStore, ZipStore,
+                          RedisStore, ShardedLRUStoreCache, SQLiteStore, TempStore, ZipStore,
                           array_meta_key, atexit_rmglob, atexit_rmtree,
-                          attrs_key, default_compressor, getsize,
+                          attrs_key, default_compressor, getrange, getranges, getsize,
                           group_meta_key, init_array, init_group, migrate_1to2)
 from zarr.storage import FSStore
-from zarr.tests.util import CountingDict, have_fsspec, skip_test_env_var, abs_container
+from zarr.tests.util import (CountingDict, GetitemsCountingDict, have_fsspec,
+                             skip_test_env_var, abs_container)
 
 
 @contextmanager
@@ -248,6 +255,24 @@ class StoreTests(object):
         if hasattr(store, 'close'):
             store.close()
 
+    def test_getrange(self):
+        store = self.create_store()
+        store['foo'] = b'abcdefgh'
+        store['bar/baz'] = np.frombuffer(b'ijklmnop', dtype='u1')
+        assert b'cde' == ensure_bytes(getrange(store, 'foo', 2, 3))
+        assert b'abcdefgh' == ensure_bytes(getrange(store, 'foo', 0, 8))
+        # range extending beyond the end of the value
+        assert b'gh' == ensure_bytes(getrange(store, 'foo', 6, 10))
+        assert b'' == ensure_bytes(getrange(store, 'foo', 8, 2))
+        assert b'mno' == ensure_bytes(getrange(store, 'bar/baz', 4, 3))
+        with pytest.raises(KeyError):
+            getrange(store, 'qux', 0, 1)
+        ranges = getranges(store, [('foo', 0, 2), ('bar/baz', 6, 2), ('foo', 7, 1)])
+        assert [b'ab', b'op', b'h'] == [ensure_bytes(r) for r in ranges]
+
+        if hasattr(store, 'close'):
+            store.close()
+
     # noinspection PyStatementEffect
     def test_hierarchy(self):
         # setup
@@ -1145,13 +1170,58 @@ class TestNestedDirectoryStore(TestDirectoryStore):
         store['0.0'] = b'xxx'
         assert b'xxx' == store['0.0']
         assert b'xxx' == store['0/0']
+        assert b'xx' == store.getrange('0.0', 1, 2)
         store['foo/10.20.30'] = b'yyy'
         assert b'yyy' == store['foo/10.20.30']
         assert b'yyy' == store['foo/10/20/30']
+        assert b'yy' == store.getrange('foo/10.20.30', 0, 2)
         store['42'] = b'zzz'
         assert b'zzz' == store['42']
 
 
+class TestDirectoryStoreMemoryMap(TestDirectoryStore):
+
+    def create_store(self, normalize_keys=False, **kwargs):
+        skip_if_nested_chunks(**kwargs)
+
+        path = tempfile.mkdtemp()
+        atexit.register(atexit_rmtree, path)
+        store = DirectoryStore(path, normalize_keys=normalize_keys, memory_map=True,
+                               **kwargs)
+        return store
+
+    def test_memory_map(self):
+        store = self.create_store()
+        store['foo'] = b'bar'
+        store['empty'] = b''
+        value = store['foo']
+        assert isinstance(value, memoryview)
+        assert value.readonly
+        assert b'bar' == value
+        assert b'' == store['empty']
+
+        # values which have been read are unaffected by writes
+        store['foo'] = b'baz'
+        assert b'bar' == value
+        assert b'baz' == store['foo']
+
+
+class TestNestedDirectoryStoreMemoryMap(TestNestedDirectoryStore):
+
+    def create_store(self, normalize_keys=False, **kwargs):
+        path = tempfile.mkdtemp()
+        atexit.register(atexit_rmtree, path)
+        store = NestedDirectoryStore(path, normalize_keys=normalize_keys,
+                                     memory_map=True, **kwargs)
+        return store
+
+    def test_memory_map(self):
+        store = self.create_store()
+        store['foo/0.0'] = b'bar'
+        assert isinstance(store['foo/0.0'], memoryview)
+        assert b'bar' == store['foo/0/0']
+
+
 class TestNestedDirectoryStoreNone:
 
     def test_value_error(self):
@@ -1198,6 +1268,7 @@ class TestN5Store(TestNestedDirectoryStore):
         assert b'yyy' == store['foo/10.20.30']
         # N5 reverses axis order
         assert b'yyy' == store['foo/30/20/10']
+        assert b'yy' == store.getrange('foo/10.20.30', 1, 2)
         store['42'] = b'zzz'
         assert '42' in store
         assert b'zzz' == store['42']
@@ -1356,6 +1427,13 @@ class TestZipStore(StoreTests):
             store['baz'] = b'qux'
             assert 2 == len(store)
 
+    def test_getrange_compressed(self):
+        store = self.create_store(compression=ZIP_DEFLATED)
+        store['foo'] = b'abcdefgh' * 100
+        assert b'cde' == store.getrange('foo', 2, 3)
+        assert b'h' == store.getrange('foo', 799, 10)
+        store.close()
+
     def test_pop(self):
         # override because not implemented
         store = self.create_store()
@@ -1529,10 +1607,12 @@ class TestRedisStore(StoreTests):
 
 class TestLRUStoreCache(StoreTests):
 
+    LRUStoreClass = LRUStoreCache
+
     def create_store(self, **kwargs):
         # wrapper therefore no dimension_separator argument
         skip_if_nested_chunks(**kwargs)
-        return LRUStoreCache(dict(), max_size=2**27)
+        return self.LRUStoreClass(dict(), max_size=2**27)
 
     def test_cache_values_no_max_size(self):
 
@@ -1546,7 +1626,7 @@ class TestLRUStoreCache(StoreTests):
         assert 1 == store.counter['__setitem__', 'bar']
 
         # setup cache
-        cache = LRUStoreCache(store, max_size=None)
+        cache = self.LRUStoreClass(store, max_size=None)
         assert 0 == cache.hits
         assert 0 == cache.misses
 
@@ -1607,7 +1687,7 @@ class TestLRUStoreCache(StoreTests):
         assert 0 == store.counter['__getitem__', 'foo']
         assert 0 == store.counter['__getitem__', 'bar']
         # setup cache - can only hold one item
-        cache = LRUStoreCache(store, max_size=5)
+        cache = self.LRUStoreClass(store, max_size=5)
         assert 0 == cache.hits
         assert 0 == cache.misses
 
@@ -1654,7 +1734,7 @@ class TestLRUStoreCache(StoreTests):
         assert 0 == store.counter['__getitem__', 'foo']
         assert 0 == store.counter['__getitem__', 'bar']
         # setup cache - can hold two items
-        cache = LRUStoreCache(store, max_size=6)
+        cache = self.LRUStoreClass(store, max_size=6)
         assert 0 == cache.hits
         assert 0 == cache.misses
 
@@ -1694,6 +1774,204 @@ class TestLRUStoreCache(StoreTests):
         assert 4 == cache.hits
         assert 2 == cache.misses
 
+    def test_getitems_setitems(self):
+
+        # setup store
+        store = GetitemsCountingDict()
+        store['foo'] = b'xxx'
+        store['bar'] = b'yyy'
+        cache = self.LRUStoreClass(store, max_size=None)
+
+        # first call, all misses retrieved from the store in a single batch
+        assert {'foo': b'xxx', 'bar': b'yyy'} == cache.getitems(['foo', 'bar', 'baz'])
+        assert 1 == store.counter['getitems']
+        assert 0 == store.counter['__getitem__', 'foo']
+        assert 0 == cache.hits
+        assert 3 == cache.misses
+
+        # second call, hits served from the cache, only the miss is retrieved
+        store['qux'] = b'zzz'
+        assert {'foo': b'xxx', 'qux': b'zzz'} == cache.getitems(['foo', 'qux'])
+        assert 2 == store.counter['getitems']
+        assert 1 == store.counter['getitems', 'foo']
+        assert 1 == store.counter['getitems', 'qux']
+        assert 1 == cache.hits
+        assert 4 == cache.misses
+
+        # all hits, store not called
+        assert {'foo': b'xxx', 'bar': b'yyy'} == cache.getitems(['foo', 'bar'])
+        assert 2 == store.counter['getitems']
+        assert 3 == cache.hits
+
+        # setitems writes through to the store in a single batch and caches values
+        cache.setitems({'foo': b'zzz', 'baz': b'qqq'})
+        assert 1 == store.counter['setitems']
+        assert b'zzz' == store['foo']
+        assert {'foo': b'zzz', 'baz': b'qqq'} == cache.getitems(['foo', 'baz'])
+        assert 2 == store.counter['getitems']
+        assert 'baz' in cache
+
+        # stores without getitems and setitems
+        store = CountingDict()
+        store['foo'] = b'xxx'
+        cache = self.LRUStoreClass(store, max_size=None)
+        assert {'foo': b'xxx'} == cache.getitems(['foo', 'bar'])
+        assert 1 == store.counter['__getitem__', 'foo']
+        cache.setitems({'bar': b'yyy'})
+        assert b'yyy' == store['bar']
+        assert {'foo': b'xxx', 'bar': b'yyy'} == cache.getitems(['foo', 'bar'])
+        assert 1 == store.counter['__getitem__', 'foo']
+
+    def test_cache_missing_keys(self):
+
+        # setup store
+        store = GetitemsCountingDict()
+        store['foo'] = b'xxx'
+        cache = self.LRUStoreClass(store, max_size=None, max_missing_keys=2)
+
+        # first __getitem__ goes to the store, subsequent ones do not
+        for i in range(3):
+            with pytest.raises(KeyError):
+                # noinspection PyStatementEffect
+                cache['bar']
+        assert 1 == store.counter['__getitem__', 'bar']
+        assert 2 == cache.hits
+        assert 1 == cache.misses
+        assert {} == cache.getitems(['bar'])
+        assert 0 == store.counter['getitems']
+        assert {'foo': b'xxx'} == cache.getitems(['foo', 'baz'])
+        assert {'foo': b'xxx'} == cache.getitems(['foo', 'baz'])
+        assert 1 == store.counter['getitems', 'baz']
+
+        # number of missing keys remembered is bounded, least recently used are dropped
+        with pytest.raises(KeyError):
+            # noinspection PyStatementEffect
+            cache['qux']
+        with pytest.raises(KeyError):
+            # noinspection PyStatementEffect
+            cache['baz']
+        with pytest.raises(KeyError):
+            # noinspection PyStatementEffect
+            cache['bar']
+        assert 2 == store.counter['__getitem__', 'bar']
+        assert 0 == store.counter['__getitem__', 'baz']
+
+        # __setitem__ and __delitem__ invalidate missing keys
+        cache['bar'] = b'yyy'
+        assert b'yyy' == cache['bar']
+        del cache['bar']
+        with pytest.raises(KeyError):
+            # noinspection PyStatementEffect
+            cache['bar']
+        store['bar'] = b'zzz'
+        with pytest.raises(KeyError):
+            # noinspection PyStatementEffect
+            cache['bar']
+        cache.invalidate_keys()
+        assert b'zzz' == cache['bar']
+
+        # disabled
+        cache = self.LRUStoreClass(store, max_size=None, max_missing_keys=0)
+        store.counter.clear()
+        for i in range(2):
+            with pytest.raises(KeyError):
+                # noinspection PyStatementEffect
+                cache['qux']
+        assert 2 == store.counter['__getitem__', 'qux']
+
+    def test_seed_missing_keys(self):
+        store = CountingDict()
+        init_array(store, path='arr', shape=(100, 100), chunks=(10, 10), dtype='i4')
+        store['arr/0.0'] = b'xxx'
+        store['arr/1.1'] = b'yyy'
+        store['other/0.0'] = b'zzz'
+        cache = self.LRUStoreClass(store, max_size=None)
+        cache.seed_missing_keys('arr')
+        assert 1 == store.counter['keys']
+        assert {'arr/0.0': b'xxx', 'arr/1.1': b'yyy'} == \
+            cache.getitems(['arr/{}.{}'.format(i, j) for i in range(10) for j in range(10)])
+        assert 2 == sum(n for k, n in store.counter.items() if k[0] == '__getitem__')
+        with pytest.raises(KeyError):
+            # noinspection PyStatementEffect
+            cache['arr/5.5']
+        assert 0 == store.counter['__getitem__', 'arr/5.5']
+        assert b'zzz' == cache['other/0.0']
+
+        # writing invalidates the listing
+        cache['arr/5.5'] = b'qqq'
+        cache.invalidate_values()
+        assert b'qqq' == cache['arr/5.5']
+
+    def test_concurrent_retrieval(self):
+
+        class BlockingStore(GetitemsCountingDict):
+            # retrieval blocks until released, to hold requests in flight
+            def __init__(self):
+                super().__init__()
+                self.release = threading.Event()
+
+            def __getitem__(self, item):
+                self.release.wait()
+                return super().__getitem__(item)
+
+            def getitems(self, keys, on_error='omit'):
+                self.release.wait()
+                return super().getitems(keys, on_error=on_error)
+
+        store = BlockingStore()
+        store['foo'] = b'xxx'
+        store['bar'] = b'yyy'
+        cache = self.LRUStoreClass(store, max_size=None)
+
+        def get(key):
+            try:
+                return cache[key]
+            except KeyError:
+                return None
+
+        n = 8
+        with ThreadPoolExecutor(max_workers=2 * n + 1) as executor:
+            futures = [executor.submit(get, key) for key in ['foo', 'baz'] * n]
+            futures.append(executor.submit(cache.getitems, ['foo', 'bar', 'baz']))
+            # wait until all requests are in flight
+            while cache.misses < 2 * n + 3:
+                time.sleep(0.001)
+            store.release.set()
+            results = [f.result() for f in futures]
+
+        assert [b'xxx', None] * n + [{'foo': b'xxx', 'bar': b'yyy'}] == results
+        # each key has been retrieved from the store once
+        for key in 'foo', 'bar', 'baz':
+            assert 1 == (store.counter['__getitem__', key] +
+                         store.counter['getitems', key])
+        assert b'xxx' == cache['foo']
+        assert 2 * n + 3 == cache.misses
+        assert 1 == cache.hits
+
+        # errors are shared with waiting threads
+        class FailingStore(BlockingStore):
+            def __getitem__(self, item):
+                super().__getitem__(item)
+                raise RuntimeError('foo')
+
+        store = FailingStore()
+        store['foo'] = b'xxx'
+        cache = self.LRUStoreClass(store, max_size=None)
+        with ThreadPoolExecutor(max_workers=n) as executor:
+            futures = [executor.submit(cache.__getitem__, 'foo') for _ in range(n)]
+            while cache.misses < n:
+                time.sleep(0.001)
+            store.release.set()
+            for f in futures:
+                with pytest.raises(RuntimeError):
+                    f.result()
+        assert 1 == store.counter['__getitem__', 'foo']
+        # failed retrievals are not cached
+        with pytest.raises(RuntimeError):
+            # noinspection PyStatementEffect
+            cache['foo']
+        assert 2 == store.counter['__getitem__', 'foo']
+
     def test_cache_keys(self):
 
         # setup
@@ -1703,7 +1981,7 @@ class TestLRUStoreCache(StoreTests):
         assert 0 == store.counter['__contains__', 'foo']
         assert 0 == store.counter['__iter__']
         assert 0 == store.counter['keys']
-        cache = LRUStoreCache(store, max_size=None)
+        cache = self.LRUStoreClass(store, max_size=None)
 
         # keys should be cached on first call
         keys = sorted(cache.keys())
@@ -1753,6 +2031,247 @@ class TestLRUStoreCache(StoreTests):
         assert 1 == store.counter['__iter__']
 
 
+class TestShardedLRUStoreCache(TestLRUStoreCache):
+
+    @staticmethod
+    def LRUStoreClass(store, max_size, **kwargs):
+        return ShardedLRUStoreCache(store, max_size, nshards=4, **kwargs)
+
+    def test_cache_values_with_max_size(self):
+        # order of eviction is only defined within a shard
+        self.LRUStoreClass = functools.partial(ShardedLRUStoreCache, nshards=1)
+        super().test_cache_values_with_max_size()
+
+    def test_cache_missing_keys(self):
+        # order of eviction is only defined within a shard
+        self.LRUStoreClass = functools.partial(ShardedLRUStoreCache, nshards=1)
+        super().test_cache_missing_keys()
+
+    def test_shards(self):
+        store = GetitemsCountingDict()
+        keys = ['foo/{}'.format(i) for i in range(100)]
+        for key in keys:
+            store[key] = b'xxx'
+        cache = ShardedLRUStoreCache(store, max_size=4 * 30, nshards=4)
+
+        # keys are partitioned across shards, each with its own size budget
+        assert {key: b'xxx' for key in keys} == cache.getitems(keys)
+        assert 1 == store.counter['getitems']
+        assert 100 == cache.misses
+        assert all(30 == shard._current_size for shard in cache._shards)
+
+        # hits are aggregated over shards
+        cached = [key for shard in cache._shards for key in shard._values_cache]
+        for key in cached:
+            assert b'xxx' == cache[key]
+        assert len(cached) == cache.hits
+        assert 0 == sum(n for k, n in store.counter.items() if k[0] == '__getitem__')
+
+        # writes invalidate keys cached by all shards
+        assert 100 == len(cache.listdir('foo'))
+        cache['foo/100'] = b'yyy'
+        assert 101 == len(cache.listdir('foo'))
+        assert 'foo/100' in cache
+        assert b'yyy' == cache['foo/100']
+        del cache['foo/100']
+        assert 'foo/100' not in cache
+        cache.setitems({'bar': b'zzz', 'foo/0': b'zzz'})
+        assert ['bar', 'foo'] == cache.listdir()
+        assert {'bar': b'zzz', 'foo/0': b'zzz'} == cache.getitems(['bar', 'foo/0', 'baz'])
+
+        cache.invalidate()
+        assert 0 == sum(len(shard._values_cache) for shard in cache._shards)
+
+
+class TestStoreCachePolicies(object):
+
+    @staticmethod
+    def scan(policy):
+        # access hot keys repeatedly, then scan over many keys once each
+        store = CountingDict()
+        for i in range(1000):
+            store['k{}'.format(i)] = b'x' * 10
+        cache = LRUStoreCache(store, max_size=100, policy=policy)
+        hot = ['k{}'.format(i) for i in range(8)]
+        for _ in range(3):
+            for key in hot:
+                assert b'x' * 10 == cache[key]
+        for i in range(8, 1000):
+            assert b'x' * 10 == cache['k{}'.format(i)]
+        assert cache._current_size <= 100
+        store.counter.clear()
+        for key in hot:
+            assert b'x' * 10 == cache[key]
+        return sum(store.counter.values())
+
+    def test_scan(self):
+        # with LRU, the scan evicts all hot keys
+        assert 8 == self.scan('lru')
+        assert 8 == self.scan(LRUPolicy)
+        # scan resistant policies keep hot keys cached
+        assert 0 == self.scan('tinylfu')
+        assert 0 == self.scan(functools.partial(TinyLFUPolicy, width=4096))
+        assert 0 == self.scan('arc')
+
+        with pytest.raises(ValueError):
+            LRUStoreCache(dict(), max_size=100, policy='foo')
+
+    def test_tinylfu(self):
+        policy = TinyLFUPolicy(max_size=100, width=64, sample_size=20)
+        for _ in range(3):
+            policy.miss('foo')
+        assert 3 == policy.frequency('foo')
+        assert 0 == policy.frequency('bar')
+
+        # frequencies are halved periodically
+        for i in range(17):
+            policy.miss('bar')
+        assert 1 == policy.frequency('foo')
+        assert 7 == policy.frequency('bar')
+
+        # new values are only admitted if more frequent than the next victim
+        policy.insert('foo', 10)
+        assert policy.admit('bar', 10)
+        assert not policy.admit('baz', 10)
+        assert 'foo' == policy.evict()
+
+    def test_arc(self):
+        store = dict()
+        for i in range(20):
+            store['k{}'.format(i)] = b'x' * 10
+        cache = LRUStoreCache(store, max_size=50, policy='arc')
+        policy = cache._policy
+
+        # keys requested again are promoted to the frequency list
+        cache['k0']
+        assert 'k0' in policy._t1
+        cache['k0']
+        assert 'k0' in policy._t2 and 'k0' not in policy._t1
+
+        # recently used keys are evicted before frequently used keys
+        for i in range(1, 10):
+            cache['k{}'.format(i)]
+        assert 'k0' in cache._values_cache
+        assert 'k1' in policy._b1
+
+        # requests for keys in the recency ghost list enlarge the recency list
+        assert 0 == policy._p
+        cache['k1']
+        assert policy._p > 0
+        assert 'k1' in policy._t2
+        assert 50 >= cache._current_size
+
+        cache.invalidate()
+        assert 0 == cache._current_size
+        assert not policy._t1 and not policy._b1 and 0 == policy._p
+
+    def test_bypass(self):
+        store = CountingDict()
+        store['foo'] = b'xxx'
+        store['bar'] = b'yyy'
+        cache = LRUStoreCache(store, max_size=None)
+        assert b'xxx' == cache['foo']
+
+        with cache.bypass():
+            # cached values are returned
+            assert b'xxx' == cache['foo']
+            assert 1 == store.counter['__getitem__', 'foo']
+            # retrieved values are not cached
+            assert b'yyy' == cache['bar']
+            assert {'bar': b'yyy'} == cache.getitems(['bar'])
+            assert 'bar' not in cache._values_cache
+            # written values are not cached
+            cache['foo'] = b'zzz'
+            assert 'foo' not in cache._values_cache
+            with cache.bypass():
+                pass
+            assert cache._bypassing()
+        assert not cache._bypassing()
+        assert b'yyy' == cache['bar']
+        assert 'bar' in cache._values_cache
+
+        # other threads are not affected
+        with cache.bypass():
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                assert b'zzz' == executor.submit(cache.__getitem__, 'foo').result()
+        assert 'foo' in cache._values_cache
+
+        # sharded
+        cache = ShardedLRUStoreCache(store, max_size=None, nshards=4, policy='tinylfu')
+        with cache.bypass():
+            assert b'zzz' == cache['foo']
+        assert 0 == sum(len(shard._values_cache) for shard in cache._shards)
+        assert b'zzz' == cache['foo']
+        assert 1 == sum(len(shard._values_cache) for shard in cache._shards)
+
+    @pytest.mark.parametrize('policy', ['lru', 'tinylfu', 'arc'])
+    def test_pickle(self, policy):
+        cache = LRUStoreCache(dict(foo=b'xxx'), max_size=10, policy=policy)
+        assert b'xxx' == cache['foo']
+        cache2 = pickle.loads(pickle.dumps(cache))
+        assert b'xxx' == cache2['foo']
+        assert 1 == cache2.hits
+        assert type(cache._policy) == type(cache2._policy)
+
+
+class TestLRUChunkCache(object):
+
+    def test_cache_values(self):
+        store = dict()
+        cache = LRUChunkCache(max_size=2000)
+        assert cache.get(store, 'foo') is None
+        assert 1 == cache.misses
+
+        chunk = cache.put(store, 'foo', np.zeros(100, dtype='i8'))
+        assert not chunk.flags.writeable
+        assert 800 == cache.current_size
+        assert chunk is cache.get(store, 'foo')
+        assert 1 == cache.hits
+
+        # chunks are identified by store and key
+        assert cache.get(dict(), 'foo') is None
+        assert 2 == cache.misses
+
+        # least recently used chunks are evicted
+        cache.put(store, 'bar', np.zeros(100, dtype='i8'))
+        cache.get(store, 'foo')
+        cache.put(store, 'baz', np.zeros(100, dtype='i8'))
+        assert 2 == len(cache)
+        assert 1600 == cache.current_size
+        assert cache.get(store, 'bar') is None
+        assert cache.get(store, 'foo') is not None
+        assert cache.get(store, 'baz') is not None
+
+        # chunks larger than the cache are never cached
+        cache.put(store, 'qux', np.zeros(1000, dtype='i8'))
+        assert cache.get(store, 'qux') is None
+        assert 2 == len(cache)
+
+        # replacing a chunk
+        cache.put(store, 'foo', np.zeros(10, dtype='i8'))
+        assert 880 == cache.current_size
+
+    def test_invalidate(self):
+        store = dict()
+        cache = LRUChunkCache(max_size=None)
+        for key in 'foo', 'bar', 'baz':
+            cache.put(store, key, np.zeros(10, dtype='i8'))
+        cache.invalidate_chunks(store, ['foo', 'qux'])
+        assert 2 == len(cache)
+        assert 160 == cache.current_size
+        assert cache.get(store, 'foo') is None
+        cache.invalidate()
+        assert 0 == len(cache)
+        assert 0 == cache.current_size
+
+    def test_pickle(self):
+        cache = LRUChunkCache(max_size=1000)
+        cache.put(dict(), 'foo', np.zeros(10, dtype='i8'))
+        cache2 = pickle.loads(pickle.dumps(cache))
+        assert 1000 == cache2.max_size
+        assert 0 == len(cache2)
+
+
 def test_getsize():
     store = dict()
     store['foo'] = b'aaa'
@@ -1766,6 +2285,29 @@ def test_getsize():
     assert -1 == getsize(store)
 
 
+def test_getrange():
+    # stores without a getrange method retrieve the whole value
+    store = CountingDict()
+    store['foo'] = b'abcdefgh'
+    assert not hasattr(store, 'getrange')
+    assert b'bcd' == getrange(store, 'foo', 1, 3)
+    assert 1 == store.counter['__getitem__', 'foo']
+    assert [b'a', b'gh'] == getranges(store, [('foo', 0, 1), ('foo', 6, 2)])
+    assert 3 == store.counter['__getitem__', 'foo']
+    with pytest.raises(KeyError):
+        getrange(store, 'bar', 0, 1)
+
+
+def test_async_store_adapter():
+    for store in dict(), CountingDict():
+        adapter = AsyncStoreAdapter(store)
+        asyncio.run(adapter.setitems({'foo': b'aaa', 'bar': b'bbb'}))
+        assert b'aaa' == store['foo']
+        assert b'bbb' == store['bar']
+        result = asyncio.run(adapter.getitems(['foo', 'bar', 'baz']))
+        assert {'foo': b'aaa', 'bar': b'bbb'} == result
+
+
 def test_migrate_1to2():
     from zarr import meta_v1
 
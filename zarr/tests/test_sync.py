@@ -1,6 +1,7 @@
 import atexit
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import Pool as ProcessPool
 from multiprocessing import cpu_count
 from multiprocessing.pool import ThreadPool
@@ -133,6 +134,16 @@ class TestArrayWithThreadSynchronizer(TestArray, MixinArraySyncTests):
         assert '05b0663ffe1785f38d3a459dec17e57a18f254af' == z.hexdigest()
 
 
+class TestArrayWithThreadSynchronizerAndExecutor(TestArrayWithThreadSynchronizer):
+
+    executor = ThreadPoolExecutor(max_workers=4)
+
+    def create_array(self, read_only=False, **kwargs):
+        z = super().create_array(read_only=read_only, **kwargs)
+        z._executor = self.executor
+        return z
+
+
 class TestArrayWithProcessSynchronizer(TestArray, MixinArraySyncTests):
 
     def create_array(self, read_only=False, **kwargs):
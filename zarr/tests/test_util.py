@@ -1,14 +1,19 @@
 import re
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import numpy as np
 import pytest
+from numcodecs import Blosc
+from numpy.testing import assert_array_equal
 
-from zarr.util import (guess_chunks, human_readable_size, info_html_report,
-                       info_text_report, is_total_slice, normalize_chunks,
+from zarr.util import (PartialReadBuffer, all_equal, guess_chunks, human_readable_size,
+                       info_html_report, info_text_report, is_total_slice, normalize_axis,
+                       normalize_chunks,
                        normalize_dimension_separator,
                        normalize_fill_value, normalize_order,
                        normalize_resize_args, normalize_shape, retry_call,
+                       run_concurrently,
                        tree_array_icon, tree_group_icon, tree_get_icon,
                        tree_widget)
 
@@ -94,6 +99,36 @@ def test_normalize_resize_args():
         normalize_resize_args((100,), (200, 100))
 
 
+def test_normalize_axis():
+    assert (0, 1, 2) == normalize_axis(None, 3)
+    assert (1,) == normalize_axis(1, 3)
+    assert (2,) == normalize_axis(-1, 3)
+    assert (0, 2) == normalize_axis((2, 0), 3)
+    assert (0, 2) == normalize_axis([-3, -1], 3)
+    assert () == normalize_axis(None, 0)
+
+    with pytest.raises(ValueError):
+        normalize_axis(3, 3)
+    with pytest.raises(ValueError):
+        normalize_axis((0, -3), 3)
+    with pytest.raises(TypeError):
+        normalize_axis(1.0, 3)
+
+
+def test_all_equal():
+    assert all_equal(0, np.zeros(10, dtype='i4'))
+    assert not all_equal(0, np.arange(10))
+    assert all_equal(1.5, np.full((2, 3), 1.5))
+    assert not all_equal(1.5, np.array([1.5, 1.5, np.nan]))
+    assert all_equal(np.nan, np.full(10, np.nan, dtype='f4'))
+    assert not all_equal(np.nan, np.array([np.nan, 0]))
+    assert all_equal(False, np.zeros(5, dtype=bool))
+    assert all_equal(b'', np.zeros(5, dtype='S3'))
+    assert all_equal(np.datetime64('NaT'), np.full(3, np.datetime64('NaT')))
+    assert not all_equal(None, np.zeros(10))
+    assert not all_equal(0, np.zeros(10, dtype=object))
+
+
 def test_human_readable_size():
     assert '100' == human_readable_size(100)
     assert '1.0K' == human_readable_size(2**10)
@@ -211,3 +246,70 @@ def test_retry_call():
 
     for x in range(11, 15):
         pytest.raises(PermissionError, fail, x)
+
+
+def test_run_concurrently():
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert [5, 7, 9] == run_concurrently(executor, lambda x, y: x + y,
+                                             [1, 2, 3], [4, 5, 6])
+        assert [] == run_concurrently(executor, lambda x: x, [])
+
+        def fail(x):
+            if x == 2:
+                raise ValueError(x)
+            return x
+
+        with pytest.raises(ValueError):
+            run_concurrently(executor, fail, range(10))
+
+
+class RangeRecordingStore(dict):
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def getranges(self, ranges):
+        self.requests.append([(start, length) for _, start, length in ranges])
+        return [self[key][start:start + length] for key, start, length in ranges]
+
+
+def test_partial_read_buffer():
+    a = np.arange(10000, dtype='i4')
+    store = RangeRecordingStore()
+    store['0'] = Blosc(cname='zstd', clevel=1, shuffle=0, blocksize=4000).encode(a)
+
+    def decode_partial(buff, start, nitems):
+        return np.frombuffer(Blosc().decode_partial(buff.buff, start, nitems), dtype='i4')
+
+    buff = PartialReadBuffer('0', store, max_gap=0)
+    buff.prepare_chunk()
+    assert 10 == buff.nblocks
+    assert 1000 == buff.n_per_block
+    # header and block offsets
+    assert [[(0, 16)], [(16, 40)]] == store.requests
+    store.requests.clear()
+
+    # blocks for all parts retrieved in one request, adjacent blocks merged
+    buff.read_parts([(10, 20), (2500, 1000), (8000, 5)])
+    assert 1 == len(store.requests)
+    assert 3 == len(store.requests[0])
+    assert [0, 2, 3, 8] == list(np.nonzero(buff.read_blocks)[0])
+    assert_array_equal(a[2500:3500], decode_partial(buff, 2500, 1000))
+
+    # blocks already retrieved are not requested again
+    store.requests.clear()
+    buff.read_parts([(0, 1000), (2000, 10)])
+    assert [] == store.requests
+    buff.read_part(1500, 10)
+    assert 1 == len(store.requests)
+    assert_array_equal(a[1500:1510], decode_partial(buff, 1500, 10))
+
+    # ranges separated by small gaps are merged
+    buff = PartialReadBuffer('0', store)
+    buff.prepare_chunk()
+    store.requests.clear()
+    buff.read_parts([(0, 10), (9000, 10)])
+    assert 1 == len(store.requests[0])
+    assert_array_equal(a[9000:9010], decode_partial(buff, 9000, 10))
@@ -40,6 +40,22 @@ class CountingDict(MutableMapping):
         del self.wrapped[key]
 
 
+class GetitemsCountingDict(CountingDict):
+    """As CountingDict, also providing batched ``getitems`` and ``setitems``."""
+
+    def getitems(self, keys, on_error='omit'):
+        self.counter['getitems'] += 1
+        for key in keys:
+            self.counter['getitems', key] += 1
+        return {key: self.wrapped[key] for key in keys if key in self.wrapped}
+
+    def setitems(self, values):
+        self.counter['setitems'] += 1
+        for key, value in values.items():
+            self.counter['setitems', key] += 1
+            self.wrapped[key] = value
+
+
 def skip_test_env_var(name):
     """ Checks for environment variables indicating whether tests requiring services should be run
     """
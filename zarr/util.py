@@ -200,6 +200,20 @@ def is_total_slice(item, shape: Tuple[int]) -> bool:
         raise TypeError('expected slice or tuple of slices, found %r' % item)
 
 
+def all_equal(value, array) -> bool:
+    """Test whether all items of `array` equal `value`, where NaN values are
+    considered equal. Always False if `value` is None or for object arrays."""
+
+    if value is None or array.dtype == object:
+        return False
+    if array.dtype.kind in 'biufc' and not value:
+        # fast path, test for zeros
+        return not np.any(array)
+    if array.dtype.kind in 'fcmM' and np.isnan(value):
+        return bool(np.all(np.isnan(array)))
+    return bool(np.all(array == value))
+
+
 def normalize_resize_args(old_shape, *args):
 
     # normalize new shape argument
@@ -221,6 +235,28 @@ def normalize_resize_args(old_shape, *args):
     return new_shape
 
 
+def normalize_axis(axis, ndim: int) -> Tuple[int, ...]:
+    """Normalize an axis argument, as accepted by numpy reductions, to a sorted tuple
+    of nonnegative integers."""
+
+    if axis is None:
+        return tuple(range(ndim))
+    if isinstance(axis, numbers.Integral):
+        axis = (axis,)
+    normalized = []
+    for a in axis:
+        if not isinstance(a, numbers.Integral):
+            raise TypeError('axis must be an integer or tuple of integers; found {!r}'
+                            .format(a))
+        if not -ndim <= a < ndim:
+            raise ValueError('axis {} is out of bounds for array of dimension {}'
+                             .format(a, ndim))
+        normalized.append(int(a) % ndim)
+    if len(set(normalized)) != len(normalized):
+        raise ValueError('repeated axis')
+    return tuple(sorted(normalized))
+
+
 def human_readable_size(size) -> str:
     if size < 2**10:
         return '%s' % size
@@ -547,85 +583,112 @@ nolock = NoLock()
 
 
 class PartialReadBuffer:
-    def __init__(self, store_key, chunk_store):
+    """Buffer for a Blosc compressed chunk which is filled by reading byte ranges from
+    the store on demand, so that only the blocks required to decode part of the
+    chunk are retrieved. Works with any store, see :func:`zarr.storage.getrange`.
+
+    Parameters
+    ----------
+    store_key : str
+        Key of the chunk.
+    chunk_store : MutableMapping
+        Store holding the chunk.
+    max_gap : int, optional
+        Byte ranges of blocks which are separated by at most this many bytes are
+        merged and retrieved as a single range, trading the retrieval of unneeded
+        bytes for fewer requests to the store.
+
+    """
+
+    def __init__(self, store_key, chunk_store, max_gap=2**16):
         self.chunk_store = chunk_store
-        # is it fsstore or an actual fsspec map object
-        assert hasattr(self.chunk_store, "map")
-        self.map = self.chunk_store.map
-        self.fs = self.chunk_store.fs
         self.store_key = store_key
+        self.max_gap = max_gap
         self.buff = None
         self.nblocks = None
         self.start_points = None
+        self.end_points = None
         self.n_per_block = None
-        self.start_points_max = None
-        self.read_blocks = set()
+        self.read_blocks = None
 
-        _key_path = self.map._key_to_str(store_key)
-        _key_path = _key_path.split('/')
-        _chunk_path = [self.chunk_store._normalize_key(_key_path[-1])]
-        _key_path = '/'.join(_key_path[:-1] + _chunk_path)
-        self.key_path = _key_path
+    def _getranges(self, ranges):
+        # N.B., imported here to avoid circular import
+        from zarr.storage import getranges
+        return getranges(self.chunk_store,
+                         [(self.store_key, int(start), int(length))
+                          for start, length in ranges])
 
     def prepare_chunk(self):
         assert self.buff is None
-        header = self.fs.read_block(self.key_path, 0, 16)
+        header, = self._getranges([(0, 16)])
         nbytes, self.cbytes, blocksize = cbuffer_sizes(header)
         typesize, _shuffle, _memcpyd = cbuffer_metainfo(header)
         self.buff = mmap.mmap(-1, self.cbytes)
         self.buff[0:16] = header
-        self.nblocks = nbytes / blocksize
-        self.nblocks = (
-            int(self.nblocks)
-            if self.nblocks == int(self.nblocks)
-            else int(self.nblocks + 1)
-        )
+        self.nblocks = nbytes // blocksize + (1 if nbytes % blocksize else 0)
         if self.nblocks == 1:
             self.buff = self.read_full()
             return
-        start_points_buffer = self.fs.read_block(
-            self.key_path, 16, int(self.nblocks * 4)
-        )
+        start_points_buffer, = self._getranges([(16, self.nblocks * 4)])
         self.start_points = np.frombuffer(
             start_points_buffer, count=self.nblocks, dtype=np.int32
-        )
-        self.start_points_max = self.start_points.max()
+        ).astype(np.int64)
+        # blocks need not be laid out in order, each block ends where the block
+        # following it in the buffer starts
+        order = np.argsort(self.start_points)
+        self.end_points = np.empty_like(self.start_points)
+        self.end_points[order] = np.append(self.start_points[order][1:], self.cbytes)
         self.buff[16: (16 + (self.nblocks * 4))] = start_points_buffer
-        self.n_per_block = blocksize / typesize
+        self.n_per_block = blocksize // typesize
+        self.read_blocks = np.zeros(self.nblocks, dtype=bool)
 
     def read_part(self, start, nitems):
+        self.read_parts([(start, nitems)])
+
+    def read_parts(self, parts):
+        """Retrieve all blocks required to decode `parts`, given as a sequence of
+        ``(start, nitems)`` tuples, which have not been retrieved yet."""
         assert self.buff is not None
         if self.nblocks == 1:
             return
-        blocks_to_decompress = nitems / self.n_per_block
-        blocks_to_decompress = (
-            blocks_to_decompress
-            if blocks_to_decompress == int(blocks_to_decompress)
-            else int(blocks_to_decompress + 1)
-        )
-        start_block = int(start / self.n_per_block)
-        wanted_decompressed = 0
-        while wanted_decompressed < nitems:
-            if start_block not in self.read_blocks:
-                start_byte = self.start_points[start_block]
-                if start_byte == self.start_points_max:
-                    stop_byte = self.cbytes
-                else:
-                    stop_byte = self.start_points[self.start_points > start_byte].min()
-                length = stop_byte - start_byte
-                data_buff = self.fs.read_block(self.key_path, start_byte, length)
-                self.buff[start_byte:stop_byte] = data_buff
-                self.read_blocks.add(start_block)
-            if wanted_decompressed == 0:
-                wanted_decompressed += ((start_block + 1) * self.n_per_block) - start
-            else:
-                wanted_decompressed += self.n_per_block
-            start_block += 1
+        wanted = np.zeros(self.nblocks, dtype=bool)
+        for start, nitems in parts:
+            if nitems > 0:
+                stop = start + nitems - 1
+                wanted[start // self.n_per_block:stop // self.n_per_block + 1] = True
+        blocks = np.nonzero(wanted & ~self.read_blocks)[0]
+        if len(blocks) == 0:
+            return
+        # merge byte ranges of blocks which lie close together in the buffer
+        starts = np.sort(self.start_points[blocks])
+        ends = np.sort(self.end_points[blocks])
+        breaks = np.nonzero(starts[1:] - ends[:-1] > self.max_gap)[0] + 1
+        range_starts = starts[np.r_[0, breaks]]
+        range_ends = ends[np.r_[breaks - 1, len(ends) - 1]]
+        ranges = list(zip(range_starts, range_ends - range_starts))
+        # retrieve all ranges together
+        for (start_byte, length), data_buff in zip(ranges, self._getranges(ranges)):
+            self.buff[start_byte:start_byte + length] = data_buff
+        self.read_blocks[blocks] = True
 
     def read_full(self):
         return self.chunk_store[self.store_key]
 
 
+def run_concurrently(executor, fn, *iterables):
+    """Call `fn` with arguments taken from each of `iterables`, using `executor` to
+    make the calls concurrently, and wait for all calls to complete. If any call
+    raises an exception, calls which have not yet started are cancelled and the
+    exception is re-raised."""
+    futures = [executor.submit(fn, *args) for args in zip(*iterables)]
+    try:
+        return [f.result() for f in futures]
+    except BaseException:
+        for f in futures:
+            f.cancel()
+        raise
+
+
 def retry_call(callabl: Callable,
                args=None,
                kwargs=None,